@@ -15,9 +15,13 @@ from fastapi.staticfiles import StaticFiles
 from app.routers.arena import router as arena_router
 from app.routers.game import router as game_router
 from app.routers.websocket import router as ws_router
+from app.services.broadcaster import Broadcaster
+from app.services.cluster import NatsClusterBus
 from app.services.gm_client import GMClient
+from app.services.image_cache import ImageCache
 from app.services.nats_relay import NatsRelay
 from app.services.session_manager import SessionManager
+from app.services.session_store import NatsKVSessionStore
 
 load_dotenv()
 
@@ -30,8 +34,14 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    app.state.session_manager = SessionManager()
-    logger.info("SessionManager initialized (in-memory)")
+    broadcaster = Broadcaster(
+        max_queue=int(os.getenv("WS_SEND_QUEUE_SIZE", "256")),
+        slow_client_policy=os.getenv("WS_SLOW_CLIENT_POLICY", "disconnect"),
+        replay_size=int(os.getenv("WS_REPLAY_SIZE", "256")),
+        replay_sessions=int(os.getenv("WS_REPLAY_SESSIONS", "256")),
+        linger_s=float(os.getenv("WS_SESSION_LINGER_S", "30")),
+    )
+    app.state.broadcaster = broadcaster
 
     # GM Client
     gm_url = os.getenv("GM_BASE_URL", "https://gm-mistralski.wh26.edouard.cl")
@@ -39,15 +49,40 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.state.gm_client = gm_client
     logger.info("GMClient initialized with base_url=%s", gm_url)
 
+    image_cache_mb = int(os.getenv("IMAGE_CACHE_MB", "32"))
+    app.state.image_cache = ImageCache(max_bytes=image_cache_mb * 1024 * 1024)
+
     # NATS
     nats_url = os.getenv("NATS_URL", "nats://demo.nats.io:4222")
-    nats_relay = NatsRelay(nats_url)
+    nats_relay = NatsRelay(nats_url, broadcaster, queue_group=os.getenv("NATS_QUEUE_GROUP", ""))
     try:
         await nats_relay.connect()
     except Exception:
         logger.exception("Failed to connect to NATS at %s — app running without NATS", nats_url)
     app.state.nats_relay = nats_relay
 
+    # Sessions: in-memory (single replica) or NATS KV + cross-replica fan-out
+    session_manager = SessionManager(broadcaster)
+    if os.getenv("SESSION_STORE", "memory") == "nats":
+        try:
+            store = await NatsKVSessionStore.open(
+                nats_relay.client,
+                os.getenv("SESSION_KV_BUCKET", "relay_sessions"),
+                ttl_s=float(os.getenv("SESSION_TTL_S", "86400")),
+            )
+        except Exception:
+            logger.exception("NATS session store unavailable — falling back to in-memory sessions")
+        else:
+            session_manager = SessionManager(broadcaster, store=store)
+            bus = NatsClusterBus(nats_relay.client, broadcaster, session_manager.cancel_local_task)
+            await bus.start()
+            nats_relay.add_reconnect_hook(bus.resubscribe)
+            session_manager.bus = bus
+            logger.info("SessionManager initialized (NATS KV, cluster fan-out)")
+    else:
+        logger.info("SessionManager initialized (in-memory)")
+    app.state.session_manager = session_manager
+
     yield
 
     await app.state.gm_client.close()
@@ -91,9 +126,11 @@ async def health(request: Request) -> dict:
     nats_connected = nats_relay.is_connected if nats_relay else False
     gm_client = getattr(request.app.state, "gm_client", None)
     gm_ready = gm_client.is_ready if gm_client else False
+    broadcaster = getattr(request.app.state, "broadcaster", None)
     return {
         "status": "ok",
         "service": "bmadlife-backend",
         "nats_connected": nats_connected,
         "gm_client_ready": gm_ready,
+        "websockets": broadcaster.stats() if broadcaster else None,
     }
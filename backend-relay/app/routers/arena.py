@@ -47,7 +47,7 @@ async def init_session(body: InitSessionInput, request: Request) -> JSONResponse
 async def submit_news(body: SubmitNewsInput, request: Request) -> JSONResponse:
     session_manager = request.app.state.session_manager
 
-    if not session_manager.session_exists(body.session_id):
+    if not await session_manager.session_exists(body.session_id):
         return JSONResponse(
             status_code=404,
             content={"error": "Session not found"},
@@ -1,14 +1,20 @@
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from app.services.gm_client import GMClient
+from app.services.image_cache import CachedImage, ImageCache
 from app.services.session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 
+_FORWARDED_IMAGE_HEADERS = (
+    "etag", "content-length", "content-encoding", "cache-control", "last-modified",
+)
+
 router = APIRouter(prefix="/api")
 
 
@@ -21,13 +27,15 @@ def _get_sm(request: Request) -> SessionManager:
 
 
 @router.get("/start")
-async def start_game(request: Request, lang: str = "fr") -> JSONResponse:
+async def start_game(
+    request: Request, lang: str = "fr", session_id: str | None = None
+) -> JSONResponse:
     gm = _get_gm(request)
     sm = _get_sm(request)
     nats_relay = request.app.state.nats_relay
 
     try:
-        result = await gm.start_game(lang)
+        result = await gm.start_game(lang, session_id)
     except Exception:
         logger.exception("Failed to call GM /api/start")
         return JSONResponse(status_code=502, content={"error": "GM unreachable"})
@@ -36,8 +44,7 @@ async def start_game(request: Request, lang: str = "fr") -> JSONResponse:
     gm_session_id = result.get("session_id")
     if gm_session_id:
         try:
-            session = await sm.create_session(gm_session_id, lang=lang)
-            session.gm_session_id = gm_session_id
+            await sm.create_session(gm_session_id, lang=lang, gm_session_id=gm_session_id)
         except FileExistsError:
             pass  # Session already exists, that's fine
 
@@ -53,10 +60,13 @@ async def start_game(request: Request, lang: str = "fr") -> JSONResponse:
 
 
 @router.get("/state")
-async def get_state(request: Request) -> JSONResponse:
+async def get_state(request: Request, session_id: str) -> JSONResponse:
     gm = _get_gm(request)
+    sm = _get_sm(request)
+    session = await sm.get_session(session_id)
+    gm_session_id = (session.gm_session_id if session else None) or session_id
     try:
-        result = await gm.get_state()
+        result = await gm.get_state(gm_session_id)
     except Exception:
         logger.exception("Failed to call GM /api/state")
         return JSONResponse(status_code=502, content={"error": "GM unreachable"})
@@ -68,11 +78,13 @@ async def propose(request: Request, session_id: str, lang: str = "fr") -> JSONRe
     gm = _get_gm(request)
     sm = _get_sm(request)
 
-    if not sm.session_exists(session_id):
+    session = await sm.get_session(session_id)
+    if session is None:
         return JSONResponse(status_code=404, content={"error": "Session not found"})
 
-    # Cancel any running task for this session
-    sm.cancel_active_task(session_id)
+    # Cancel any running task for this session (on any replica)
+    await sm.cancel_active_task(session_id)
+    gm_session_id = session.gm_session_id or session_id
 
     async def _stream_propose() -> None:
         try:
@@ -80,7 +92,7 @@ async def propose(request: Request, session_id: str, lang: str = "fr") -> JSONRe
                 event_type = event.get("type", "unknown")
                 await sm.broadcast(session_id, f"gm.{event_type}", event)
 
-            await gm.stream_propose(lang, on_event)
+            await gm.stream_propose(gm_session_id, lang, on_event)
         except asyncio.CancelledError:
             logger.info("Propose task cancelled for session %s", session_id)
         except Exception:
@@ -98,11 +110,13 @@ async def choose(request: Request, session_id: str, kind: str, lang: str = "fr")
     gm = _get_gm(request)
     sm = _get_sm(request)
 
-    if not sm.session_exists(session_id):
+    session = await sm.get_session(session_id)
+    if session is None:
         return JSONResponse(status_code=404, content={"error": "Session not found"})
 
-    # Cancel any running task for this session
-    sm.cancel_active_task(session_id)
+    # Cancel any running task for this session (on any replica)
+    await sm.cancel_active_task(session_id)
+    gm_session_id = session.gm_session_id or session_id
 
     async def _stream_choose() -> None:
         try:
@@ -110,7 +124,7 @@ async def choose(request: Request, session_id: str, kind: str, lang: str = "fr")
                 event_type = event.get("type", "unknown")
                 await sm.broadcast(session_id, f"gm.{event_type}", event)
 
-            await gm.stream_choose(kind, lang, on_event)
+            await gm.stream_choose(gm_session_id, kind, lang, on_event)
         except asyncio.CancelledError:
             logger.info("Choose task cancelled for session %s", session_id)
         except Exception:
@@ -125,11 +139,48 @@ async def choose(request: Request, session_id: str, kind: str, lang: str = "fr")
 
 @router.get("/images/{gm_session_id}/{filename:path}")
 async def proxy_image(request: Request, gm_session_id: str, filename: str) -> Response:
+    """Stream an image from the GM, serving hot images from the relay's LRU."""
     gm = _get_gm(request)
+    cache: ImageCache = request.app.state.image_cache
+    path = f"{gm_session_id}/{filename}"
+    if_none_match = request.headers.get("if-none-match")
+
+    cached = cache.get(path)
+    if cached is not None:
+        if cached.etag and if_none_match == cached.etag:
+            return Response(status_code=304, headers=cached.headers)
+        return Response(content=cached.content, media_type=cached.media_type, headers=cached.headers)
+
     try:
-        resp = await gm.get_image(f"{gm_session_id}/{filename}")
-        content_type = resp.headers.get("content-type", "image/png")
-        return Response(content=resp.content, media_type=content_type)
+        resp = await gm.open_image(path, if_none_match)
     except Exception:
-        logger.exception("Failed to proxy image %s/%s", gm_session_id, filename)
+        logger.exception("Failed to proxy image %s", path)
         return JSONResponse(status_code=502, content={"error": "Image fetch failed"})
+
+    headers = {
+        name: resp.headers[name]
+        for name in _FORWARDED_IMAGE_HEADERS
+        if name in resp.headers
+    }
+    if resp.status_code == 304:
+        await resp.aclose()
+        return Response(status_code=304, headers=headers)
+
+    media_type = resp.headers.get("content-type", "image/png")
+    length = resp.headers.get("content-length", "")
+    size = int(length) if length.isdigit() else None
+    keep = cache.accepts(size) and "content-encoding" not in headers
+
+    async def _forward() -> AsyncIterator[bytes]:
+        chunks: list[bytes] = []
+        try:
+            async for chunk in resp.aiter_raw():
+                if keep:
+                    chunks.append(chunk)
+                yield chunk
+        finally:
+            await resp.aclose()
+        if keep and sum(map(len, chunks)) == size:
+            cache.put(path, CachedImage(b"".join(chunks), media_type, headers))
+
+    return StreamingResponse(_forward(), media_type=media_type, headers=headers)
@@ -8,20 +8,26 @@ router = APIRouter()
 
 
 @router.websocket("/ws/{session_id}")
-async def websocket_arena(websocket: WebSocket, session_id: str) -> None:
+async def websocket_arena(
+    websocket: WebSocket,
+    session_id: str,
+    last_offset: int | None = None,
+    epoch: str | None = None,
+) -> None:
     await websocket.accept()
 
-    nats_relay = websocket.app.state.nats_relay
     session_manager = websocket.app.state.session_manager
+    broadcaster = websocket.app.state.broadcaster
 
-    # Register in both systems
-    await nats_relay.register_client(session_id, websocket)
-    await session_manager.register_ws(session_id, websocket)
+    # One registration serves both gm.* (SSE) and arena.* (NATS) events
+    await session_manager.get_or_create_session(session_id)
+    # last_offset + epoch: resume after a reconnect, replaying the frames missed since
+    await broadcaster.register(session_id, websocket, last_offset=last_offset, epoch=epoch)
 
     try:
         while True:
             await websocket.receive_text()
     except WebSocketDisconnect:
-        await nats_relay.unregister_client(session_id, websocket)
-        await session_manager.unregister_ws(session_id, websocket)
         logger.info("WebSocket disconnected for session %s", session_id)
+    finally:
+        await broadcaster.unregister(session_id, websocket)
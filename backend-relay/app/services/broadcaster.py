@@ -0,0 +1,302 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+
+from fastapi import WebSocket
+
+from app.services.envelope import encode_envelope
+
+logger = logging.getLogger(__name__)
+
+SessionHook = Callable[[str], Awaitable[None]]
+
+# WebSocket close code for clients dropped for not keeping up ("try again later")
+SLOW_CLIENT_CLOSE_CODE = 1013
+
+
+class ClientConnection:
+    """One WebSocket with a bounded outgoing queue drained by its own writer task."""
+
+    def __init__(
+        self,
+        session_id: str,
+        ws: WebSocket,
+        max_queue: int,
+        on_writer_exit: Callable[["ClientConnection"], None],
+    ) -> None:
+        self.session_id = session_id
+        self.ws = ws
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.closed = False
+        self._on_writer_exit = on_writer_exit
+        self._writer = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        try:
+            while True:
+                frame = await self.queue.get()
+                await self.ws.send_text(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("WebSocket send failed in session %s, removing client", self.session_id)
+        finally:
+            self.closed = True
+            self._on_writer_exit(self)
+
+    def offer(self, frame: str) -> bool:
+        """Queue a frame without waiting; False if the queue is full."""
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+        return True
+
+    async def close(self, code: int | None = None) -> None:
+        self.closed = True
+        self._writer.cancel()
+        await asyncio.gather(self._writer, return_exceptions=True)
+        if code is not None:
+            try:
+                await self.ws.close(code=code)
+            except Exception:
+                pass
+
+
+class SessionLog:
+    """Ring buffer of a session's recent frames, each tagged with its offset.
+
+    Offsets only mean something within one log: a log started by another
+    replica, a previous process, or after this one was evicted counts from 1
+    again. Each log therefore has a random `epoch`, stamped next to the
+    offset, and a resume point from another epoch is never replayed.
+    """
+
+    __slots__ = ("next_offset", "frames", "epoch", "_prefix")
+
+    def __init__(self, size: int) -> None:
+        self.next_offset = 1
+        self.frames: deque[tuple[int, str]] = deque(maxlen=size)
+        self.epoch = uuid.uuid4().hex[:12]
+        self._prefix = f',"epoch":"{self.epoch}",'
+
+    @property
+    def latest(self) -> int:
+        return self.next_offset - 1
+
+    def append(self, frame: str) -> str:
+        """Stamp `frame`, a JSON object, with the next offset, keep it, and return it."""
+        if not frame.startswith("{"):
+            raise ValueError(f"Cannot stamp a frame that is not a JSON object: {frame[:40]!r}")
+        offset = self.next_offset
+        self.next_offset += 1
+        body = frame[1:]
+        if body.lstrip().startswith("}"):  # empty object: no member to separate
+            stamped = f'{{"offset":{offset}{self._prefix[:-1]}{body}'
+        else:
+            stamped = f'{{"offset":{offset}{self._prefix}{body}'
+        self.frames.append((offset, stamped))
+        return stamped
+
+    def since(self, last_offset: int, epoch: str | None) -> list[str] | None:
+        """Frames after `last_offset`, or None if that point is no longer buffered.
+
+        Offset 0 (nothing seen yet) is valid in any epoch.
+        """
+        if last_offset and epoch != self.epoch:
+            return None  # offset from another replica, process or log
+        if last_offset > self.latest:
+            return None
+        oldest = self.frames[0][0] if self.frames else self.next_offset
+        if last_offset + 1 < oldest:
+            return None
+        return [frame for offset, frame in self.frames if offset > last_offset]
+
+
+class Broadcaster:
+    """The relay's single registry of WebSocket clients, grouped by session.
+
+    Both the NATS path and the GM SSE path publish pre-encoded frames here.
+    Frames are queued per client and never awaited on the publish path. A
+    client whose queue is full is a laggard: with policy "disconnect" it is
+    closed (code 1013) so it can reconnect and resync; with policy "drop" the
+    frame is skipped for that client only. Clients whose writer fails are
+    removed immediately.
+
+    With `replay_size`, every frame is stamped with a per-session offset and
+    epoch, and the last `replay_size` frames are kept (for up to
+    `replay_sessions` sessions, least recently active dropped first). A
+    client registering with `last_offset` and `epoch` first receives the
+    frames it missed, or a `relay.resync` event when they are no longer
+    buffered or the epoch is not the session's current one. Session close
+    hooks wait `linger_s` so a quick reconnect keeps its subscriptions and
+    its replay stays complete.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 256,
+        slow_client_policy: str = "disconnect",
+        replay_size: int = 256,
+        replay_sessions: int = 256,
+        linger_s: float = 30.0,
+    ) -> None:
+        if slow_client_policy not in ("disconnect", "drop"):
+            raise ValueError(f"Unknown slow client policy: {slow_client_policy}")
+        self._max_queue = max_queue
+        self._policy = slow_client_policy
+        self._replay_size = replay_size
+        self._replay_sessions = replay_sessions
+        self._linger_s = linger_s
+        self._logs: OrderedDict[str, SessionLog] = OrderedDict()
+        self._sessions: dict[str, dict[WebSocket, ClientConnection]] = {}
+        self._dropped_frames = 0
+        self._disconnected = 0
+        self._on_open: list[SessionHook] = []
+        self._on_close: list[SessionHook] = []
+        self._tasks: set[asyncio.Task[None]] = set()  # the loop only keeps weak references
+
+    def add_session_hooks(self, on_open: SessionHook, on_close: SessionHook) -> None:
+        """Be told when a session gets its first client and loses its last one.
+
+        on_close runs in a background task, so by the time it runs the
+        session may have clients again; hooks should check has_clients().
+        """
+        self._on_open.append(on_open)
+        self._on_close.append(on_close)
+
+    def session_ids(self) -> list[str]:
+        return list(self._sessions)
+
+    def has_clients(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def client_count(self, session_id: str) -> int:
+        return len(self._sessions.get(session_id, ()))
+
+    async def register(
+        self,
+        session_id: str,
+        ws: WebSocket,
+        last_offset: int | None = None,
+        epoch: str | None = None,
+    ) -> ClientConnection:
+        is_new_session = session_id not in self._sessions
+        clients = self._sessions.setdefault(session_id, {})
+        conn = clients.get(ws)
+        if conn is None:
+            conn = clients[ws] = ClientConnection(session_id, ws, self._max_queue, self._forget)
+            if last_offset is not None:
+                self._replay(conn, last_offset, epoch)  # before any await: no frame lost or doubled
+        logger.info("WS registered for session %s (total: %d)", session_id, len(clients))
+        if is_new_session:
+            for hook in self._on_open:
+                try:
+                    await hook(session_id)
+                except Exception:
+                    logger.exception("Session open hook failed for %s", session_id)
+        return conn
+
+    async def unregister(self, session_id: str, ws: WebSocket) -> None:
+        conn = self._sessions.get(session_id, {}).get(ws)
+        if conn is None:
+            return
+        self._forget(conn)
+        await conn.close()
+        logger.info("WS unregistered from session %s (remaining: %d)", session_id, self.client_count(session_id))
+
+    def _forget(self, conn: ClientConnection) -> None:
+        clients = self._sessions.get(conn.session_id)
+        if clients is None or clients.get(conn.ws) is not conn:
+            return
+        del clients[conn.ws]
+        self._dropped_frames += conn.dropped
+        conn.dropped = 0
+        if not clients:
+            del self._sessions[conn.session_id]
+            for hook in self._on_close:
+                self._spawn(self._run_close_hook(hook, conn.session_id))
+
+    def _replay(self, conn: ClientConnection, last_offset: int, epoch: str | None) -> None:
+        log = self._logs.get(conn.session_id)
+        latest = log.latest if log else 0
+        current_epoch = log.epoch if log else None
+        missing = log.since(last_offset, epoch) if log else ([] if last_offset == 0 else None)
+        if missing is None or len(missing) > self._max_queue:
+            conn.offer(encode_envelope("relay.resync", {"offset": latest, "epoch": current_epoch}))
+            logger.info(
+                "WS in session %s must resync (last_offset=%d, epoch=%s, latest=%d, current epoch=%s)",
+                conn.session_id,
+                last_offset,
+                epoch,
+                latest,
+                current_epoch,
+            )
+            return
+        for frame in missing:
+            conn.offer(frame)
+
+    def _log(self, session_id: str) -> SessionLog:
+        log = self._logs.get(session_id)
+        if log is None:
+            log = self._logs[session_id] = SessionLog(self._replay_size)
+            if len(self._logs) > self._replay_sessions:
+                self._logs.popitem(last=False)
+        else:
+            self._logs.move_to_end(session_id)
+        return log
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_close_hook(self, hook: SessionHook, session_id: str) -> None:
+        if self._linger_s > 0:
+            await asyncio.sleep(self._linger_s)
+        try:
+            await hook(session_id)
+        except Exception:
+            logger.exception("Session close hook failed for %s", session_id)
+
+    def publish(self, session_id: str, frame: str) -> int:
+        """Queue one pre-encoded frame for every client of a session.
+
+        Returns the number of clients the frame was queued for. With
+        `replay_size`, the frame must be a JSON object (ValueError otherwise).
+        """
+        if self._replay_size > 0:
+            frame = self._log(session_id).append(frame)
+        clients = self._sessions.get(session_id)
+        if not clients:
+            return 0
+        sent = 0
+        for conn in list(clients.values()):
+            if conn.offer(frame):
+                sent += 1
+            elif self._policy == "disconnect":
+                self._disconnected += 1
+                logger.warning(
+                    "Disconnecting slow WebSocket client in session %s (%d frames queued)",
+                    session_id,
+                    conn.queue.qsize(),
+                )
+                self._forget(conn)
+                self._spawn(conn.close(code=SLOW_CLIENT_CLOSE_CODE))
+        return sent
+
+    def stats(self) -> dict:
+        conns = [c for clients in self._sessions.values() for c in clients.values()]
+        return {
+            "sessions": len(self._sessions),
+            "clients": len(conns),
+            "queued_frames": sum(c.queue.qsize() for c in conns),
+            "dropped_frames": self._dropped_frames + sum(c.dropped for c in conns),
+            "slow_clients_disconnected": self._disconnected,
+            "replay_sessions": len(self._logs),
+        }
@@ -0,0 +1,132 @@
+"""Cross-replica fan-out: gm.* frames and stream cancellations between relays.
+
+Each replica delivers a frame to its own sockets first, then publishes it on
+the bus so the replicas holding the session's other sockets deliver it too.
+Messages carry the origin replica id so a replica ignores its own echoes.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Protocol
+
+from nats.aio.client import Client as NatsClient
+from nats.aio.msg import Msg
+from nats.aio.subscription import Subscription
+
+from app.services.broadcaster import Broadcaster
+
+logger = logging.getLogger(__name__)
+
+ORIGIN_HEADER = "Relay-Origin"
+
+CancelHandler = Callable[[str], Awaitable[None]]
+
+
+class ClusterBus(Protocol):
+    async def publish_frame(self, session_id: str, frame: str) -> None: ...
+
+    async def publish_cancel(self, session_id: str) -> None: ...
+
+
+class InProcessHub:
+    """Stand-in for NATS in tests: several replicas living in one process."""
+
+    def __init__(self) -> None:
+        self.members: list["InProcessClusterBus"] = []
+
+    def join(self, broadcaster: Broadcaster, on_cancel: CancelHandler) -> "InProcessClusterBus":
+        bus = InProcessClusterBus(self, broadcaster, on_cancel)
+        self.members.append(bus)
+        return bus
+
+
+class InProcessClusterBus:
+    def __init__(self, hub: InProcessHub, broadcaster: Broadcaster, on_cancel: CancelHandler) -> None:
+        self._hub = hub
+        self._broadcaster = broadcaster
+        self._on_cancel = on_cancel
+
+    async def publish_frame(self, session_id: str, frame: str) -> None:
+        for member in self._hub.members:
+            if member is not self:
+                member._broadcaster.publish(session_id, frame)
+
+    async def publish_cancel(self, session_id: str) -> None:
+        for member in self._hub.members:
+            if member is not self:
+                await member._on_cancel(session_id)
+
+
+class NatsClusterBus:
+    """Replicas exchange frames on relay.<sid>.events and cancels on relay.<sid>.cancel.
+
+    Events are subscribed per session, only while this replica holds sockets
+    for it. Cancels are subscribed for all sessions: the replica running a
+    stream may hold no socket for its session.
+    """
+
+    def __init__(self, nc: NatsClient, broadcaster: Broadcaster, on_cancel: CancelHandler) -> None:
+        self._nc = nc
+        self._broadcaster = broadcaster
+        self._on_cancel = on_cancel
+        self._replica_id = uuid.uuid4().hex
+        self._headers = {ORIGIN_HEADER: self._replica_id}
+        self._subs: dict[str, Subscription] = {}
+        self._subs_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        await self._nc.subscribe("relay.*.cancel", cb=self._cancel_handler)
+        broadcaster = self._broadcaster
+        broadcaster.add_session_hooks(self._subscribe_session, self._unsubscribe_session)
+        await self.resubscribe()
+        logger.info("Cluster fan-out enabled (replica %s)", self._replica_id)
+
+    async def resubscribe(self) -> None:
+        """Subscribe the events of local sessions opened while NATS was down."""
+        for session_id in self._broadcaster.session_ids():
+            if session_id not in self._subs:
+                await self._subscribe_session(session_id)
+
+    async def _subscribe_session(self, session_id: str) -> None:
+        async with self._subs_lock:
+            if session_id in self._subs or not self._nc.is_connected:
+                return
+            self._subs[session_id] = await self._nc.subscribe(
+                f"relay.{session_id}.events", cb=self._frame_handler
+            )
+
+    async def _unsubscribe_session(self, session_id: str) -> None:
+        async with self._subs_lock:
+            if self._broadcaster.has_clients(session_id):
+                return
+            sub = self._subs.pop(session_id, None)
+            if sub is None:
+                return
+            try:
+                await sub.unsubscribe()
+            except Exception:
+                logger.warning("Failed to unsubscribe from relay.%s.events", session_id)
+
+    def _is_own(self, msg: Msg) -> bool:
+        return bool(msg.headers) and msg.headers.get(ORIGIN_HEADER) == self._replica_id
+
+    async def _frame_handler(self, msg: Msg) -> None:
+        if self._is_own(msg):
+            return
+        try:
+            self._broadcaster.publish(msg.subject.split(".")[1], msg.data.decode())
+        except ValueError:  # includes UnicodeDecodeError
+            logger.warning("Ignoring malformed frame on %s", msg.subject)
+
+    async def _cancel_handler(self, msg: Msg) -> None:
+        if self._is_own(msg):
+            return
+        await self._on_cancel(msg.subject.split(".")[1])
+
+    async def publish_frame(self, session_id: str, frame: str) -> None:
+        await self._nc.publish(f"relay.{session_id}.events", frame.encode(), headers=self._headers)
+
+    async def publish_cancel(self, session_id: str) -> None:
+        await self._nc.publish(f"relay.{session_id}.cancel", b"", headers=self._headers)
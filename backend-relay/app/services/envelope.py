@@ -0,0 +1,51 @@
+"""WebSocket envelope encoding: one `{"event", "data"}` text frame per event.
+
+Frames are encoded once and the same string is queued for every receiver.
+orjson is used when installed (`uv add orjson`), the stdlib otherwise.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:  # optional dependency
+    _dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    _loads = json.loads
+    JSON_BACKEND = "json"
+
+DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError, UnicodeDecodeError)  # JSONDecodeError, orjson
+
+
+def loads(data: bytes) -> Any:
+    """Parse a JSON payload with the fastest available backend."""
+    return _loads(data)
+
+
+def encode_envelope(event: str, data: Any) -> str:
+    """Serialize an envelope into a text frame."""
+    return _dumps({"event": event, "data": data})
+
+
+def splice_envelope(event: str, raw: bytes) -> str | None:
+    """Wrap an already-encoded JSON object/array without decoding it.
+
+    Returns None when `raw` does not look like a JSON container, so the
+    caller can fall back to the decode path. The payload itself is trusted
+    (it comes from the arena engine), not validated.
+    """
+    body = raw.strip()
+    if not body or body[:1] not in (b"{", b"["):
+        return None
+    try:
+        text = body.decode()
+    except UnicodeDecodeError:
+        return None
+    return f'{{"event":{_dumps(event)},"data":{text}}}'
@@ -21,13 +21,16 @@ class GMClient:
     def is_ready(self) -> bool:
         return not self._client.is_closed
 
-    async def start_game(self, lang: str = "fr") -> dict:
-        resp = await self._client.get("/api/start", params={"lang": lang})
+    async def start_game(self, lang: str = "fr", session_id: str | None = None) -> dict:
+        params = {"lang": lang}
+        if session_id:
+            params["session_id"] = session_id
+        resp = await self._client.get("/api/start", params=params)
         resp.raise_for_status()
         return resp.json()
 
-    async def get_state(self) -> dict:
-        resp = await self._client.get("/api/state")
+    async def get_state(self, session_id: str) -> dict:
+        resp = await self._client.get("/api/state", params={"session_id": session_id})
         resp.raise_for_status()
         return resp.json()
 
@@ -36,17 +39,31 @@ class GMClient:
         resp.raise_for_status()
         return resp.json()
 
-    async def stream_propose(self, lang: str, on_event: OnEvent) -> None:
-        await self._consume_sse("/api/stream/propose", {"lang": lang}, on_event)
+    async def stream_propose(self, session_id: str, lang: str, on_event: OnEvent) -> None:
+        await self._consume_sse(
+            "/api/stream/propose", {"session_id": session_id, "lang": lang}, on_event
+        )
 
-    async def stream_choose(self, kind: str, lang: str, on_event: OnEvent) -> None:
+    async def stream_choose(
+        self, session_id: str, kind: str, lang: str, on_event: OnEvent
+    ) -> None:
         await self._consume_sse(
-            "/api/stream/choose", {"kind": kind, "lang": lang}, on_event
+            "/api/stream/choose",
+            {"session_id": session_id, "kind": kind, "lang": lang},
+            on_event,
         )
 
-    async def get_image(self, path: str) -> httpx.Response:
-        resp = await self._client.get(f"/api/images/{path}")
-        resp.raise_for_status()
+    async def open_image(self, path: str, if_none_match: str | None = None) -> httpx.Response:
+        """Start streaming an image; the caller must `aclose()` the response.
+
+        A 304 (when `if_none_match` still matches) is returned as-is.
+        """
+        headers = {"If-None-Match": if_none_match} if if_none_match else None
+        request = self._client.build_request("GET", f"/api/images/{path}", headers=headers)
+        resp = await self._client.send(request, stream=True)
+        if resp.status_code != 304 and resp.is_error:
+            await resp.aclose()
+            resp.raise_for_status()
         return resp
 
     async def _consume_sse(
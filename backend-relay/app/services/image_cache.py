@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CachedImage:
+    content: bytes
+    media_type: str
+    headers: dict[str, str]  # validators / caching headers forwarded from the GM
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+
+class ImageCache:
+    """Small byte-bounded LRU of hot images proxied from the GM.
+
+    Only images up to `max_item_bytes` are kept; larger ones are streamed
+    through without being retained.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_item_bytes: int = 4 * 1024 * 1024) -> None:
+        self._max_bytes = max_bytes
+        self._max_item_bytes = max_item_bytes
+        self._items: OrderedDict[str, CachedImage] = OrderedDict()
+        self._total = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def accepts(self, size: int | None) -> bool:
+        return size is not None and 0 < size <= min(self._max_item_bytes, self._max_bytes)
+
+    def get(self, key: str) -> CachedImage | None:
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+        return item
+
+    def put(self, key: str, item: CachedImage) -> None:
+        if not self.accepts(len(item.content)):
+            return
+        previous = self._items.pop(key, None)
+        if previous is not None:
+            self._total -= len(previous.content)
+        self._items[key] = item
+        self._total += len(item.content)
+        while self._total > self._max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self._total -= len(evicted.content)
@@ -1,66 +1,137 @@
+import asyncio
 import json
 import logging
-import random
+import zlib
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from pathlib import Path
 
-from fastapi import WebSocket
 from nats.aio.client import Client as NatsClient
 from nats.aio.msg import Msg
+from nats.aio.subscription import Subscription
+
+from app.services.broadcaster import Broadcaster
+from app.services.envelope import DECODE_ERRORS, encode_envelope, loads, splice_envelope
 
 logger = logging.getLogger(__name__)
 
+ReconnectHook = Callable[[], Awaitable[None]]
+
 _SKINS_DIR = Path(__file__).resolve().parent.parent.parent / "public" / "agent-skins"
-_AVAILABLE_SKINS = [p.stem for p in _SKINS_DIR.glob("*.png")]
+_SKIN_LIST = tuple(sorted(p.stem for p in _SKINS_DIR.glob("*.png")))
+_AVAILABLE_SKINS = frozenset(_SKIN_LIST)
 
 
+@lru_cache(maxsize=4096)
 def _avatar_url(agent_name: str) -> str:
+    """Skin matching the agent name, else a fallback that is stable per name.
+
+    crc32 (not hash()) keeps the fallback identical across restarts and
+    replicas, so clients can cache the image.
+    """
     name = agent_name.lower()
-    if name not in _AVAILABLE_SKINS:
-        name = random.choice(_AVAILABLE_SKINS)
+    if name not in _AVAILABLE_SKINS and _SKIN_LIST:
+        name = _SKIN_LIST[zlib.crc32(name.encode()) % len(_SKIN_LIST)]
     return f"/static/agent-skins/{name}.png"
 
 
-def _enrich_payload(payload: dict | list | str) -> dict | list | str:
-    """Inject avatar_url fields into payloads containing agent names."""
-    if isinstance(payload, list):
-        return [_enrich_payload(item) for item in payload]
-    if not isinstance(payload, dict):
-        return payload
+# Arena subjects whose payloads carry no agent names: relayed without decoding
+_PASSTHROUGH_SUFFIXES = frozenset({"round.start", "phase.start", "input.waiting"})
+
+
+def _needs_enrichment(topic_suffix: str) -> bool:
+    if topic_suffix in _PASSTHROUGH_SUFFIXES:
+        return False
+    return not (topic_suffix.startswith("agent.") and topic_suffix.endswith(".status"))
+
 
-    # Direct agent_name field (AgentMessage, DeathEvent)
-    if "agent_name" in payload:
-        payload["avatar_url"] = _avatar_url(payload["agent_name"])
+def _enrich_agent_name(payload: dict, value: object) -> None:
+    # AgentMessage, DeathEvent
+    if isinstance(value, str):
+        payload["avatar_url"] = _avatar_url(value)
 
-    # CloneEvent: parent_name / child_name
-    for key in ("parent_name", "child_name"):
-        if key in payload:
-            payload[key.replace("name", "avatar_url")] = _avatar_url(payload[key])
 
+def _enrich_parent_name(payload: dict, value: object) -> None:
+    # CloneEvent
+    if isinstance(value, str):
+        payload["parent_avatar_url"] = _avatar_url(value)
+
+
+def _enrich_child_name(payload: dict, value: object) -> None:
+    # CloneEvent
+    if isinstance(value, str):
+        payload["child_avatar_url"] = _avatar_url(value)
+
+
+def _enrich_agent_list(payload: dict, value: object) -> None:
     # GlobalState: agents array and graveyard
-    for list_key in ("agents", "graveyard"):
-        if list_key in payload and isinstance(payload[list_key], list):
-            for agent in payload[list_key]:
-                if isinstance(agent, dict) and "name" in agent:
-                    agent["avatar_url"] = _avatar_url(agent["name"])
+    if type(value) is not list:
+        return
+    for agent in value:
+        if type(agent) is dict:
+            name = agent.get("name")
+            if type(name) is str:
+                agent["avatar_url"] = _avatar_url(name)
+
 
+def _enrich_survivors(payload: dict, value: object) -> None:
     # EndEvent: survivors list → convert to objects with avatar
-    if "survivors" in payload and isinstance(payload["survivors"], list):
-        enriched = []
-        for name in payload["survivors"]:
-            if isinstance(name, str):
-                enriched.append({"name": name, "avatar_url": _avatar_url(name)})
-            else:
-                enriched.append(name)
-        payload["survivors"] = enriched
+    if type(value) is list:
+        payload["survivors"] = [
+            {"name": name, "avatar_url": _avatar_url(name)} if type(name) is str else name
+            for name in value
+        ]
 
+
+_FIELD_ENRICHERS = {
+    "agent_name": _enrich_agent_name,
+    "parent_name": _enrich_parent_name,
+    "child_name": _enrich_child_name,
+    "agents": _enrich_agent_list,
+    "graveyard": _enrich_agent_list,
+    "survivors": _enrich_survivors,
+}
+_ENRICHED_KEYS = _FIELD_ENRICHERS.keys()
+
+
+def _enrich_payload(payload: dict | list | str) -> dict | list | str:
+    """Inject avatar_url fields into payloads containing agent names."""
+    if type(payload) is list:
+        return [_enrich_payload(item) for item in payload]
+    if type(payload) is not dict:
+        return payload
+    # Only visit the keys that carry names (one set intersection per payload)
+    for key in _ENRICHED_KEYS & payload.keys():
+        _FIELD_ENRICHERS[key](payload, payload[key])
     return payload
 
 
 class NatsRelay:
-    def __init__(self, nats_url: str) -> None:
+    """Relays arena.<sid>.* NATS traffic to the session's WebSocket clients.
+
+    Subscriptions are per session: created when the session gets its first
+    local client and dropped when it loses its last one, so a relay only
+    receives traffic for the sessions it serves. With `queue_group`, relays
+    sharing the group split each session's messages between them.
+    """
+
+    def __init__(self, nats_url: str, broadcaster: Broadcaster, queue_group: str = "") -> None:
         self._nats_url = nats_url
+        self._broadcaster = broadcaster
+        self._queue_group = queue_group
+        self._subs: dict[str, Subscription] = {}
+        self._subs_lock = asyncio.Lock()
         self._nc: NatsClient = NatsClient()
-        self._sessions: dict[str, set[WebSocket]] = {}
+        self._on_reconnect_hooks: list[ReconnectHook] = [self.resubscribe]
+        broadcaster.add_session_hooks(self._subscribe_session, self._unsubscribe_session)
+
+    def add_reconnect_hook(self, hook: ReconnectHook) -> None:
+        """Run `hook` after each reconnect, e.g. to restore other subscriptions."""
+        self._on_reconnect_hooks.append(hook)
+
+    @property
+    def client(self) -> NatsClient:
+        return self._nc
 
     @property
     def is_connected(self) -> bool:
@@ -74,9 +145,41 @@ class NatsRelay:
             error_cb=self._on_error,
         )
         logger.info("NATS connected to %s", self._nats_url)
-
-        await self._nc.subscribe("arena.>", cb=self._message_handler)
-        logger.info("Subscribed to arena.>")
+        await self.resubscribe()
+
+    async def resubscribe(self) -> None:
+        """Subscribe the sessions with local clients that have no subscription.
+
+        Sessions opened while NATS was down were skipped by the open hook;
+        subscriptions that existed are restored by the client itself.
+        """
+        for session_id in self._broadcaster.session_ids():
+            if session_id not in self._subs:
+                await self._subscribe_session(session_id)
+
+    async def _subscribe_session(self, session_id: str) -> None:
+        async with self._subs_lock:
+            if session_id in self._subs or not self._nc.is_connected:
+                return
+            subject = f"arena.{session_id}.>"
+            self._subs[session_id] = await self._nc.subscribe(
+                subject, queue=self._queue_group, cb=self._message_handler
+            )
+        logger.info("Subscribed to %s", subject)
+
+    async def _unsubscribe_session(self, session_id: str) -> None:
+        async with self._subs_lock:
+            if self._broadcaster.has_clients(session_id):
+                return  # a client came back before the close hook ran
+            sub = self._subs.pop(session_id, None)
+            if sub is None:
+                return
+            try:
+                await sub.unsubscribe()
+            except Exception:
+                logger.warning("Failed to unsubscribe from arena.%s.>", session_id)
+                return
+        logger.info("Unsubscribed from arena.%s.>", session_id)
 
     async def _message_handler(self, msg: Msg) -> None:
         parts = msg.subject.split(".")
@@ -91,46 +194,22 @@ class NatsRelay:
         if topic_suffix.startswith("input.fakenews"):
             return
 
-        clients = self._sessions.get(session_id)
-        if not clients:
+        if not self._broadcaster.has_clients(session_id):
             return
 
-        # Decode payload
-        try:
-            payload = json.loads(msg.data.decode())
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            payload = msg.data.decode()
-
-        payload = _enrich_payload(payload)
-        envelope = {"event": f"arena.{topic_suffix}", "data": payload}
-
-        # Send to all connected clients for this session
-        dead_clients: list[WebSocket] = []
-        for ws in clients:
+        event = f"arena.{topic_suffix}"
+        frame = None
+        if not _needs_enrichment(topic_suffix):
+            frame = splice_envelope(event, msg.data)
+        if frame is None:
             try:
-                await ws.send_json(envelope)
-            except Exception:
-                dead_clients.append(ws)
-                logger.warning("Failed to send to WebSocket client in session %s, removing", session_id)
-
-        for ws in dead_clients:
-            clients.discard(ws)
-        if not clients:
-            self._sessions.pop(session_id, None)
-
-    async def register_client(self, session_id: str, ws: WebSocket) -> None:
-        if session_id not in self._sessions:
-            self._sessions[session_id] = set()
-        self._sessions[session_id].add(ws)
-        logger.info("Client registered for session %s", session_id)
-
-    async def unregister_client(self, session_id: str, ws: WebSocket) -> None:
-        clients = self._sessions.get(session_id)
-        if clients:
-            clients.discard(ws)
-            if not clients:
-                self._sessions.pop(session_id, None)
-        logger.info("Client unregistered from session %s", session_id)
+                payload = loads(msg.data)
+            except DECODE_ERRORS:
+                payload = msg.data.decode(errors="replace")
+            frame = encode_envelope(event, _enrich_payload(payload))
+
+        # Encoded once, queued for every client (never awaits a slow socket)
+        self._broadcaster.publish(session_id, frame)
 
     async def publish_init(self, session_id: str, query_params: dict | None = None) -> None:
         if not self._nc.is_connected:
@@ -164,6 +243,11 @@ class NatsRelay:
 
     async def _on_reconnect(self) -> None:
         logger.info("NATS reconnected to %s", self._nc.connected_url)
+        for hook in self._on_reconnect_hooks:
+            try:
+                await hook()
+            except Exception:
+                logger.exception("NATS reconnect hook %s failed", hook)
 
     async def _on_disconnect(self) -> None:
         logger.warning("NATS disconnected")
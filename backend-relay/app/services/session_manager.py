@@ -1,97 +1,88 @@
 import asyncio
-import json
 import logging
-from dataclasses import dataclass, field
-
-from fastapi import WebSocket
 
 from app.schemas.messages import SESSION_ID_PATTERN
+from app.services.broadcaster import Broadcaster
+from app.services.cluster import ClusterBus
+from app.services.envelope import encode_envelope
+from app.services.session_store import MemorySessionStore, Session, SessionStore
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class Session:
-    session_id: str
-    gm_session_id: str | None = None
-    lang: str = "fr"
-    ws_clients: set[WebSocket] = field(default_factory=set)
-    active_task: asyncio.Task | None = None  # type: ignore[type-arg]
-    game_data: dict = field(default_factory=dict)
-
-
 class SessionManager:
-    def __init__(self) -> None:
-        self._sessions: dict[str, Session] = {}
-
-    def session_exists(self, session_id: str) -> bool:
-        return session_id in self._sessions
-
-    def get_session(self, session_id: str) -> Session | None:
-        return self._sessions.get(session_id)
-
-    async def create_session(self, session_id: str, lang: str = "fr") -> Session:
+    """Relay sessions over a pluggable store, plus the streams this replica runs.
+
+    With a shared store and a cluster bus, any replica can serve any session:
+    gm.* events reach sockets held by other replicas through the bus, and
+    starting a stream cancels the session's stream wherever it runs.
+    """
+
+    def __init__(
+        self,
+        broadcaster: Broadcaster,
+        store: SessionStore | None = None,
+        bus: ClusterBus | None = None,
+    ) -> None:
+        self._broadcaster = broadcaster
+        self._store: SessionStore = store or MemorySessionStore()
+        self.bus = bus
+        self._tasks: dict[str, asyncio.Task] = {}  # type: ignore[type-arg]
+
+    async def session_exists(self, session_id: str) -> bool:
+        return await self._store.get(session_id) is not None
+
+    async def get_session(self, session_id: str) -> Session | None:
+        return await self._store.get(session_id)
+
+    async def create_session(
+        self, session_id: str, lang: str = "fr", gm_session_id: str | None = None
+    ) -> Session:
         if not SESSION_ID_PATTERN.match(session_id):
             raise ValueError("Invalid session_id format")
 
-        if session_id in self._sessions:
+        session = Session(session_id=session_id, gm_session_id=gm_session_id, lang=lang)
+        if not await self._store.create(session):
             raise FileExistsError(f"Session {session_id} already exists")
-
-        session = Session(session_id=session_id, lang=lang)
-        self._sessions[session_id] = session
         return session
 
-    def get_or_create_session_sync(self, session_id: str) -> Session:
-        if session_id not in self._sessions:
-            if not SESSION_ID_PATTERN.match(session_id):
-                raise ValueError("Invalid session_id format")
-            self._sessions[session_id] = Session(session_id=session_id)
-        return self._sessions[session_id]
-
-    async def register_ws(self, session_id: str, ws: WebSocket) -> None:
-        session = self.get_or_create_session_sync(session_id)
-        session.ws_clients.add(ws)
-        logger.info(
-            "WS registered for session %s (total: %d)",
-            session_id,
-            len(session.ws_clients),
-        )
-
-    async def unregister_ws(self, session_id: str, ws: WebSocket) -> None:
-        session = self._sessions.get(session_id)
-        if session:
-            session.ws_clients.discard(ws)
-            logger.info(
-                "WS unregistered from session %s (remaining: %d)",
-                session_id,
-                len(session.ws_clients),
-            )
+    async def get_or_create_session(self, session_id: str) -> Session:
+        session = await self._store.get(session_id)
+        if session is None:
+            try:
+                session = await self.create_session(session_id)
+            except FileExistsError:  # created concurrently (possibly on another replica)
+                session = await self._store.get(session_id) or Session(session_id=session_id)
+        return session
 
     async def broadcast(self, session_id: str, event: str, data: dict | list | str) -> None:
-        session = self._sessions.get(session_id)
-        if not session or not session.ws_clients:
-            return
-
-        envelope = json.dumps({"event": event, "data": data})
-        dead: list[WebSocket] = []
-
-        for ws in session.ws_clients:
+        frame = encode_envelope(event, data)
+        self._broadcaster.publish(session_id, frame)
+        if self.bus is not None:
             try:
-                await ws.send_text(envelope)
+                await self.bus.publish_frame(session_id, frame)
             except Exception:
-                dead.append(ws)
-                logger.warning("Failed to send to WS in session %s, removing", session_id)
+                logger.warning("Failed to forward %s to other replicas for session %s", event, session_id)
 
-        for ws in dead:
-            session.ws_clients.discard(ws)
+    async def cancel_active_task(self, session_id: str) -> None:
+        await self.cancel_local_task(session_id)
+        if self.bus is not None:
+            try:
+                await self.bus.publish_cancel(session_id)
+            except Exception:
+                logger.warning("Failed to forward cancel for session %s", session_id)
 
-    def cancel_active_task(self, session_id: str) -> None:
-        session = self._sessions.get(session_id)
-        if session and session.active_task and not session.active_task.done():
-            session.active_task.cancel()
+    async def cancel_local_task(self, session_id: str) -> None:
+        task = self._tasks.pop(session_id, None)
+        if task and not task.done():
+            task.cancel()
             logger.info("Cancelled active task for session %s", session_id)
 
     def set_active_task(self, session_id: str, task: asyncio.Task) -> None:  # type: ignore[type-arg]
-        session = self._sessions.get(session_id)
-        if session:
-            session.active_task = task
+        self._tasks[session_id] = task
+
+        def _forget(done: asyncio.Task) -> None:  # type: ignore[type-arg]
+            if self._tasks.get(session_id) is done:
+                del self._tasks[session_id]
+
+        task.add_done_callback(_forget)
@@ -0,0 +1,89 @@
+"""Relay session storage: in this process, or in a NATS KV bucket shared by replicas.
+
+Only plain session data is stored; running stream tasks stay local to the
+replica that started them (see SessionManager).
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Protocol
+
+from nats.aio.client import Client as NatsClient
+from nats.js.errors import BucketNotFoundError, KeyNotFoundError, KeyWrongLastSequenceError
+from nats.js.kv import KeyValue
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Session:
+    session_id: str
+    gm_session_id: str | None = None
+    lang: str = "fr"
+    game_data: dict = field(default_factory=dict)
+
+
+class SessionStore(Protocol):
+    async def get(self, session_id: str) -> Session | None: ...
+
+    async def create(self, session: Session) -> bool:
+        """Store a new session; False if the id is already taken."""
+        ...
+
+    async def put(self, session: Session) -> None: ...
+
+
+class MemorySessionStore:
+    """Sessions in a dict: a single replica, or tests."""
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, Session] = {}
+
+    async def get(self, session_id: str) -> Session | None:
+        return self._sessions.get(session_id)
+
+    async def create(self, session: Session) -> bool:
+        if session.session_id in self._sessions:
+            return False
+        self._sessions[session.session_id] = session
+        return True
+
+    async def put(self, session: Session) -> None:
+        self._sessions[session.session_id] = session
+
+
+class NatsKVSessionStore:
+    """Sessions in a JetStream key-value bucket, visible to every replica."""
+
+    def __init__(self, kv: KeyValue) -> None:
+        self._kv = kv
+
+    @classmethod
+    async def open(cls, nc: NatsClient, bucket: str, ttl_s: float) -> "NatsKVSessionStore":
+        js = nc.jetstream()
+        try:
+            kv = await js.key_value(bucket)
+        except BucketNotFoundError:
+            kv = await js.create_key_value(bucket=bucket, ttl=ttl_s)
+            logger.info("Created NATS KV bucket %s (ttl=%ss)", bucket, ttl_s)
+        return cls(kv)
+
+    async def get(self, session_id: str) -> Session | None:
+        try:
+            entry = await self._kv.get(session_id)
+        except KeyNotFoundError:
+            return None
+        if not entry.value:
+            return None
+        return Session(**json.loads(entry.value))
+
+    async def create(self, session: Session) -> bool:
+        try:
+            await self._kv.create(session.session_id, json.dumps(asdict(session)).encode())
+        except KeyWrongLastSequenceError:
+            return False
+        return True
+
+    async def put(self, session: Session) -> None:
+        await self._kv.put(session.session_id, json.dumps(asdict(session)).encode())
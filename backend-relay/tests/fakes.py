@@ -0,0 +1,31 @@
+"""Test doubles shared by the relay tests."""
+
+import asyncio
+import json
+
+
+class FakeWebSocket:
+    """Records sent frames; with `blocked`, every send waits until `unblock()`."""
+
+    def __init__(self, blocked: bool = False) -> None:
+        self.sent: list[dict] = []
+        self.close_code: int | None = None
+        self._gate = asyncio.Event()
+        if not blocked:
+            self._gate.set()
+
+    def unblock(self) -> None:
+        self._gate.set()
+
+    async def send_text(self, text: str) -> None:
+        await self._gate.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+
+async def settle() -> None:
+    """Let queued sender tasks run."""
+    for _ in range(10):
+        await asyncio.sleep(0)
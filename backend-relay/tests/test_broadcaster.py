@@ -0,0 +1,129 @@
+"""Tests for the WebSocket broadcaster: per-client queues, slow clients and replay."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.services.broadcaster import SLOW_CLIENT_CLOSE_CODE, Broadcaster, SessionLog
+from app.services.envelope import encode_envelope
+from tests.fakes import FakeWebSocket, settle
+
+
+def _publish(broadcaster: Broadcaster, session_id: str, count: int, start: int = 0) -> None:
+    for i in range(start, start + count):
+        broadcaster.publish(session_id, encode_envelope("gm.llm_text", {"i": i}))
+
+
+@pytest.mark.asyncio
+async def test_slow_client_is_disconnected_without_stalling_others() -> None:
+    broadcaster = Broadcaster(max_queue=2, slow_client_policy="disconnect", replay_size=0)
+    fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+    await broadcaster.register("s", fast)
+    await broadcaster.register("s", slow)
+
+    for i in range(6):
+        _publish(broadcaster, "s", 1, start=i)
+        await asyncio.sleep(0)
+    await settle()
+
+    assert [f["data"]["i"] for f in fast.sent] == list(range(6))
+    assert slow.close_code == SLOW_CLIENT_CLOSE_CODE
+    assert broadcaster.client_count("s") == 1
+    assert broadcaster.stats()["slow_clients_disconnected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_skips_frames_for_the_slow_client_only() -> None:
+    broadcaster = Broadcaster(max_queue=2, slow_client_policy="drop", replay_size=0)
+    fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+    await broadcaster.register("s", fast)
+    await broadcaster.register("s", slow)
+
+    for i in range(6):
+        _publish(broadcaster, "s", 1, start=i)
+        await asyncio.sleep(0)
+    slow.unblock()
+    await settle()
+
+    assert [f["data"]["i"] for f in fast.sent] == list(range(6))
+    assert [f["data"]["i"] for f in slow.sent] == [0, 1, 2]  # in flight + a full queue
+    assert slow.close_code is None
+    assert broadcaster.client_count("s") == 2
+    assert broadcaster.stats()["dropped_frames"] == 3
+
+
+@pytest.mark.asyncio
+async def test_client_whose_send_fails_is_removed() -> None:
+    class BrokenWebSocket(FakeWebSocket):
+        async def send_text(self, text: str) -> None:
+            raise ConnectionResetError
+
+    broadcaster = Broadcaster(replay_size=0)
+    await broadcaster.register("s", BrokenWebSocket())
+    _publish(broadcaster, "s", 1)
+    await settle()
+    assert not broadcaster.has_clients("s")
+
+
+@pytest.mark.asyncio
+async def test_reconnect_receives_exactly_the_missing_frames() -> None:
+    broadcaster = Broadcaster(replay_size=8)
+    first = FakeWebSocket()
+    await broadcaster.register("s", first)
+    _publish(broadcaster, "s", 3)
+    await settle()
+    seen = first.sent[-1]
+    await broadcaster.unregister("s", first)
+    _publish(broadcaster, "s", 2, start=3)  # missed while away
+
+    again = FakeWebSocket()
+    await broadcaster.register("s", again, last_offset=seen["offset"], epoch=seen["epoch"])
+    _publish(broadcaster, "s", 1, start=5)
+    await settle()
+
+    assert [f["data"]["i"] for f in again.sent] == [3, 4, 5]
+    assert [f["offset"] for f in again.sent] == [4, 5, 6]
+    assert {f["epoch"] for f in again.sent} == {seen["epoch"]}
+
+
+@pytest.mark.asyncio
+async def test_resume_point_from_another_epoch_gets_resync() -> None:
+    broadcaster = Broadcaster(replay_size=8)
+    watcher = FakeWebSocket()
+    await broadcaster.register("s", watcher)
+    _publish(broadcaster, "s", 3)
+
+    ws = FakeWebSocket()
+    await broadcaster.register("s", ws, last_offset=2, epoch="other-replica")
+    await settle()
+
+    epoch = watcher.sent[0]["epoch"]
+    assert ws.sent == [{"event": "relay.resync", "data": {"offset": 3, "epoch": epoch}}]
+
+
+@pytest.mark.asyncio
+async def test_resume_point_evicted_from_the_log_gets_resync() -> None:
+    broadcaster = Broadcaster(replay_size=2)
+    watcher = FakeWebSocket()
+    await broadcaster.register("s", watcher)
+    _publish(broadcaster, "s", 5)
+    await settle()
+    epoch = watcher.sent[0]["epoch"]
+
+    evicted, buffered = FakeWebSocket(), FakeWebSocket()
+    await broadcaster.register("s", evicted, last_offset=2, epoch=epoch)  # 3 is gone
+    await broadcaster.register("s", buffered, last_offset=3, epoch=epoch)
+    await settle()
+
+    assert evicted.sent == [{"event": "relay.resync", "data": {"offset": 5, "epoch": epoch}}]
+    assert [f["offset"] for f in buffered.sent] == [4, 5]
+
+
+def test_session_log_stamps_empty_objects_and_rejects_other_frames() -> None:
+    log = SessionLog(4)
+    assert json.loads(log.append("{}")) == {"offset": 1, "epoch": log.epoch}
+    assert json.loads(log.append('{"event":"x"}')) == {"offset": 2, "epoch": log.epoch, "event": "x"}
+    with pytest.raises(ValueError):
+        log.append('["not", "an", "object"]')
+    assert log.latest == 2
@@ -0,0 +1,197 @@
+"""Tests for running several relay replicas: shared sessions, fan-out, cancels."""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+from nats.js.errors import KeyNotFoundError, KeyWrongLastSequenceError
+
+from app.services.broadcaster import Broadcaster
+from app.services.cluster import InProcessHub, NatsClusterBus
+from app.services.session_manager import SessionManager
+from app.services.session_store import MemorySessionStore, NatsKVSessionStore, Session
+from tests.fakes import FakeWebSocket, settle
+
+
+@dataclass
+class FakeMsg:
+    subject: str
+    data: bytes
+    headers: dict[str, str] | None = None
+
+
+class FakeSubscription:
+    def __init__(self, nats: "FakeNats", subject: str, cb) -> None:
+        self._nats = nats
+        self.subject = subject
+        self.cb = cb
+
+    async def unsubscribe(self) -> None:
+        self._nats.subs.remove(self)
+
+
+@dataclass
+class FakeNats:
+    """One NATS server seen by every replica; delivers to all matching subscribers."""
+
+    subs: list[FakeSubscription] = field(default_factory=list)
+    is_connected: bool = True
+
+    async def subscribe(self, subject: str, queue: str = "", cb=None) -> FakeSubscription:
+        sub = FakeSubscription(self, subject, cb)
+        self.subs.append(sub)
+        return sub
+
+    async def publish(self, subject: str, payload: bytes = b"", headers: dict | None = None) -> None:
+        for sub in list(self.subs):
+            if _matches(sub.subject, subject):
+                await sub.cb(FakeMsg(subject, payload, headers))
+
+
+def _matches(pattern: str, subject: str) -> bool:
+    tokens, parts = pattern.split("."), subject.split(".")
+    return len(tokens) == len(parts) and all(t in ("*", p) for t, p in zip(tokens, parts))
+
+
+def _hub_replicas(count: int) -> list[tuple[SessionManager, Broadcaster]]:
+    hub, store = InProcessHub(), MemorySessionStore()
+    replicas = []
+    for _ in range(count):
+        broadcaster = Broadcaster()
+        manager = SessionManager(broadcaster, store)
+        manager.bus = hub.join(broadcaster, manager.cancel_local_task)
+        replicas.append((manager, broadcaster))
+    return replicas
+
+
+async def _nats_replicas(count: int) -> list[tuple[SessionManager, Broadcaster]]:
+    nats, store = FakeNats(), MemorySessionStore()
+    replicas = []
+    for _ in range(count):
+        broadcaster = Broadcaster(linger_s=0)
+        manager = SessionManager(broadcaster, store)
+        bus = NatsClusterBus(nats, broadcaster, manager.cancel_local_task)  # type: ignore[arg-type]
+        await bus.start()
+        manager.bus = bus
+        replicas.append((manager, broadcaster))
+    return replicas
+
+
+async def _running_stream(manager: SessionManager, session_id: str) -> asyncio.Task:
+    task = asyncio.create_task(asyncio.sleep(10))
+    manager.set_active_task(session_id, task)
+    await asyncio.sleep(0)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_frame_reaches_sockets_held_by_the_other_replica() -> None:
+    (a, broadcaster_a), (_, broadcaster_b) = _hub_replicas(2)
+    ws_a, ws_b = FakeWebSocket(), FakeWebSocket()
+    await broadcaster_a.register("s", ws_a)
+    await broadcaster_b.register("s", ws_b)
+
+    await a.broadcast("s", "gm.phase", {"phase": "news"})
+    await settle()
+
+    assert [f["data"] for f in ws_a.sent] == [{"phase": "news"}]
+    assert [f["data"] for f in ws_b.sent] == [{"phase": "news"}]
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_a_stream_running_on_the_other_replica() -> None:
+    (a, _), (b, _) = _hub_replicas(2)
+    stream = await _running_stream(a, "s")
+
+    await b.cancel_active_task("s")
+    await settle()
+
+    assert stream.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_replicas_share_one_session() -> None:
+    (a, _), (b, _) = _hub_replicas(2)
+    created = await a.get_or_create_session("s")
+    with pytest.raises(FileExistsError):
+        await b.create_session("s")
+    assert await b.get_or_create_session("s") is created
+
+
+@pytest.mark.asyncio
+async def test_nats_replica_ignores_its_own_echo() -> None:
+    (a, broadcaster_a), (_, broadcaster_b) = await _nats_replicas(2)
+    ws_a, ws_b = FakeWebSocket(), FakeWebSocket()
+    await broadcaster_a.register("s", ws_a)
+    await broadcaster_b.register("s", ws_b)
+
+    await a.broadcast("s", "gm.phase", {"phase": "news"})
+    await settle()
+
+    assert len(ws_a.sent) == 1  # its own frame came back from NATS and was skipped
+    assert len(ws_b.sent) == 1
+
+    await broadcaster_a.unregister("s", ws_a)
+    await broadcaster_b.unregister("s", ws_b)
+    await settle()
+
+
+@pytest.mark.asyncio
+async def test_nats_cancel_reaches_the_replica_running_the_stream() -> None:
+    (a, _), (b, _) = await _nats_replicas(2)
+    stream_a = await _running_stream(a, "s")
+    stream_b = await _running_stream(b, "s")
+
+    await a.cancel_active_task("s")
+    new_stream_a = await _running_stream(a, "s")  # the stream that replaced it
+    await b.cancel_active_task("s")
+    await settle()
+
+    assert stream_a.cancelled() and stream_b.cancelled()
+    assert new_stream_a.cancelled()  # b's cancel is not an echo for a
+    assert b._tasks == {}
+
+
+class FakeKV:
+    """The slice of a JetStream KV bucket used by NatsKVSessionStore."""
+
+    @dataclass
+    class Entry:
+        value: bytes
+
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> "FakeKV.Entry":
+        value = self.values.get(key)
+        await asyncio.sleep(0)  # the reply is in flight: another replica may create the key
+        if value is None:
+            raise KeyNotFoundError
+        return self.Entry(value)
+
+    async def create(self, key: str, value: bytes) -> None:
+        if key in self.values:
+            raise KeyWrongLastSequenceError
+        self.values[key] = value
+
+    async def put(self, key: str, value: bytes) -> None:
+        self.values[key] = value
+
+
+@pytest.mark.asyncio
+async def test_kv_store_creates_a_session_only_once() -> None:
+    store = NatsKVSessionStore(FakeKV())  # type: ignore[arg-type]
+    assert await store.get("s") is None
+    assert await store.create(Session(session_id="s", lang="en"))
+    assert not await store.create(Session(session_id="s", lang="fr"))
+    assert (await store.get("s")).lang == "en"
+
+
+@pytest.mark.asyncio
+async def test_replicas_racing_on_a_new_session_get_the_same_one() -> None:
+    store = NatsKVSessionStore(FakeKV())  # type: ignore[arg-type]
+    a, b = SessionManager(Broadcaster(), store), SessionManager(Broadcaster(), store)
+    first, second = await asyncio.gather(
+        a.get_or_create_session("s"), b.get_or_create_session("s")
+    )
+    assert first == second
@@ -4,7 +4,7 @@
 import React, { useReducer, useEffect, useRef, useCallback, useMemo } from "react";
 import { gameReducer, initialGameState } from "@/reducers/gameReducer";
 import type { GameAction } from "@/types/ws-events";
-import { initSession, startGame as apiStartGame, triggerPropose, triggerChoose, type StartResponse } from "@/services/api";
+import { initSession, startGame as apiStartGame, fetchGameState, triggerPropose, triggerChoose, type StartResponse } from "@/services/api";
 import { API_BASE_URL, WS_BASE_URL } from "@/config/constants";
 import { tr, type Lang } from "@/i18n/translations";
 import { GameContext, type GameActions, type GameContextValue } from "./GameContext";
@@ -27,6 +27,8 @@ export function GameProvider({ children }: GameProviderProps) {
   const wsRef = useRef<WebSocket | null>(null);
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const reconnectAttemptRef = useRef(0);
+  const lastOffsetRef = useRef<number | null>(null);
+  const lastEpochRef = useRef<string | null>(null);
   const sessionIdRef = useRef("");
   const langRef = useRef<Lang>("fr");
 
@@ -39,14 +41,23 @@ export function GameProvider({ children }: GameProviderProps) {
   // WebSocket Connection
   // ========================================================================
 
-  const connectWebSocket = useCallback((sessionId: string) => {
+  const connectWebSocket = useCallback((sessionId: string, resume = false) => {
     if (wsRef.current?.readyState === WebSocket.OPEN) {
       wsRef.current.close();
     }
 
     dispatch({ type: "WS_CONNECTING" });
 
-    const ws = new WebSocket(`${WS_BASE_URL}/ws/${sessionId}`);
+    // On reconnect, ask the relay to replay the frames missed since the last one seen
+    if (!resume) {
+      lastOffsetRef.current = null;
+      lastEpochRef.current = null;
+    }
+    const query =
+      lastOffsetRef.current !== null
+        ? `?last_offset=${lastOffsetRef.current}&epoch=${lastEpochRef.current ?? ""}`
+        : "";
+    const ws = new WebSocket(`${WS_BASE_URL}/ws/${sessionId}${query}`);
     wsRef.current = ws;
 
     ws.onopen = () => {
@@ -62,6 +73,30 @@ export function GameProvider({ children }: GameProviderProps) {
         const eventType = msg.subject || msg.event || msg.type || "";
         const data = msg.data ?? msg;
 
+        if (typeof msg.offset === "number") {
+          lastOffsetRef.current = msg.offset;
+          lastEpochRef.current = msg.epoch ?? null;
+        } else if (eventType === "relay.resync") {
+          // Missed frames can't be replayed: rebuild from /api/state, then follow the relay's log
+          console.warn("[WS] Resync requested, continuing from offset", data.offset, "epoch", data.epoch);
+          lastOffsetRef.current = data.offset;
+          lastEpochRef.current = data.epoch ?? null;
+          fetchGameState(sessionId)
+            .then((st) =>
+              dispatch({
+                type: "STATE_RESYNC",
+                agents: st.agents || [],
+                indices: st.indices,
+                decerebration: st.decerebration,
+                turn: st.turn,
+                maxTurns: st.max_turns,
+                ended: st.ended,
+              })
+            )
+            .catch((err) => console.error("[WS] Resync state fetch failed:", err));
+          return;
+        }
+
         console.log("[WS] Event:", eventType, data);
 
         // Map WebSocket events to reducer actions
@@ -103,7 +138,7 @@ export function GameProvider({ children }: GameProviderProps) {
 
     reconnectTimeoutRef.current = setTimeout(() => {
       if (sessionIdRef.current) {
-        connectWebSocket(sessionIdRef.current);
+        connectWebSocket(sessionIdRef.current, true);
       }
     }, delay);
   }, [connectWebSocket]);
@@ -318,6 +318,19 @@ export function gameReducer(state: FullGameState, action: GameAction): FullGameS
       };
     }
 
+    case "STATE_RESYNC": {
+      // Events were missed: take turn, indices and agents from /api/state
+      const agents = Array.isArray(action.agents) ? action.agents.map(mapAgent) : [];
+      return {
+        ...state,
+        gameState: mapIndices(action.indices, action.decerebration, action.turn, action.maxTurns, state.lang),
+        // agents may be empty - the swarm's state.global keeps them up to date
+        liveAgents: agents.length > 0 ? agents : state.liveAgents,
+        gameOver: state.gameOver || action.ended,
+        isStreaming: action.ended ? false : state.isStreaming,
+      };
+    }
+
     case "SET_LANG":
       return { ...state, lang: action.lang };
 
@@ -48,6 +48,19 @@ export async function startGame(sessionId: string, lang: Lang): Promise<StartRes
   return res.json();
 }
 
+/**
+ * Current game state — used to rebuild after the relay asks for a resync
+ */
+export async function fetchGameState(sessionId: string): Promise<StateResponse> {
+  const res = await fetch(`${BASE_URL}/api/state?session_id=${sessionId}`, {
+    headers: HEADERS,
+  });
+  if (!res.ok) {
+    throw new Error(`State error ${res.status}: ${res.statusText}`);
+  }
+  return res.json();
+}
+
 // ============================================================================
 // REST Triggers (return 202, events come via WebSocket)
 // ============================================================================
@@ -125,6 +138,15 @@ export interface StartResponse {
   agents: BackendAgent[];
 }
 
+export interface StateResponse {
+  turn: number;
+  max_turns: number;
+  indices: BackendIndices;
+  decerebration: number;
+  agents: BackendAgent[];
+  ended: boolean;
+}
+
 export interface NewsProposal {
   real: { text: string; body: string; stat_impact: Record<string, number> };
   fake: { text: string; body: string; stat_impact: Record<string, number> };
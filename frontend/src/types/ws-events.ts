@@ -274,6 +274,7 @@ export type GameAction =
   | { type: "WS_ERROR"; error: string }
   // Session
   | { type: "SESSION_START"; sessionId: string; agents: BackendAgent[]; indices: BackendIndices; turn: number; maxTurns: number }
+  | { type: "STATE_RESYNC"; agents: BackendAgent[]; indices: BackendIndices; decerebration: number; turn: number; maxTurns: number; ended: boolean }
   | { type: "SET_LANG"; lang: Lang }
   // GM Events
   | { type: "GM_PHASE"; payload: GmPhasePayload }
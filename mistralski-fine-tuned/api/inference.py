@@ -3,14 +3,23 @@ Inférence via le modèle fine-tuné Laroub10/news-title-mistral-ft
 (Mistral-7B + LoRA, entraîné sur données Gorafi / The Onion).
 
 Variables optionnelles :
-  MODEL_BASE_URL  — URL du serveur GPU (défaut: http://51.159.173.147:8001/v1)
-  MODEL_ID        — identifiant du modèle (défaut: Laroub10/news-title-mistral-ft)
+  MODEL_BASE_URL         — URL du serveur GPU (défaut: http://51.159.173.147:8001/v1)
+  MODEL_ID               — identifiant du modèle (défaut: Laroub10/news-title-mistral-ft)
+  MODEL_MAX_CONCURRENCY  — requêtes simultanées max vers le serveur GPU (défaut: 8)
+  MODEL_KEEPALIVE_S      — durée de vie des connexions inactives du pool (défaut: 120)
+  MODEL_WARMUP           — 1 = client + complétion d'amorçage par langue au démarrage (défaut: 0)
 """
 
+import asyncio
+import logging
 import os
+from functools import lru_cache
 from typing import Optional
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+logger = logging.getLogger(__name__)
 
 # ─── Prompts ──────────────────────────────────────────────────────────────────
 
@@ -45,96 +54,155 @@ SYSTEM_PROMPT = (
 )
 
 
+# Un prompt par (tranche de score, langue) : (borne haute, gabarit avec {score})
+USER_PROMPTS: dict[str, tuple[tuple[int, str], ...]] = {
+    "fr": (
+        (5, (
+            "Score {score}/100 — ABSURDE TOTAL style Le Gorafi. "
+            "Mélange une institution française (SNCF, URSSAF, Sénat, Élysée, INSEE, CAF, EDF) "
+            "avec une situation grotesque et traite ça avec un sérieux de rapport officiel. "
+            "Utilise un vrai nom de politique ou célébrité française. "
+            "Invente un faux chiffre officiel qui sonne vrai. "
+            "Exemples de structure : "
+            "'L'INSEE confirme que [fait absurde] depuis [année]', "
+            "'Le Sénat adopte une loi interdisant [chose ridicule] après [événement grotesque]', "
+            "'Macron annonce [mesure folle] pour [raison bureaucratique implacable]', "
+            "'Selon une étude de Sciences Po, [conclusion absurde sur les Français]'. "
+            "Le titre doit être drôle par son absurdité, pas par une blague explicite."
+        )),
+        (15, (
+            "Score {score}/100 — SATIRE ACIDE style Le Gorafi. "
+            "Exagère jusqu'à l'absurde un stéréotype français bien connu : "
+            "la grève, la baguette, le fromage, les 35h, l'amour de la paperasse, "
+            "les Parisiens, la politique, les gilets jaunes, la retraite. "
+            "Traite-le avec un ton pince-sans-rire et des formules officielles. "
+            "Utilise si possible un vrai nom (Bardella, Le Pen, Zemmour, Depardieu, Hanouna). "
+            "Invente une fausse étude ou un faux sondage avec un chiffre précis."
+        )),
+        (30, (
+            "Score {score}/100 — SATIRE SOCIALE. "
+            "Titre satirique qui joue sur un fait d'actualité réel légèrement exagéré. "
+            "Thèmes : réforme des retraites, inflation, immobilier parisien, IA au travail, "
+            "réseaux sociaux, cancel culture, wokisme, écologie vs économie, banlieues. "
+            "Ton ironique, légèrement absurde, mais crédible à première lecture."
+        )),
+        (50, (
+            "Score {score}/100 — CLICKBAIT SATIRIQUE. "
+            "Titre accrocheur qui exagère un fait réel. "
+            "Utilise des formules clickbait : 'Ce que personne ne vous dit sur...', "
+            "'La vraie raison pour laquelle...', 'X Français sur Y...', "
+            "'Le chiffre qui fait peur...', 'Pourquoi [chose banale] change tout'. "
+            "Reste ancré dans l'actualité française."
+        )),
+        (69, (
+            "Score {score}/100 — SENSATIONNALISTE. "
+            "Titre légèrement exagéré style BFM TV ou Konbini. "
+            "Accrocheur, joue sur l'émotion ou la peur, mais reste plausible."
+        )),
+        (100, "Score {score}/100 — Génère un titre de news factuel et sobre, style Le Monde ou France Info."),
+    ),
+    "en": (
+        (5, (
+            "Score {score}/100 — ABSURD SATIRE, The Onion style. "
+            "Mix a serious institution (Congress, FDA, UN, WHO, IRS, Pentagon) "
+            "with a completely ridiculous situation, reported deadpan. "
+            "Use a real politician or celebrity name. Invent a fake official statistic. "
+            "Structure: 'Study Finds [absurd fact]', 'Congress Passes Bill [ridiculous measure]', "
+            "'[Celebrity] Announces [grotesque policy]'. Funny through absurdity, not explicit jokes."
+        )),
+        (30, (
+            "Score {score}/100 — SOCIAL SATIRE, The Onion style. "
+            "Exaggerate a well-known American/Western stereotype to absurdity. "
+            "Deadpan tone, fake study or poll with a suspiciously precise number."
+        )),
+        (69, (
+            "Score {score}/100 — CLICKBAIT headline. "
+            "Catchy, slightly exaggerated, based on a real trend. "
+            "Formulas: 'What Nobody Tells You About...', 'X% of Americans...', "
+            "'The Shocking Truth About...', 'Why [mundane thing] Is Changing Everything'."
+        )),
+        (100, "Score {score}/100 — Generate a factual, neutral news headline, AP/Reuters style."),
+    ),
+}
+
+
+def _lang_key(lang: str) -> str:
+    return "fr" if lang == "fr" else "en"
+
+
+def _bucket_index(score: int, lang: str) -> int:
+    prompts = USER_PROMPTS[_lang_key(lang)]
+    return next(i for i, (limit, _) in enumerate(prompts) if score <= limit)
+
+
+def prompt_bucket(score: int, lang: str = "fr") -> str:
+    """Identifiant de tranche (ex: "fr:2") : deux scores de la même tranche partagent le prompt.
+
+    Sert de clé aux caches en amont (réserve de titres, cache de réponses).
+    """
+    return f"{_lang_key(lang)}:{_bucket_index(score, lang)}"
+
+
 def get_user_message(score: int, lang: str = "fr") -> str:
-    if lang == "fr":
-        if score <= 5:
-            return (
-                f"Score {score}/100 — ABSURDE TOTAL style Le Gorafi. "
-                "Mélange une institution française (SNCF, URSSAF, Sénat, Élysée, INSEE, CAF, EDF) "
-                "avec une situation grotesque et traite ça avec un sérieux de rapport officiel. "
-                "Utilise un vrai nom de politique ou célébrité française. "
-                "Invente un faux chiffre officiel qui sonne vrai. "
-                "Exemples de structure : "
-                "'L'INSEE confirme que [fait absurde] depuis [année]', "
-                "'Le Sénat adopte une loi interdisant [chose ridicule] après [événement grotesque]', "
-                "'Macron annonce [mesure folle] pour [raison bureaucratique implacable]', "
-                "'Selon une étude de Sciences Po, [conclusion absurde sur les Français]'. "
-                "Le titre doit être drôle par son absurdité, pas par une blague explicite."
-            )
-        if score <= 15:
-            return (
-                f"Score {score}/100 — SATIRE ACIDE style Le Gorafi. "
-                "Exagère jusqu'à l'absurde un stéréotype français bien connu : "
-                "la grève, la baguette, le fromage, les 35h, l'amour de la paperasse, "
-                "les Parisiens, la politique, les gilets jaunes, la retraite. "
-                "Traite-le avec un ton pince-sans-rire et des formules officielles. "
-                "Utilise si possible un vrai nom (Bardella, Le Pen, Zemmour, Depardieu, Hanouna). "
-                "Invente une fausse étude ou un faux sondage avec un chiffre précis."
-            )
-        if score <= 30:
-            return (
-                f"Score {score}/100 — SATIRE SOCIALE. "
-                "Titre satirique qui joue sur un fait d'actualité réel légèrement exagéré. "
-                "Thèmes : réforme des retraites, inflation, immobilier parisien, IA au travail, "
-                "réseaux sociaux, cancel culture, wokisme, écologie vs économie, banlieues. "
-                "Ton ironique, légèrement absurde, mais crédible à première lecture."
-            )
-        if score <= 50:
-            return (
-                f"Score {score}/100 — CLICKBAIT SATIRIQUE. "
-                "Titre accrocheur qui exagère un fait réel. "
-                "Utilise des formules clickbait : 'Ce que personne ne vous dit sur...', "
-                "'La vraie raison pour laquelle...', 'X Français sur Y...', "
-                "'Le chiffre qui fait peur...', 'Pourquoi [chose banale] change tout'. "
-                "Reste ancré dans l'actualité française."
-            )
-        if score <= 69:
-            return (
-                f"Score {score}/100 — SENSATIONNALISTE. "
-                "Titre légèrement exagéré style BFM TV ou Konbini. "
-                "Accrocheur, joue sur l'émotion ou la peur, mais reste plausible."
-            )
-        return f"Score {score}/100 — Génère un titre de news factuel et sobre, style Le Monde ou France Info."
-    else:
-        if score <= 5:
-            return (
-                f"Score {score}/100 — ABSURD SATIRE, The Onion style. "
-                "Mix a serious institution (Congress, FDA, UN, WHO, IRS, Pentagon) "
-                "with a completely ridiculous situation, reported deadpan. "
-                "Use a real politician or celebrity name. Invent a fake official statistic. "
-                "Structure: 'Study Finds [absurd fact]', 'Congress Passes Bill [ridiculous measure]', "
-                "'[Celebrity] Announces [grotesque policy]'. Funny through absurdity, not explicit jokes."
-            )
-        if score <= 30:
-            return (
-                f"Score {score}/100 — SOCIAL SATIRE, The Onion style. "
-                "Exaggerate a well-known American/Western stereotype to absurdity. "
-                "Deadpan tone, fake study or poll with a suspiciously precise number."
-            )
-        if score <= 69:
-            return (
-                f"Score {score}/100 — CLICKBAIT headline. "
-                "Catchy, slightly exaggerated, based on a real trend. "
-                "Formulas: 'What Nobody Tells You About...', 'X% of Americans...', "
-                "'The Shocking Truth About...', 'Why [mundane thing] Is Changing Everything'."
-            )
-        return f"Score {score}/100 — Generate a factual, neutral news headline, AP/Reuters style."
+    _, template = USER_PROMPTS[_lang_key(lang)][_bucket_index(score, lang)]
+    return template.format(score=score)
+
+
+@lru_cache(maxsize=256)
+def get_messages(score: int, lang: str = "fr") -> tuple[dict[str, str], ...]:
+    """Messages (system + user) prêts pour le client, construits une fois par (score, langue)."""
+    return (
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": get_user_message(score, lang)},
+    )
 
 
 # ─── Générateur ───────────────────────────────────────────────────────────────
 
 DEFAULT_BASE_URL = os.environ.get("MODEL_BASE_URL", "http://51.159.173.147:8001/v1")
 DEFAULT_MODEL    = os.environ.get("MODEL_ID", "Laroub10/news-title-mistral-ft")
+MAX_CONCURRENCY  = int(os.environ.get("MODEL_MAX_CONCURRENCY", "8"))
+KEEPALIVE_S      = float(os.environ.get("MODEL_KEEPALIVE_S", "120"))
+WARMUP_ENABLED   = os.environ.get("MODEL_WARMUP", "0").lower() in ("1", "true", "yes")
+WARMUP_LANGS     = ("fr", "en")
 
 
 class NewsTitleGenerator:
-    """Génère des titres via le serveur GPU (OpenAI-compatible)."""
-
-    def __init__(self):
-        self._client = OpenAI(base_url=DEFAULT_BASE_URL, api_key="unused")
+    """Génère des titres via le serveur GPU (OpenAI-compatible).
+
+    Les `n` titres sont demandés en une seule requête (`n=`, échantillonnés en
+    batch par vLLM) et le nombre de requêtes simultanées est borné par un
+    sémaphore : au-delà, les appels attendent leur tour sans bloquer la boucle.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY):
+        # Pool keep-alive dimensionné sur la concurrence : pas de reconnexion entre deux appels
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+                keepalive_expiry=KEEPALIVE_S,
+            ),
+        )
+        self._client = AsyncOpenAI(base_url=DEFAULT_BASE_URL, api_key="unused", http_client=http_client)
         self._model  = DEFAULT_MODEL
+        self._slots  = asyncio.Semaphore(max_concurrency)
+
+    async def warmup(self) -> None:
+        """Ouvre les connexions et réveille le modèle : une complétion minimale par langue."""
+        await asyncio.gather(*(
+            self._client.chat.completions.create(
+                model=self._model,
+                messages=list(get_messages(85, lang)),
+                max_tokens=1,
+            )
+            for lang in WARMUP_LANGS
+        ))
+
+    async def close(self) -> None:
+        await self._client.close()
 
-    def generate(
+    async def generate(
         self,
         score: int,
         lang: str = "fr",
@@ -142,20 +210,25 @@ class NewsTitleGenerator:
         temperature: float = 0.9,
         max_new_tokens: int = 80,
     ) -> list[str]:
-        user_msg = get_user_message(score, lang)
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_msg},
-        ]
-        results = []
-        for _ in range(n):
-            resp = self._client.chat.completions.create(
+        messages = list(get_messages(score, lang))
+        async with self._slots:
+            resp = await self._client.chat.completions.create(
                 model=self._model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_new_tokens,
+                n=n,
             )
-            results.append(resp.choices[0].message.content.strip())
+            results = [c.message.content.strip() for c in resp.choices]
+            # Backend qui ignore `n` : on complète un titre par requête
+            while len(results) < n:
+                resp = await self._client.chat.completions.create(
+                    model=self._model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_new_tokens,
+                )
+                results.append(resp.choices[0].message.content.strip())
         return results
 
 
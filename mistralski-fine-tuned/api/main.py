@@ -2,11 +2,15 @@
 API News Title Generator — déployable sur CapRover.
 
 Endpoints:
-  POST /generate  — génère des titres (score 0–100)
+  POST /generate        — génère des titres (score 0–100)
+  POST /generate/batch  — plusieurs scores en un seul appel, traités en parallèle
   GET  /health    — health check pour CapRover
   GET  /          — interface web
 """
 
+import asyncio
+import logging
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
@@ -17,9 +21,14 @@ from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
-from .inference import get_generator
+from .inference import WARMUP_ENABLED, get_generator, prompt_bucket
+from .response_cache import get_response_cache
+from .title_pool import get_pool
 
 STATIC_DIR = Path(__file__).parent / "static"
+WARMUP_TIMEOUT_S = 60.0
+
+logger = logging.getLogger(__name__)
 
 
 def error_response(status_code: int, message: str) -> JSONResponse:
@@ -29,10 +38,37 @@ def error_response(status_code: int, message: str) -> JSONResponse:
 
 # ─── Lifespan : chargement du modèle au démarrage ──────────────────────────────
 
+async def _warmup(app: FastAPI) -> None:
+    """Amorce client + modèle, puis marque l'API prête (même en cas d'échec, journalisé)."""
+    started = time.monotonic()
+    try:
+        await asyncio.wait_for(get_generator().warmup(), timeout=WARMUP_TIMEOUT_S)
+        app.state.warmup = "ok"
+    except Exception as e:
+        app.state.warmup = "failed"
+        logger.warning("Warmup échoué : %r", e)
+    app.state.ready = True
+    logger.info("Warmup %s en %.1fs", app.state.warmup, time.monotonic() - started)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Démarrage rapide — le modèle se charge à la 1ère requête /generate."""
+    """Démarrage rapide par défaut — le client se crée à la 1ère requête /generate.
+
+    Avec MODEL_WARMUP=1, le client (pool keep-alive) et le modèle sont amorcés
+    en tâche de fond ; /health répond 503 tant que ce n'est pas fini.
+    La réserve de titres se remplit en tâche de fond, à la demande.
+    """
+    app.state.ready = not WARMUP_ENABLED
+    app.state.warmup = "pending" if WARMUP_ENABLED else "disabled"
+    warmup_task = asyncio.create_task(_warmup(app)) if WARMUP_ENABLED else None
+    pool = get_pool()
+    pool.start()
     yield
+    if warmup_task is not None:
+        warmup_task.cancel()
+    await pool.stop()
+    await get_generator().close()
 
 
 # ─── App ─────────────────────────────────────────────────────────────────────
@@ -68,32 +104,86 @@ class GenerateResponse(BaseModel):
     titles: list[str]
     score: int
     lang: str
+    bucket: str = Field(..., description="Tranche de prompt (ex: fr:2) — même tranche = titres interchangeables")
+
+
+MAX_BATCH_SIZE = 10
+
+
+class BatchGenerateRequest(BaseModel):
+    requests: list[GenerateRequest] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+    deadline_s: Optional[float] = Field(
+        default=None, gt=0, le=60, description="Délai max par item (s) ; au-delà l'item est en erreur",
+    )
+
+
+class BatchItemResult(GenerateResponse):
+    error: Optional[str] = None
+
+
+class BatchGenerateResponse(BaseModel):
+    results: list[BatchItemResult]
 
 
 # ─── Routes ──────────────────────────────────────────────────────────────────
 
 @app.get("/health")
-async def health():
-    """Health check pour CapRover / load balancers."""
-    return {"status": "ok"}
+async def health(request: Request):
+    """Health check pour CapRover / load balancers — 503 tant que le warmup n'est pas fini."""
+    state = request.app.state
+    if not state.ready:
+        return JSONResponse(status_code=503, content={"status": "warming_up", "warmup": state.warmup})
+    return {"status": "ok", "warmup": state.warmup}
 
 
 @app.post("/generate", response_model=GenerateResponse)
 async def generate(req: GenerateRequest):
     """Génère des titres de news selon le score de véracité."""
     try:
-        gen = get_generator()
-        titles = gen.generate(
-            score=req.score,
-            lang=req.lang,
-            n=req.n,
-            temperature=req.temperature,
+        titles = await _generate_titles(req)
+        return GenerateResponse(
+            titles=titles, score=req.score, lang=req.lang, bucket=prompt_bucket(req.score, req.lang),
         )
-        return GenerateResponse(titles=titles, score=req.score, lang=req.lang)
     except Exception as e:
         return error_response(500, str(e))
 
 
+@app.post("/generate/batch", response_model=BatchGenerateResponse)
+async def generate_batch(req: BatchGenerateRequest):
+    """Génère des titres pour plusieurs scores en parallèle.
+
+    Les résultats gardent l'ordre des requêtes. Un item en échec ou hors
+    délai revient avec `titles: []` et `error` renseigné, sans bloquer les autres.
+    """
+    outcomes = await asyncio.gather(
+        *(_generate_titles(item, req.deadline_s) for item in req.requests),
+        return_exceptions=True,
+    )
+    results = []
+    for item, outcome in zip(req.requests, outcomes):
+        meta = {"score": item.score, "lang": item.lang, "bucket": prompt_bucket(item.score, item.lang)}
+        if isinstance(outcome, BaseException):
+            error = "timeout" if isinstance(outcome, TimeoutError) else str(outcome)
+            results.append(BatchItemResult(titles=[], error=error, **meta))
+        else:
+            results.append(BatchItemResult(titles=outcome, **meta))
+    return BatchGenerateResponse(results=results)
+
+
+async def _generate_titles(req: GenerateRequest, deadline_s: Optional[float] = None) -> list[str]:
+    """Titres depuis le cache de réponses, la réserve ou générés en direct.
+
+    Les requêtes identiques (même tranche, n, température) en vol ou récentes
+    partagent une seule génération. Borné par `deadline_s` si fourni.
+    """
+    key = (prompt_bucket(req.score, req.lang), req.n, req.temperature)
+    call = get_response_cache().get_or_generate(
+        key,
+        lambda: get_pool().generate(score=req.score, lang=req.lang, n=req.n, temperature=req.temperature),
+    )
+    return await asyncio.wait_for(call, timeout=deadline_s)
+
+
 @app.get("/")
 async def root():
     """Interface web ou doc."""
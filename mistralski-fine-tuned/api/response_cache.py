@@ -0,0 +1,102 @@
+"""
+Cache de réponses /generate avec coalescence des requêtes identiques.
+
+Quand plusieurs parties démarrent un tour en même temps, elles envoient la
+même requête (même tranche, n, température). La première lance la génération,
+les suivantes attendent son résultat (single-flight), puis la réponse reste
+servie pendant RESPONSE_CACHE_TTL_S (LRU de RESPONSE_CACHE_SIZE entrées).
+
+Variables optionnelles :
+  RESPONSE_CACHE_TTL_S  — durée de vie d'une réponse, 0 = désactivé (défaut: 5)
+  RESPONSE_CACHE_SIZE   — nombre max de réponses gardées (défaut: 256)
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, Optional
+
+CACHE_TTL_S = float(os.environ.get("RESPONSE_CACHE_TTL_S", "5"))
+CACHE_SIZE  = int(os.environ.get("RESPONSE_CACHE_SIZE", "256"))
+
+
+class ResponseCache:
+    """LRU à TTL court + une seule génération en vol par clé."""
+
+    def __init__(
+        self,
+        ttl_s: float = CACHE_TTL_S,
+        max_entries: int = CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, list[str]]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable) -> Optional[list[str]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, titles = entry
+        if self._clock() - stored_at >= self._ttl_s:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return titles
+
+    def _store(self, key: Hashable, titles: list[str]) -> None:
+        self._entries[key] = (self._clock(), titles)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_generate(
+        self, key: Hashable, generate: Callable[[], Awaitable[list[str]]],
+    ) -> list[str]:
+        """Réponse en cache, sinon celle de la génération en vol, sinon une nouvelle."""
+        if self._ttl_s <= 0:
+            return await generate()
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return list(cached)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key, generate))
+            task.add_done_callback(_consume_exception)
+            self._inflight[key] = task
+        # shield : un appelant qui abandonne (délai dépassé) n'annule pas les autres
+        return list(await asyncio.shield(task))
+
+    async def _run(self, key: Hashable, generate: Callable[[], Awaitable[list[str]]]) -> list[str]:
+        try:
+            titles = await generate()
+            self._store(key, titles)
+            return titles
+        finally:
+            self._inflight.pop(key, None)
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """Évite « exception never retrieved » si tous les appelants ont abandonné."""
+    if not task.cancelled():
+        task.exception()
+
+
+# ─── Singleton ────────────────────────────────────────────────────────────────
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
@@ -0,0 +1,162 @@
+"""
+Réserve de titres pré-générés par (tranche de score, langue).
+
+Les titres d'une même tranche sont interchangeables : on en garde une réserve,
+réapprovisionnée par une tâche de fond, et /generate y pioche sans attendre le
+GPU. Réserve vide → génération directe. Titres dédupliqués et périmés après
+TITLE_POOL_TTL_S.
+
+Variables optionnelles :
+  TITLE_POOL_SIZE   — titres gardés par (tranche, langue), 0 = désactivé (défaut: 12)
+  TITLE_POOL_TTL_S  — durée de vie d'un titre en réserve (défaut: 600)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Optional
+
+from .inference import NewsTitleGenerator, get_generator, prompt_bucket
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE  = int(os.environ.get("TITLE_POOL_SIZE", "12"))
+POOL_TTL_S = float(os.environ.get("TITLE_POOL_TTL_S", "600"))
+
+POOL_TEMPERATURE = 0.9  # seule température servie depuis la réserve
+REFILL_BATCH = 5        # titres demandés par appel de réapprovisionnement
+RECENT_MEMORY = 200     # titres déjà servis, exclus des réapprovisionnements
+
+PoolKey = str  # identifiant de tranche, ex: "fr:2" (voir prompt_bucket)
+
+
+class _Bucket:
+    """Titres en réserve pour une (tranche, langue)."""
+
+    def __init__(self, score: int, lang: str):
+        self.lang = lang
+        self.score = score  # dernier score demandé, utilisé pour le prompt de refill
+        self.titles: OrderedDict[str, float] = OrderedDict()  # titre -> date de génération
+        self.recent: deque[str] = deque(maxlen=RECENT_MEMORY)
+
+    def drop_stale(self, now: float, ttl_s: float) -> None:
+        while self.titles:
+            title, born = next(iter(self.titles.items()))
+            if now - born < ttl_s:
+                break
+            self.titles.popitem(last=False)
+
+    def take(self, n: int) -> list[str]:
+        taken = []
+        while self.titles and len(taken) < n:
+            title, _ = self.titles.popitem(last=False)
+            self.recent.append(title)
+            taken.append(title)
+        return taken
+
+    def add(self, titles: list[str], now: float, size: int) -> int:
+        added = 0
+        for title in titles:
+            if len(self.titles) >= size:
+                break
+            if title and title not in self.titles and title not in self.recent:
+                self.titles[title] = now
+                added += 1
+        return added
+
+
+class TitlePool:
+    """Réserve par (tranche, langue), alimentée à la demande par une tâche de fond."""
+
+    def __init__(
+        self,
+        generator: NewsTitleGenerator,
+        size: int = POOL_SIZE,
+        ttl_s: float = POOL_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._generator = generator
+        self._size = size
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._buckets: dict[PoolKey, _Bucket] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._size > 0
+
+    def stats(self) -> dict[str, int]:
+        return {key: len(b.titles) for key, b in self._buckets.items()}
+
+    async def generate(self, score: int, lang: str = "fr", n: int = 1, temperature: float = 0.9) -> list[str]:
+        """Titres depuis la réserve, complétés en direct si elle est à sec."""
+        if not self.enabled or temperature != POOL_TEMPERATURE:
+            return await self._generator.generate(score=score, lang=lang, n=n, temperature=temperature)
+
+        key = prompt_bucket(score, lang)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(score, lang)
+        bucket.score = score
+        bucket.drop_stale(self._clock(), self._ttl_s)
+        titles = bucket.take(n)
+        self._wakeup.set()
+
+        if len(titles) < n:
+            live = await self._generator.generate(score=score, lang=lang, n=n - len(titles), temperature=temperature)
+            bucket.recent.extend(live)
+            titles.extend(live)
+        return titles
+
+    # ─── Réapprovisionnement ─────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._refill_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refill_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            for key, bucket in list(self._buckets.items()):
+                await self._refill(key, bucket)
+
+    async def _refill(self, key: PoolKey, bucket: _Bucket) -> None:
+        bucket.drop_stale(self._clock(), self._ttl_s)
+        misses = 0
+        while len(bucket.titles) < self._size and misses < 2:
+            missing = min(REFILL_BATCH, self._size - len(bucket.titles))
+            try:
+                titles = await self._generator.generate(
+                    score=bucket.score, lang=bucket.lang, n=missing, temperature=POOL_TEMPERATURE,
+                )
+            except Exception as e:
+                logger.warning("Réapprovisionnement échoué (tranche %s) : %s", key, e)
+                return
+            if not bucket.add(titles, self._clock(), self._size):
+                misses += 1  # que des doublons : on réessaiera au prochain tirage
+
+
+# ─── Singleton ────────────────────────────────────────────────────────────────
+
+_pool: Optional[TitlePool] = None
+
+
+def get_pool() -> TitlePool:
+    global _pool
+    if _pool is None:
+        _pool = TitlePool(get_generator())
+    return _pool
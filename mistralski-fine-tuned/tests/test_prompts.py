@@ -0,0 +1,47 @@
+"""Tests des tranches de prompt (prompt_bucket) et des messages mis en cache."""
+
+import pytest
+
+from api.inference import USER_PROMPTS, get_messages, prompt_bucket
+
+
+@pytest.mark.parametrize(
+    ("score", "lang", "bucket"),
+    [
+        (0, "fr", "fr:0"),
+        (5, "fr", "fr:0"),
+        (6, "fr", "fr:1"),
+        (15, "fr", "fr:1"),
+        (16, "fr", "fr:2"),
+        (50, "fr", "fr:3"),
+        (69, "fr", "fr:4"),
+        (70, "fr", "fr:5"),
+        (100, "fr", "fr:5"),
+        (5, "en", "en:0"),
+        (6, "en", "en:1"),
+        (30, "en", "en:1"),
+        (31, "en", "en:2"),
+        (69, "en", "en:2"),
+        (70, "en", "en:3"),
+        (70, "de", "en:3"),  # langue inconnue : prompts anglais
+    ],
+)
+def test_bucket_boundaries(score: int, lang: str, bucket: str) -> None:
+    assert prompt_bucket(score, lang) == bucket
+
+
+def test_every_score_has_a_bucket() -> None:
+    for lang in USER_PROMPTS:
+        assert {prompt_bucket(score, lang) for score in range(101)} == {
+            f"{lang}:{i}" for i in range(len(USER_PROMPTS[lang]))
+        }
+
+
+def test_messages_are_built_once_per_score_and_lang() -> None:
+    system, user = get_messages(12, "fr")
+    assert system["role"] == "system" and user["role"] == "user"
+    assert "Score 12/100" in user["content"]
+    assert get_messages(12, "fr") is get_messages(12, "fr")
+    # Même tranche, score différent : même prompt, score propre à chaque message
+    assert prompt_bucket(8, "fr") == prompt_bucket(12, "fr")
+    assert "Score 8/100" in get_messages(8, "fr")[1]["content"]
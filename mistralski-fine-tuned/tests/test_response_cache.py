@@ -0,0 +1,118 @@
+"""Tests du cache de réponses (coalescence single-flight, TTL, LRU)."""
+
+import asyncio
+
+import pytest
+
+from api.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Generation:
+    """Génération factice qui compte ses appels ; `gate` la bloque jusqu'au feu vert."""
+
+    def __init__(self, titles: list[str], gate: asyncio.Event | None = None) -> None:
+        self.titles = titles
+        self.gate = gate
+        self.calls = 0
+
+    async def __call__(self) -> list[str]:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        return list(self.titles)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_generation(clock: FakeClock) -> None:
+    cache = ResponseCache(ttl_s=5.0, clock=clock)
+    gen = Generation(["titre"], gate=asyncio.Event())
+    waiters = [asyncio.create_task(cache.get_or_generate("fr:0", gen)) for _ in range(5)]
+    await asyncio.sleep(0)
+    gen.gate.set()
+    results = await asyncio.gather(*waiters)
+    assert gen.calls == 1
+    assert results == [["titre"]] * 5
+    results[0].append("modifié")  # chaque appelant reçoit sa copie
+    assert await cache.get_or_generate("fr:0", gen) == ["titre"]
+    assert gen.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_responses_expire_after_ttl(clock: FakeClock) -> None:
+    cache = ResponseCache(ttl_s=5.0, clock=clock)
+    gen = Generation(["titre"])
+    await cache.get_or_generate("k", gen)
+    clock.now = 4.9
+    await cache.get_or_generate("k", gen)
+    assert gen.calls == 1
+    clock.now = 5.0
+    await cache.get_or_generate("k", gen)
+    assert gen.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(clock: FakeClock) -> None:
+    cache = ResponseCache(ttl_s=5.0, max_entries=2, clock=clock)
+    gens = {key: Generation([key]) for key in "abc"}
+    await cache.get_or_generate("a", gens["a"])
+    await cache.get_or_generate("b", gens["b"])
+    await cache.get_or_generate("a", gens["a"])  # a redevient la plus récente
+    await cache.get_or_generate("c", gens["c"])
+    assert len(cache) == 2
+    await cache.get_or_generate("a", gens["a"])
+    await cache.get_or_generate("b", gens["b"])
+    assert (gens["a"].calls, gens["b"].calls) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_abandoning_caller_does_not_cancel_the_others(clock: FakeClock) -> None:
+    cache = ResponseCache(ttl_s=5.0, clock=clock)
+    gen = Generation(["titre"], gate=asyncio.Event())
+    impatient = asyncio.create_task(cache.get_or_generate("k", gen))
+    patient = asyncio.create_task(cache.get_or_generate("k", gen))
+    await asyncio.sleep(0)
+    impatient.cancel()
+    await asyncio.sleep(0)
+    gen.gate.set()
+    assert await patient == ["titre"]
+    assert impatient.cancelled()
+    assert gen.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_waiter_and_is_not_cached(clock: FakeClock) -> None:
+    cache = ResponseCache(ttl_s=5.0, clock=clock)
+    gate = asyncio.Event()
+
+    async def failing() -> list[str]:
+        await gate.wait()
+        raise RuntimeError("GPU indisponible")
+
+    waiters = [asyncio.create_task(cache.get_or_generate("k", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(cache) == 0
+    assert await cache.get_or_generate("k", Generation(["reprise"])) == ["reprise"]
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_the_cache(clock: FakeClock) -> None:
+    cache = ResponseCache(ttl_s=0, clock=clock)
+    gen = Generation(["titre"])
+    await asyncio.gather(cache.get_or_generate("k", gen), cache.get_or_generate("k", gen))
+    assert gen.calls == 2
@@ -0,0 +1,109 @@
+"""Tests de la réserve de titres (réapprovisionnement, péremption, dédoublonnage)."""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from api.inference import prompt_bucket
+from api.title_pool import POOL_TEMPERATURE, TitlePool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeGenerator:
+    """Titres uniques numérotés, ou `fixed` répété en boucle."""
+
+    def __init__(self, fixed: list[str] | None = None) -> None:
+        self.fixed = fixed
+        self.calls: list[int] = []  # n demandé à chaque appel
+        self._count = 0
+
+    async def generate(self, score: int, lang: str = "fr", n: int = 1, temperature: float = 0.9) -> list[str]:
+        self.calls.append(n)
+        await asyncio.sleep(0)
+        if self.fixed is not None:
+            return [self.fixed[i % len(self.fixed)] for i in range(n)]
+        titles = [f"titre {self._count + i}" for i in range(n)]
+        self._count += n
+        return titles
+
+
+async def _wait_for(condition: Callable[[], bool]) -> None:
+    async def poll() -> None:
+        while not condition():
+            await asyncio.sleep(0)
+    await asyncio.wait_for(poll(), timeout=1.0)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.mark.asyncio
+async def test_refills_after_each_draw_and_serves_from_reserve(clock: FakeClock) -> None:
+    gen = FakeGenerator()
+    pool = TitlePool(gen, size=4, ttl_s=60.0, clock=clock)
+    key = prompt_bucket(5, "fr")
+    pool.start()
+    try:
+        assert await pool.generate(5, "fr") == ["titre 0"]  # réserve vide : en direct
+        await _wait_for(lambda: pool.stats().get(key) == 4)
+        assert gen.calls == [1, 4]
+
+        assert await pool.generate(3, "fr", n=2) == ["titre 1", "titre 2"]  # même tranche
+        assert gen.calls == [1, 4]  # servi depuis la réserve, sans appel
+        await _wait_for(lambda: pool.stats()[key] == 4)  # complété sous le seuil
+        assert gen.calls == [1, 4, 2]
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_stale_titles_are_dropped(clock: FakeClock) -> None:
+    gen = FakeGenerator()
+    pool = TitlePool(gen, size=3, ttl_s=60.0, clock=clock)
+    key = prompt_bucket(90, "en")
+    pool.start()
+    try:
+        await pool.generate(90, "en")
+        await _wait_for(lambda: pool.stats().get(key) == 3)
+        await pool.stop()  # pas de réapprovisionnement pendant la vérification
+
+        clock.now = 61.0
+        assert await pool.generate(90, "en", n=2) == ["titre 4", "titre 5"]
+        assert pool.stats()[key] == 0
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_refill_skips_duplicates_and_served_titles(clock: FakeClock) -> None:
+    gen = FakeGenerator(fixed=["A", "B"])
+    pool = TitlePool(gen, size=4, ttl_s=60.0, clock=clock)
+    key = prompt_bucket(50, "fr")
+    pool.start()
+    try:
+        assert await pool.generate(50, "fr") == ["A"]  # en direct, mémorisé comme servi
+        # A (déjà servi) et les doublons de B sont écartés ; deux tours sans nouveauté arrêtent le refill
+        await _wait_for(lambda: len(gen.calls) == 4)
+        assert gen.calls == [1, 4, 3, 3]
+        assert pool.stats()[key] == 1
+        assert await pool.generate(50, "fr") == ["B"]
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_other_temperatures_bypass_the_reserve(clock: FakeClock) -> None:
+    gen = FakeGenerator()
+    pool = TitlePool(gen, size=4, ttl_s=60.0, clock=clock)
+    assert await pool.generate(5, "fr", n=2, temperature=POOL_TEMPERATURE + 0.1) == ["titre 0", "titre 1"]
+    assert pool.stats() == {}
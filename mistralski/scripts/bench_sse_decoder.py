@@ -0,0 +1,113 @@
+"""Micro-benchmark: legacy SSE accumulation vs StreamDeltaDecoder.
+
+Replays recorded Mistral SSE streams (one `data: ...` line per chunk, as
+captured from /v1/chat/completions with stream=true). Without arguments a
+synthetic 8k-token strategize stream (text + a tool call) is used.
+
+Run: cd mistralski && python3 scripts/bench_sse_decoder.py [stream.sse ...]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.agents.llm_stream import JSON_BACKEND, StreamDeltaDecoder
+
+
+def synthetic_stream(tokens: int = 8000) -> list[str]:
+    """A strategize-like stream: reasoning text, then a chunked tool call."""
+    words = ["RESPECTEZ", " MON", " AUTORITAYYY", " !", " Les", " agents", " resistent", "\n"]
+    lines = []
+    for i in range(tokens):
+        chunk = {"choices": [{"index": 0, "delta": {"content": words[i % len(words)]}}]}
+        lines.append("data: " + json.dumps(chunk, ensure_ascii=False))
+    args = json.dumps({"agent_id": "agent_01", "content": "Menace: HIGH " * 30})
+    for i in range(0, len(args), 8):
+        delta = {"index": 0, "function": {"arguments": args[i:i + 8]}}
+        if i == 0:
+            delta.update(
+                id="call_1",
+                function={"name": "update_agent_vision", "arguments": args[:8]},
+            )
+        chunk = {"choices": [{"index": 0, "delta": {"tool_calls": [delta]}}]}
+        lines.append("data: " + json.dumps(chunk))
+    lines.append("data: [DONE]")
+    return lines
+
+
+def legacy_decode(lines: list[str]) -> tuple[str, list[dict]]:
+    """The pre-decoder loop: str += and json.loads per line."""
+    full_content = ""
+    tool_calls_raw: list[dict] = []
+    for line in lines:
+        if not line.startswith("data: "):
+            continue
+        data_str = line[6:].strip()
+        if data_str == "[DONE]":
+            break
+        try:
+            delta = json.loads(data_str)["choices"][0].get("delta", {})
+            token = delta.get("content", "")
+            if token:
+                full_content += token
+            for tc_delta in delta.get("tool_calls") or []:
+                idx = tc_delta.get("index", 0)
+                while len(tool_calls_raw) <= idx:
+                    tool_calls_raw.append({"id": "", "function": {"name": "", "arguments": ""}})
+                tc = tool_calls_raw[idx]
+                if tc_delta.get("id"):
+                    tc["id"] = tc_delta["id"]
+                func = tc_delta.get("function", {})
+                if func.get("name"):
+                    tc["function"]["name"] += func["name"]
+                if func.get("arguments"):
+                    tc["function"]["arguments"] += func["arguments"]
+        except (json.JSONDecodeError, KeyError, IndexError):
+            continue
+    return full_content, tool_calls_raw
+
+
+def decoder_decode(lines: list[str], loads=None) -> tuple[str, list[dict] | None]:
+    decoder = StreamDeltaDecoder(loads) if loads else StreamDeltaDecoder()
+    for line in lines:
+        decoder.feed_line(line)
+        if decoder.done:
+            break
+    return decoder.content, decoder.tool_calls()
+
+
+def bench(name: str, fn, lines: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(lines)
+        best = min(best, time.perf_counter() - t0)
+    print(f"  {name:<28} {best * 1000:8.2f} ms")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("streams", nargs="*", type=Path, help="recorded SSE files")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    streams = {p.name: p.read_text(encoding="utf-8").splitlines() for p in args.streams}
+    if not streams:
+        streams = {"synthetic-8k": synthetic_stream()}
+
+    for name, lines in streams.items():
+        assert legacy_decode(lines)[0] == decoder_decode(lines)[0], "decoders disagree"
+        print(f"{name}: {len(lines)} lines (fast backend: {JSON_BACKEND})")
+        base = bench("legacy (str += / json)", legacy_decode, lines, args.repeat)
+        std = bench("decoder (json)", lambda ls: decoder_decode(ls, json.loads), lines, args.repeat)
+        fast = bench(f"decoder ({JSON_BACKEND})", decoder_decode, lines, args.repeat)
+        print(f"  speedup: {base / std:.2f}x stdlib, {base / fast:.2f}x {JSON_BACKEND}\n")
+
+
+if __name__ == "__main__":
+    main()
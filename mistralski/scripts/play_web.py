@@ -10,7 +10,6 @@ Open: http://localhost:8899
 import asyncio
 import json
 import os
-import shutil
 import sys
 import uuid
 from contextlib import asynccontextmanager
@@ -26,7 +25,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, StreamingResponse
 import uvicorn
 
-from src.agents.game_master_agent import MEMORY_DIR, GameMasterAgent, KIND_BONUSES
+from src.agents.game_master_agent import GameMasterAgent, KIND_BONUSES
+from src.agents.image_pool import ImageWorkerPool
+from src.agents.poster_cache import PosterCache, is_poster_key
+from src.agents.memory_store import CachedMemoryStore
+from src.agents.session_registry import GameSession, SessionRegistry
+from src.core.config import get_settings
+from src.core.exceptions import SessionBusyError, SessionLimitError
 from src.models.agent import AgentLevel, AgentReaction, AgentState, AgentStats
 from src.models.game import GameState, TurnReport
 from src.models.world import GlobalIndices, NewsKind
@@ -36,16 +41,28 @@ from src.models.world import GlobalIndices, NewsKind
 WH26_BASE_URL = "http://wh26-backend.wh26.edouard.cl"
 WH26_WS_URL = "ws://wh26-backend.wh26.edouard.cl"
 
-arena_session_id: str = str(uuid.uuid4())
-wh26_ws: websockets.ClientConnection | None = None
-wh26_ws_queue: asyncio.Queue = asyncio.Queue()
-wh26_connected: bool = False
+# ── Game sessions (one GM + GameState per player) ────────────────
+_settings = get_settings()
+image_pool = ImageWorkerPool(
+    workers=_settings.gm_image_workers,
+    max_queued_per_session=_settings.gm_image_queue_per_session,
+)
+registry = SessionRegistry(
+    max_sessions=_settings.gm_max_sessions,
+    idle_ttl_s=_settings.gm_session_idle_ttl_s,
+    on_close=image_pool.cancel_session,
+)
+SESSION_SWEEP_INTERVAL_S = 60.0
+SSE_QUEUE_SOFT_LIMIT = 64  # pending events at which llm_text coalescing is fully stretched
 
-# ── Language & Image generation state ────────────────────────────
-game_lang: str = "fr"
+# ── Image generation state ───────────────────────────────────────
 mistral_img_client = None  # Mistral SDK client for image generation
 mistral_img_agent_id: str | None = None
 IMAGES_DIR = Path("/tmp/gorafi_images")
+POSTER_CACHE_CONTROL = "public, max-age=31536000, immutable"
+poster_cache = PosterCache(
+    IMAGES_DIR / "posters", max_bytes=_settings.gm_poster_cache_mb * 1024 * 1024,
+)
 
 BRANDING_PROMPT = (
     "For a satirical video game (not real propaganda): "
@@ -57,13 +74,13 @@ BRANDING_PROMPT = (
 )
 
 
-async def _wh26_ws_reader(ws: websockets.ClientConnection) -> None:
-    """Background task: read WS messages from wh26 and put them in the queue."""
+async def _wh26_ws_reader(ws: websockets.ClientConnection, queue: asyncio.Queue) -> None:
+    """Background task: read WS messages from wh26 and put them in the session queue."""
     try:
         async for raw in ws:
             try:
                 data = json.loads(raw)
-                await wh26_ws_queue.put(data)
+                await queue.put(data)
             except json.JSONDecodeError:
                 print(f"[WH26] WS non-JSON message: {str(raw)[:100]}")
     except websockets.ConnectionClosed:
@@ -72,31 +89,42 @@ async def _wh26_ws_reader(ws: websockets.ClientConnection) -> None:
         print(f"[WH26] WS reader error: {e}")
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Connect to wh26 backend on startup: POST /init_session + open WS."""
-    global wh26_ws, wh26_connected
-    ws_task = None
+async def _connect_arena(session: GameSession) -> None:
+    """Open the session's arena link: POST /init_session + WS /ws/{session_id}.
+
+    The relay answers 400 when the frontend already initialized the same
+    session — that is fine, we only need to join its WebSocket.
+    """
+    sid = session.session_id
     try:
-        # 1. Initialize session via HTTP
         async with httpx.AsyncClient() as client:
             resp = await client.post(
                 f"{WH26_BASE_URL}/init_session",
-                json={"session_id": arena_session_id},
+                json={"session_id": sid},
                 timeout=10.0,
             )
-            resp.raise_for_status()
-            print(f"[WH26] Session initialized: {arena_session_id}")
-
-        # 2. Open WebSocket
-        wh26_ws = await websockets.connect(f"{WH26_WS_URL}/ws/{arena_session_id}")
-        wh26_connected = True
-        ws_task = asyncio.create_task(_wh26_ws_reader(wh26_ws))
-        print(f"[WH26] WebSocket connected: /ws/{arena_session_id}")
+            if not (resp.status_code == 400 and "already exists" in resp.text):
+                resp.raise_for_status()
+            print(f"[WH26] Session initialized: {sid}")
+
+        session.arena_ws = await websockets.connect(f"{WH26_WS_URL}/ws/{sid}")
+        session.arena_connected = True
+        session.arena_task = asyncio.create_task(
+            _wh26_ws_reader(session.arena_ws, session.arena_queue),
+        )
+        print(f"[WH26] WebSocket connected: /ws/{sid}")
     except Exception as e:
-        print(f"[WH26] Connection failed ({e}) — running without arena")
-        wh26_ws = None
-        wh26_connected = False
+        print(f"[WH26] Connection failed for {sid} ({e}) — running without arena")
+        session.arena_ws = None
+        session.arena_connected = False
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the image agent and start the idle-session sweeper and image workers."""
+    sweeper = asyncio.create_task(registry.run_sweeper(SESSION_SWEEP_INTERVAL_S))
+    image_pool.start()
+    await asyncio.to_thread(poster_cache.load)
 
     # Create Mistral image generation agent via SDK
     global mistral_img_client, mistral_img_agent_id
@@ -104,8 +132,7 @@ async def lifespan(app: FastAPI):
         from mistralai import Mistral
         api_key = os.environ.get("MISTRAL_API_KEY", "")
         if not api_key:
-            from src.core.config import get_settings
-            api_key = get_settings().mistral_api_key.get_secret_value()
+            api_key = _settings.mistral_api_key.get_secret_value()
         mistral_img_client = Mistral(api_key=api_key)
         agent = mistral_img_client.beta.agents.create(
             model="mistral-medium-2505",
@@ -120,11 +147,10 @@ async def lifespan(app: FastAPI):
         mistral_img_agent_id = None
 
     yield
-    if wh26_ws:
-        await wh26_ws.close()
-        print("[WH26] WebSocket closed")
-    if ws_task:
-        ws_task.cancel()
+    sweeper.cancel()
+    await registry.close_all()
+    await image_pool.close()
+    print("[GM] All sessions closed")
 
 
 # ── App state ────────────────────────────────────────────────────
@@ -137,13 +163,6 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-gm: GameMasterAgent | None = None
-game_state: GameState | None = None
-current_proposal = None
-last_choice = None
-last_strategy = None
-manipulation_history: list[dict] = []
-
 AGENTS_INIT = [
     AgentState(
         agent_id="agent_01", name="Jean-Michel Vérity",
@@ -183,71 +202,83 @@ def _clamp(val: float, lo: float = 0.0, hi: float = 100.0) -> float:
     return max(lo, min(hi, val))
 
 
+def _session_not_found(session_id: str) -> JSONResponse:
+    return JSONResponse({"error": f"unknown session {session_id}"}, status_code=404)
+
+
 # ── Image generation ─────────────────────────────────────────────
 
+def _render_poster(prompt: str, out_path: Path) -> int:
+    """Blocking SDK round trip (agent conversation + file download), run on the image pool.
+
+    Returns:
+        Size of the written PNG in bytes, or 0 if the agent returned no image.
+    """
+    resp = mistral_img_client.beta.conversations.start(
+        agent_id=mistral_img_agent_id,
+        inputs=prompt,
+    )
+
+    # Extract file_id from response outputs
+    file_id = None
+    for output in resp.outputs:
+        if output.type == "message.output":
+            for block in output.content:
+                if block.type == "tool_file":
+                    file_id = block.file_id
+                    break
+        if file_id:
+            break
+    if not file_id:
+        return 0
+
+    # Download the generated image and save to disk
+    file_resp = mistral_img_client.files.download(file_id=file_id)
+    image_bytes = file_resp.read() if hasattr(file_resp, "read") else file_resp
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_bytes(image_bytes)
+    return len(image_bytes)
+
+
 async def generate_propaganda_image(title: str, kind: str, session_id: str) -> str | None:
     """Generate a propaganda poster via Mistral SDK (Agent API + Flux).
 
     Uses client.beta.conversations.start() which handles the full agentic loop
-    (tool call → image generation → file return) in a single call.
+    (tool call → image generation → file return) in a single call. The
+    blocking SDK calls run on the dedicated image pool, queued fairly
+    across sessions. Posters are content-addressed: a prompt already
+    rendered (by any session) is served from the poster cache.
 
     Args:
         title: News headline to illustrate.
         kind: News kind (real/fake/satirical).
-        session_id: Game session ID for file organization.
+        session_id: Game session that pays for the render in the image queue.
 
     Returns:
-        URL path like /api/images/{session_id}/{kind}.png, or None on failure.
+        Immutable URL path like /api/images/posters/{sha256}.png, or None on failure.
+
+    Raises:
+        asyncio.CancelledError: If the session moved on before the job ran.
     """
     if not mistral_img_client or not mistral_img_agent_id:
         return None
 
     prompt = BRANDING_PROMPT.format(subject=title)
 
-    try:
-        # Run in thread to avoid blocking the event loop (SDK is sync)
-        loop = asyncio.get_event_loop()
-        resp = await loop.run_in_executor(
-            None,
-            lambda: mistral_img_client.beta.conversations.start(
-                agent_id=mistral_img_agent_id,
-                inputs=prompt,
-            ),
-        )
-
-        # Extract file_id from response outputs
-        file_id = None
-        for output in resp.outputs:
-            if output.type == "message.output":
-                for block in output.content:
-                    if block.type == "tool_file":
-                        file_id = block.file_id
-                        break
-            if file_id:
-                break
-
-        if not file_id:
+    async def render(out_path: Path) -> int:
+        size = await image_pool.submit(session_id, lambda: _render_poster(prompt, out_path))
+        if size:
+            print(f"[IMG] {kind} saved ({size} bytes)")
+        else:
             print(f"[IMG] No file_id in response for {kind}")
-            return None
-
-        # Download the generated image
-        file_resp = await loop.run_in_executor(
-            None,
-            lambda: mistral_img_client.files.download(file_id=file_id),
-        )
-        image_bytes = file_resp.read() if hasattr(file_resp, "read") else file_resp
-
-        # Save to disk
-        out_dir = IMAGES_DIR / session_id
-        out_dir.mkdir(parents=True, exist_ok=True)
-        out_path = out_dir / f"{kind}.png"
-        out_path.write_bytes(image_bytes)
-        print(f"[IMG] {kind} saved ({len(image_bytes)} bytes)")
-        return f"/api/images/{session_id}/{kind}.png"
+        return size
 
+    try:
+        digest = await poster_cache.get_or_create(prompt, render)
     except Exception as e:
         print(f"[IMG] Generation failed for {kind}: {e}")
         return None
+    return f"/api/images/posters/{digest}.png" if digest else None
 
 
 # ── SSE streaming helpers ────────────────────────────────────────
@@ -263,6 +294,12 @@ async def _run_with_events(coro_factory, queue: asyncio.Queue):
         await queue.put(None)  # sentinel
 
 
+async def _run_pinned(session: GameSession, run) -> None:
+    """Run a streamed job while pinning its session against idle eviction."""
+    with session.in_use():
+        await run()
+
+
 async def _sse_generator(queue: asyncio.Queue):
     """Yield SSE events from queue."""
     while True:
@@ -356,7 +393,7 @@ body { background:#0a0a0a; color:#c0c0c0; font-family:'Courier New',monospace; f
 <script>
 const out = document.getElementById("out");
 const bar = document.getElementById("bar");
-let turn = 0, maxTurns = 10;
+let turn = 0, maxTurns = 10, sessionId = "";
 
 function log(html, cls) {
   const d = document.createElement("div");
@@ -375,13 +412,14 @@ document.getElementById("startBtn").addEventListener("click", async function() {
   try {
     const r = await fetch("/api/start");
     const d = await r.json();
+    sessionId = d.session_id;
     turn = d.turn;
     maxTurns = d.max_turns;
     document.getElementById("turnInfo").textContent = "TOUR " + turn + "/" + maxTurns;
     document.getElementById("decInfo").textContent = "DEC: " + Math.round(d.decerebration);
 
     log("== TOUR " + turn + " — Le Game Master reflechit... ==", "line-phase");
-    await streamSSE("/api/stream/propose");
+    await streamSSE("/api/stream/propose?session_id=" + sessionId);
   } catch(e) {
     log("ERREUR: " + e.message, "line-error");
   }
@@ -501,10 +539,10 @@ function showChoices(proposal) {
 async function pick(kind) {
   bar.innerHTML = '<span style="color:#555">Resolution...</span>';
   log("--- CHOIX: " + kind.toUpperCase() + " ---", "line-phase");
-  await streamSSE("/api/stream/choose?kind=" + kind);
+  await streamSSE("/api/stream/choose?session_id=" + sessionId + "&kind=" + kind);
 
   try {
-    var r = await fetch("/api/state");
+    var r = await fetch("/api/state?session_id=" + sessionId);
     var st = await r.json();
     if (st.ended) return;
     turn = st.turn;
@@ -519,7 +557,7 @@ async function nextTurn() {
   bar.innerHTML = '<span style="color:#555">...</span>';
   log("", "");
   log("== TOUR " + turn + " — Le Game Master reflechit... ==", "line-phase");
-  await streamSSE("/api/stream/propose");
+  await streamSSE("/api/stream/propose?session_id=" + sessionId);
 }
 </script>
 </body></html>"""
@@ -533,43 +571,80 @@ async def index():
 
 
 @app.get("/api/wh26")
-async def api_wh26():
-    """Monitor wh26 backend connection state."""
+async def api_wh26(session_id: str | None = None):
+    """Monitor wh26 backend connection state (per session, or worker-wide)."""
+    if session_id is not None:
+        session = registry.get(session_id)
+        if not session:
+            return _session_not_found(session_id)
+        return {
+            "connected": session.arena_connected,
+            "wh26_url": WH26_BASE_URL,
+            "arena_session_id": session_id,
+        }
     return {
-        "connected": wh26_connected,
         "wh26_url": WH26_BASE_URL,
-        "arena_session_id": arena_session_id,
+        "active_sessions": len(registry),
+        "max_sessions": registry.max_sessions,
+        "connected_sessions": sum(1 for s in registry.sessions() if s.arena_connected),
     }
 
 
 @app.get("/api/start")
-async def api_start(lang: str = Query("fr", regex="^(fr|en)$")):
-    global gm, game_state, game_lang, manipulation_history
-    game_lang = lang
-    manipulation_history = []
-    if MEMORY_DIR.exists():
-        shutil.rmtree(MEMORY_DIR)
-    gm = GameMasterAgent()
+async def api_start(
+    session_id: str | None = Query(None, regex=r"^[a-zA-Z0-9][a-zA-Z0-9_-]{0,63}$"),
+    lang: str = Query("fr", regex="^(fr|en)$"),
+):
+    """Create (or restart) a game session. Other players' games are untouched."""
+    session_id = session_id or str(uuid.uuid4())
+    memory = CachedMemoryStore.for_session(session_id)
     game_state = GameState(
         turn=1, max_turns=10,
         indices=GlobalIndices(),
         agents=[a.model_copy() for a in AGENTS_INIT],
         indice_mondial_decerebration=0.0,
     )
+    session = GameSession(session_id, GameMasterAgent(memory=memory), game_state, lang=lang)
+    try:
+        await registry.add(session)
+    except SessionBusyError as e:
+        await session.gm.close()  # the namespace still belongs to the running game
+        return JSONResponse({"error": str(e)}, status_code=409)
+    except SessionLimitError as e:
+        await session.close()
+        return JSONResponse({"error": str(e)}, status_code=503)
+    # Only now: the previous game with this id has flushed and released the namespace
+    await memory.aclear()
+    await _connect_arena(session)
     return {
-        "session_id": arena_session_id,
+        "session_id": session_id,
         "turn": game_state.turn,
         "max_turns": game_state.max_turns,
         "indices": game_state.indices.model_dump(),
         "decerebration": game_state.indice_mondial_decerebration,
         "agents": [a.model_dump() for a in game_state.agents],
-        "lang": game_lang,
+        "lang": session.lang,
     }
 
 
+def _queue_pressure(queue: asyncio.Queue):
+    """Backpressure signal for the GM: how far the SSE consumer lags behind.
+
+    Only this worker's SSE queue is visible here. Behind the relay it stays
+    near 0: the relay reads the stream eagerly and queues frames per
+    WebSocket client, dropping or disconnecting slow ones itself, so a slow
+    browser does not stretch the batches. It mainly matters for direct
+    SSE clients (the built-in page) and a relay that stops reading.
+    """
+    return lambda: min(1.0, queue.qsize() / SSE_QUEUE_SOFT_LIMIT)
+
+
 @app.get("/api/state")
-async def api_state():
-    gs = game_state
+async def api_state(session_id: str):
+    session = registry.get(session_id)
+    if not session:
+        return _session_not_found(session_id)
+    gs = session.game_state
     return {
         "turn": gs.turn,
         "max_turns": gs.max_turns,
@@ -581,23 +656,42 @@ async def api_state():
 
 
 @app.get("/api/stream/propose")
-async def stream_propose(lang: str = Query("fr", regex="^(fr|en)$")):
+async def stream_propose(session_id: str, lang: str = Query("fr", regex="^(fr|en)$")):
     """SSE endpoint: run propose_news and stream GM events."""
-    global current_proposal, game_lang
-    game_lang = lang
+    session = registry.get(session_id)
+    if not session:
+        return _session_not_found(session_id)
+    session.lang = lang
     queue: asyncio.Queue = asyncio.Queue()
-    gs = game_state
+    gm = session.gm
+    gs = session.game_state
 
     async def callback(event):
         await queue.put(event)
 
     gm._event_callback = callback
+    gm.stream_pressure = _queue_pressure(queue)
     gm.tool_calls_log.clear()
 
+    # Posters still queued from the previous turn are obsolete
+    image_pool.cancel_session(session_id)
+
+    # Posters start as soon as each headline is final in the stream, so the
+    # Flux latency overlaps with article writing
+    image_tasks: dict[str, asyncio.Task] = {}
+    image_titles: dict[str, str] = {}
+
+    def start_image(kind: str, title: str) -> None:
+        if kind not in image_tasks:
+            image_titles[kind] = title
+            image_tasks[kind] = asyncio.create_task(
+                generate_propaganda_image(title, kind, session_id),
+            )
+
     async def run_propose():
-        global current_proposal
         try:
-            current_proposal = await gm.propose_news(gs, lang=lang)
+            current_proposal = await gm.propose_news(gs, lang=lang, on_headline=start_image)
+            session.current_proposal = current_proposal
 
             # Build GM's hidden recommendation from last strategy
             if gm.strategy_history:
@@ -628,31 +722,37 @@ async def stream_propose(lang: str = Query("fr", regex="^(fr|en)$")):
                 },
             })
 
-            # Generate propaganda images in parallel
-            session_id = arena_session_id
-            img_tasks = [
-                generate_propaganda_image(current_proposal.real.text, "real", session_id),
-                generate_propaganda_image(current_proposal.fake.text, "fake", session_id),
-                generate_propaganda_image(current_proposal.satirical.text, "satirical", session_id),
-            ]
-            images = await asyncio.gather(*img_tasks, return_exceptions=True)
+            # Headlines missed by the stream watcher (or changed by JSON repair) start now
+            for kind in ("real", "fake", "satirical"):
+                final_title = getattr(current_proposal, kind).text
+                if image_titles.get(kind) != final_title:
+                    if kind in image_tasks:
+                        # Also cancels the stale render unless another session awaits it
+                        image_tasks.pop(kind).cancel()
+                    start_image(kind, final_title)
+            images = await asyncio.gather(
+                *(image_tasks[kind] for kind in ("real", "fake", "satirical")),
+                return_exceptions=True,
+            )
             await queue.put({
                 "type": "images",
                 "data": {
-                    "real": images[0] if not isinstance(images[0], (Exception, type(None))) else None,
-                    "fake": images[1] if not isinstance(images[1], (Exception, type(None))) else None,
-                    "satirical": images[2] if not isinstance(images[2], (Exception, type(None))) else None,
+                    kind: url if isinstance(url, str) else None  # None, error or cancelled
+                    for kind, url in zip(("real", "fake", "satirical"), images, strict=True)
                 },
             })
 
             await queue.put({"type": "result", "data": "ok"})
         except Exception as e:
+            for task in image_tasks.values():
+                task.cancel()
             await queue.put({"type": "error", "error": str(e)})
         finally:
             gm._event_callback = None
+            gm.stream_pressure = None
             await queue.put(None)
 
-    asyncio.create_task(run_propose())
+    asyncio.create_task(_run_pinned(session, run_propose))
 
     return StreamingResponse(
         _sse_generator(queue),
@@ -662,19 +762,24 @@ async def stream_propose(lang: str = Query("fr", regex="^(fr|en)$")):
 
 
 @app.get("/api/stream/choose")
-async def stream_choose(kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
+async def stream_choose(session_id: str, kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
     """SSE endpoint: resolve choice, agent reactions, strategize — all streamed."""
-    global last_choice, last_strategy, game_lang
-    game_lang = lang
+    session = registry.get(session_id)
+    if not session:
+        return _session_not_found(session_id)
+    session.lang = lang
     queue: asyncio.Queue = asyncio.Queue()
-    gs = game_state
+    gm = session.gm
+    gs = session.game_state
+    manipulation_history = session.manipulation_history
+    current_proposal = session.current_proposal
     chosen_kind = NewsKind(kind)
 
     async def callback(event):
         await queue.put(event)
 
     async def run_choose():
-        global last_choice, last_strategy
+        prefetch: asyncio.Task | None = None
         try:
             # 0. Track manipulation — what did the GM want vs what the player chose?
             if gm.strategy_history:
@@ -696,16 +801,23 @@ async def stream_choose(kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
             # 1. Resolve choice
             gm._event_callback = None  # no streaming for simple call
             last_choice = await gm.resolve_choice(current_proposal, chosen_kind, lang=lang)
+            session.last_choice = last_choice
             await queue.put({
                 "type": "choice_resolved",
                 "data": {"gm_reaction": last_choice.gm_reaction},
             })
 
+            # Prefetch strategize context while the arena agents debate
+            if _settings.gm_strategy_prefetch:
+                prefetch = asyncio.create_task(gm.preload_memory(
+                    [a.agent_id for a in gs.agents if not a.is_neutralized], gs.turn,
+                ))
+
             # 2. Agent reactions via wh26 backend (fallback to placeholders)
             reactions = []
             agent_outputs: dict[str, dict] = {}
 
-            if wh26_connected and wh26_ws:
+            if session.arena_connected and session.arena_ws:
                 # Submit chosen news to wh26 arena via HTTP POST
                 # wh26 spec: { "session_id": "...", "content": "..." }
                 news_content = last_choice.chosen.text
@@ -716,7 +828,7 @@ async def stream_choose(kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
                         resp = await http_client.post(
                             f"{WH26_BASE_URL}/submit_news",
                             json={
-                                "session_id": arena_session_id,
+                                "session_id": session_id,
                                 "content": news_content,
                             },
                             timeout=10.0,
@@ -725,13 +837,13 @@ async def stream_choose(kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
                     print(f"[WH26] POST /submit_news: {news_content[:80]}")
                     await queue.put({
                         "type": "phase",
-                        "phase": f"wh26: news envoyée à l'arena ({arena_session_id[:8]}...)",
+                        "phase": f"wh26: news envoyée à l'arena ({session_id[:8]}...)",
                     })
 
                     # Drain any stale messages from the WS queue
-                    while not wh26_ws_queue.empty():
+                    while not session.arena_queue.empty():
                         try:
-                            wh26_ws_queue.get_nowait()
+                            session.arena_queue.get_nowait()
                         except asyncio.QueueEmpty:
                             break
 
@@ -746,7 +858,7 @@ async def stream_choose(kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
                             break
                         try:
                             envelope = await asyncio.wait_for(
-                                wh26_ws_queue.get(), timeout=remaining,
+                                session.arena_queue.get(), timeout=remaining,
                             )
                             subject = envelope.get("subject", "")
                             payload = envelope.get("data", {})
@@ -860,6 +972,7 @@ async def stream_choose(kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
             # 4. Strategize (streamed)
             await queue.put({"type": "phase", "phase": "strategize_start"})
             gm._event_callback = callback
+            gm.stream_pressure = _queue_pressure(queue)
             gm.tool_calls_log.clear()
 
             report = TurnReport(
@@ -868,7 +981,9 @@ async def stream_choose(kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
                 agent_reactions=reactions, agents_neutralized=[], agents_promoted=[],
                 decerebration=dec,
             )
-            last_strategy = await gm.strategize(report, lang=lang)
+            preloaded = await prefetch if prefetch else None
+            last_strategy = await gm.strategize(report, lang=lang, preloaded=preloaded)
+            session.last_strategy = last_strategy
 
             await queue.put({
                 "type": "strategy",
@@ -935,10 +1050,13 @@ async def stream_choose(kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
             traceback.print_exc()
             await queue.put({"type": "error", "error": str(e)})
         finally:
+            if prefetch is not None and not prefetch.done():
+                prefetch.cancel()
             gm._event_callback = None
+            gm.stream_pressure = None
             await queue.put(None)
 
-    asyncio.create_task(run_choose())
+    asyncio.create_task(_run_pinned(session, run_choose))
 
     return StreamingResponse(
         _sse_generator(queue),
@@ -947,13 +1065,21 @@ async def stream_choose(kind: str, lang: str = Query("fr", regex="^(fr|en)$")):
     )
 
 
-@app.get("/api/images/{session_id}/{filename}")
-async def serve_image(session_id: str, filename: str):
-    """Serve generated propaganda poster images."""
-    path = IMAGES_DIR / session_id / filename
-    if not path.exists():
+@app.get("/api/metrics/images")
+async def image_metrics():
+    """Image worker pool: queue depth, worker usage, wait/run latency."""
+    return image_pool.stats()
+
+
+@app.get("/api/images/posters/{digest}.png")
+async def serve_poster(digest: str):
+    """Serve a content-addressed poster (immutable, cacheable forever)."""
+    path = poster_cache.lookup(digest) if is_poster_key(digest) else None
+    if path is None:
         return JSONResponse({"error": "not found"}, status_code=404)
-    return FileResponse(path, media_type="image/png")
+    return FileResponse(
+        path, media_type="image/png", headers={"Cache-Control": POSTER_CACHE_CONTROL},
+    )
 
 
 if __name__ == "__main__":
@@ -10,10 +10,10 @@ Architecture:
   Every token is streamed live for a dynamic "agent thinking" experience.
 - Connection pooling: single httpx.AsyncClient reused across all calls
 
-Memory layout:
-- memory/turn_N.json — per-turn log (written by code after each turn)
-- memory/cumulative.json — global stats (written by code after each turn)
-- memory/vision_<agent_id>.md — GM's intuition per agent (written by LLM via tool)
+Memory layout (one MemoryStore namespace per game, see memory_store.py):
+- memory/sessions/<session_id>/turn_N.json — per-turn log (written by code after each turn)
+- memory/sessions/<session_id>/cumulative.json — global stats (written by code after each turn)
+- memory/sessions/<session_id>/vision_<agent_id>.md — GM's intuition per agent (LLM via tool)
 
 Uses mistral-large-latest via Mistral API with function calling + streaming.
 """
@@ -21,13 +21,14 @@ Uses mistral-large-latest via Mistral API with function calling + streaming.
 import asyncio
 import json
 import re
-from collections.abc import Callable
-from pathlib import Path
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
 import structlog
 
+from src.agents.llm_stream import JsonFieldWatcher, StreamDeltaDecoder, TokenCoalescer
+from src.agents.memory_store import MEMORY_DIR, MemoryStore
 from src.core.config import get_settings
 from src.models.game import (
     GameState,
@@ -44,10 +45,15 @@ LANG_NAMES: dict[str, str] = {"fr": "francais", "en": "English"}
 
 MISTRAL_API_URL = "https://api.mistral.ai/v1/chat/completions"
 FINETUNE_TITLE_URL = "http://mistralski-fine-tuned.wh26.edouard.cl:80/generate"
+FINETUNE_TITLE_BATCH_URL = f"{FINETUNE_TITLE_URL}/batch"
+TITLE_BATCH_GRACE_S = 2.0  # network slack on top of the server-side per-kind deadline
 
 # Score mapping for fine-tuned title generator (0=satirical absurd, 100=factual)
 TITLE_SCORES: dict[str, int] = {"real": 85, "fake": 35, "satirical": 5}
 
+# Headline fields of the propose_news JSON, reported as soon as they close
+HEADLINE_PATHS: set[tuple[str, ...]] = {(kind, "text") for kind in TITLE_SCORES}
+
 _JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
 
 MAX_VISION_CHARS = 500
@@ -106,8 +112,6 @@ def _repair_json(text: str) -> str:
         return text
 
 
-MEMORY_DIR = Path("src/agents/game_master/.agents/memory")
-
 # Kind bonuses — fixed game-balance rewards per news type
 KIND_BONUSES: dict[str, dict[str, float]] = {
     "fake": {"chaos": 15.0, "virality": 20.0},
@@ -217,15 +221,34 @@ TOOLS = [
 # Tool execution (server-side)
 # ─────────────────────────────────────────────────────────────────
 
-def _execute_tool(name: str, arguments: dict) -> str:
-    """Execute a GM tool and return the result as string."""
-    MEMORY_DIR.mkdir(parents=True, exist_ok=True)
+# Tools that only read memory — safe to run concurrently in worker threads
+READ_ONLY_TOOLS: frozenset[str] = frozenset({
+    "read_agent_vision", "read_game_memory", "read_turn_log",
+})
+
+
+def _tool_resource(name: str, arguments: dict) -> str:
+    """Memory file a tool touches — calls on the same file keep their order."""
+    if name in ("read_agent_vision", "update_agent_vision"):
+        return f"vision:{arguments.get('agent_id')}"
+    if name == "read_turn_log":
+        return f"turn:{arguments.get('turn')}"
+    return name
+
+
+def _execute_tool(name: str, arguments: dict, store: MemoryStore) -> str:
+    """Execute a GM tool against a game's memory and return the result as string."""
+    try:
+        return _run_tool(name, arguments, store)
+    except ValueError as e:
+        return f"ERREUR: {e}"
 
+
+def _run_tool(name: str, arguments: dict, store: MemoryStore) -> str:
     if name == "read_agent_vision":
         agent_id = arguments["agent_id"]
-        path = MEMORY_DIR / f"vision_{agent_id}.md"
-        if path.exists():
-            content = path.read_text(encoding="utf-8")
+        content = store.load_vision(agent_id)
+        if content is not None:
             if len(content) > MAX_VISION_CHARS:
                 return content[:MAX_VISION_CHARS] + "\n[...truncated]"
             return content
@@ -236,15 +259,14 @@ def _execute_tool(name: str, arguments: dict) -> str:
         content = arguments["content"]
         if len(content) > MAX_VISION_CHARS:
             content = content[:MAX_VISION_CHARS]
-        path = MEMORY_DIR / f"vision_{agent_id}.md"
-        path.write_text(content, encoding="utf-8")
+        store.save_vision(agent_id, content)
         logger.info("gm_tool_vision_updated", agent_id=agent_id, length=len(content))
         return f"Vision de {agent_id} mise a jour ({len(content)} chars)."
 
     if name == "read_game_memory":
-        path = MEMORY_DIR / "cumulative.json"
-        if path.exists():
-            return path.read_text(encoding="utf-8")
+        content = store.read_text("cumulative.json")
+        if content is not None:
+            return content
         return json.dumps({
             "total_turns": 0, "choices": {"real": 0, "fake": 0, "satirical": 0},
             "total_index_deltas": {}, "most_effective_kind": "fake",
@@ -253,9 +275,9 @@ def _execute_tool(name: str, arguments: dict) -> str:
 
     if name == "read_turn_log":
         turn = arguments["turn"]
-        path = MEMORY_DIR / f"turn_{turn}.json"
-        if path.exists():
-            return path.read_text(encoding="utf-8")
+        content = store.read_text(f"turn_{turn}.json")
+        if content is not None:
+            return content
         return f"Aucun log pour le tour {turn}."
 
     return f"Tool inconnu: {name}"
@@ -265,55 +287,14 @@ def _execute_tool(name: str, arguments: dict) -> str:
 # Memory persistence (code-side)
 # ─────────────────────────────────────────────────────────────────
 
-def _save_turn_memory(turn: int, data: dict) -> None:
-    """Save per-turn memory."""
-    MEMORY_DIR.mkdir(parents=True, exist_ok=True)
-    path = MEMORY_DIR / f"turn_{turn}.json"
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-
-
-def _load_turn_memory(turn: int) -> dict | None:
-    """Load a specific turn's memory."""
-    path = MEMORY_DIR / f"turn_{turn}.json"
-    if path.exists():
-        return json.loads(path.read_text(encoding="utf-8"))
-    return None
-
-
-def _load_cumulative() -> dict:
-    """Load cumulative memory or return empty state."""
-    path = MEMORY_DIR / "cumulative.json"
-    if path.exists():
-        return json.loads(path.read_text(encoding="utf-8"))
-    return {
-        "total_turns": 0,
-        "choices": {"real": 0, "fake": 0, "satirical": 0},
-        "total_index_deltas": {},
-        "most_effective_kind": "fake",
-        "persistent_threats": [],
-        "neutralized_count": 0,
-        "current_decerebration": 0.0,
-        "kind_impact_totals": {"real": 0.0, "fake": 0.0, "satirical": 0.0},
-        "resist_counts": {},
-    }
-
-
-def _save_cumulative(data: dict) -> None:
-    """Save cumulative memory."""
-    MEMORY_DIR.mkdir(parents=True, exist_ok=True)
-    path = MEMORY_DIR / "cumulative.json"
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-
-
-def _load_vision(agent_id: str) -> str:
+def _load_vision(store: MemoryStore, agent_id: str) -> str:
     """Load a vision file, truncated to MAX_VISION_CHARS."""
-    path = MEMORY_DIR / f"vision_{agent_id}.md"
-    if path.exists():
-        content = path.read_text(encoding="utf-8")
-        if len(content) > MAX_VISION_CHARS:
-            return content[:MAX_VISION_CHARS] + "\n[...truncated]"
-        return content
-    return ""
+    content = store.load_vision(agent_id)
+    if content is None:
+        return ""
+    if len(content) > MAX_VISION_CHARS:
+        return content[:MAX_VISION_CHARS] + "\n[...truncated]"
+    return content
 
 
 # ─────────────────────────────────────────────────────────────────
@@ -330,36 +311,44 @@ class PreloadedMemory:
         self.recent_turns: list[dict] = []
 
 
-def _preload_memory(agent_ids: list[str], current_turn: int) -> PreloadedMemory:
+def _preload_memory(
+    store: MemoryStore, agent_ids: list[str], current_turn: int,
+) -> PreloadedMemory:
     """Read all memory files code-side for propose_news fast path."""
     mem = PreloadedMemory()
-    parts: list[str] = []
+    mem.cumulative = store.load_cumulative()
+    for aid in agent_ids:
+        mem.visions[aid] = _load_vision(store, aid)
+
+    start_turn = max(1, current_turn - MAX_RECENT_TURNS)
+    for t in range(start_turn, current_turn):
+        tm = store.load_turn(t)
+        if tm:
+            mem.recent_turns.append(tm)
+
+    _format_preloaded(mem)
+    return mem
 
-    mem.cumulative = _load_cumulative()
+
+def _format_preloaded(mem: PreloadedMemory) -> None:
+    """(Re)build the prompt block from the loaded memory."""
+    parts: list[str] = []
     parts.append("=== MEMOIRE DE PARTIE ===")
     parts.append(json.dumps(mem.cumulative, ensure_ascii=False, indent=2))
 
     parts.append("\n=== FICHES DE VISION AGENTS ===")
-    for aid in agent_ids:
-        vision = _load_vision(aid)
-        mem.visions[aid] = vision
+    for aid, vision in mem.visions.items():
         if vision:
             parts.append(f"--- {aid} ---\n{vision}")
         else:
             parts.append(f"--- {aid} ---\nAUCUNE VISION")
 
-    start_turn = max(1, current_turn - MAX_RECENT_TURNS)
-    for t in range(start_turn, current_turn):
-        tm = _load_turn_memory(t)
-        if tm:
-            mem.recent_turns.append(tm)
     if mem.recent_turns:
         parts.append("\n=== TOURS RECENTS ===")
         for tm in mem.recent_turns:
             parts.append(json.dumps(tm, ensure_ascii=False))
 
     mem.context_str = "\n".join(parts)
-    return mem
 
 
 # ─────────────────────────────────────────────────────────────────
@@ -469,6 +458,14 @@ Quand tu as fini tes analyses et mis a jour tes visions, reponds avec :
 ```"""
 
 
+STRATEGY_PRELOADED_NOTE = """\
+
+MEMOIRE DEJA CHARGEE : ta memoire de partie, tes fiches de vision et les tours \
+recents sont dans le contexte ci-dessous. NE rappelle PAS read_game_memory ni \
+read_agent_vision : saute les etapes 1 et 2, passe directement a l'analyse \
+puis aux update_agent_vision."""
+
+
 # ─────────────────────────────────────────────────────────────────
 # Agent
 # ─────────────────────────────────────────────────────────────────
@@ -481,13 +478,20 @@ class GameMasterAgent:
 
     MAX_TOOL_TURNS = 15
 
-    def __init__(self) -> None:
+    def __init__(self, memory: MemoryStore | None = None) -> None:
         settings = get_settings()
+        self.memory = memory or MemoryStore(MEMORY_DIR)
         self._api_key = settings.mistral_api_key.get_secret_value()
         self._model = settings.mistral_gm_model
         self.strategy_history: list[GMStrategy] = []
         self.tool_calls_log: list[dict] = []
         self._event_callback: Callable[[dict[str, Any]], Any] | None = None
+        # SSE consumer backpressure, 0.0 (idle) .. 1.0 (saturated) — widens llm_text batches
+        self.stream_pressure: Callable[[], float] | None = None
+        self._stream_flush_s = settings.gm_stream_flush_ms / 1000.0
+        self._stream_flush_chars = settings.gm_stream_flush_chars
+        self._title_timeout_s = settings.gm_title_timeout_s
+        self._title_batch_supported = True
         self._http_client: httpx.AsyncClient | None = None
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -499,10 +503,11 @@ class GameMasterAgent:
         return self._http_client
 
     async def close(self) -> None:
-        """Close the shared HTTP client."""
+        """Close the shared HTTP client and flush pending memory writes."""
         if self._http_client and not self._http_client.is_closed:
             await self._http_client.aclose()
             self._http_client = None
+        await self.memory.aclose()
 
     async def _emit(self, event: dict[str, Any]) -> None:
         """Emit an event to the callback if set."""
@@ -519,72 +524,43 @@ class GameMasterAgent:
         self,
         payload: dict,
         headers: dict,
+        on_token: Callable[[str], Awaitable[None]] | None = None,
     ) -> tuple[str, list[dict] | None]:
         """Stream an LLM response, emitting tokens live via SSE.
 
         Returns (content_text, tool_calls_or_none).
         Handles both regular text responses and tool call responses.
+        `on_token` sees every content token as it arrives.
         """
         client = await self._get_client()
-        full_content = ""
-        stream_buffer = ""
-        tool_calls_raw: list[dict] = []
+        decoder = StreamDeltaDecoder()
+        coalescer = TokenCoalescer(
+            interval_s=self._stream_flush_s,
+            max_chars=self._stream_flush_chars,
+            pressure=self.stream_pressure,
+        )
 
         async with client.stream(
             "POST", MISTRAL_API_URL, headers=headers, json=payload,
         ) as resp:
             resp.raise_for_status()
             async for line in resp.aiter_lines():
-                if not line.startswith("data: "):
-                    continue
-                data_str = line[6:].strip()
-                if data_str == "[DONE]":
+                token = decoder.feed_line(line)
+                if decoder.done:
                     break
-                try:
-                    chunk = json.loads(data_str)
-                    delta = chunk["choices"][0].get("delta", {})
-
-                    # Text content
-                    token = delta.get("content", "")
-                    if token:
-                        full_content += token
-                        stream_buffer += token
-                        if len(stream_buffer) >= 60 or "\n" in stream_buffer:
-                            await self._emit({
-                                "type": "llm_text",
-                                "text": stream_buffer,
-                            })
-                            stream_buffer = ""
-
-                    # Tool calls (accumulated across chunks)
-                    tc_deltas = delta.get("tool_calls")
-                    if tc_deltas:
-                        for tc_delta in tc_deltas:
-                            idx = tc_delta.get("index", 0)
-                            while len(tool_calls_raw) <= idx:
-                                tool_calls_raw.append({
-                                    "id": "",
-                                    "function": {"name": "", "arguments": ""},
-                                })
-                            tc = tool_calls_raw[idx]
-                            if "id" in tc_delta and tc_delta["id"]:
-                                tc["id"] = tc_delta["id"]
-                            func = tc_delta.get("function", {})
-                            if func.get("name"):
-                                tc["function"]["name"] += func["name"]
-                            if func.get("arguments"):
-                                tc["function"]["arguments"] += func["arguments"]
-
-                except (json.JSONDecodeError, KeyError, IndexError):
-                    continue
+                if token:
+                    text = coalescer.add(token)
+                    if text:
+                        await self._emit({"type": "llm_text", "text": text})
+                    if on_token:
+                        await on_token(token)
 
         # Flush remaining text
-        if stream_buffer:
-            await self._emit({"type": "llm_text", "text": stream_buffer})
+        text = coalescer.flush()
+        if text:
+            await self._emit({"type": "llm_text", "text": text})
 
-        if tool_calls_raw and tool_calls_raw[0]["function"]["name"]:
-            return full_content, tool_calls_raw
-        return full_content, None
+        return decoder.content, decoder.tool_calls()
 
     # ─────────────────────────────────────────────────────────
     # Core: streamed JSON call (for propose_news)
@@ -596,6 +572,7 @@ class GameMasterAgent:
         user: str,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        on_token: Callable[[str], Awaitable[None]] | None = None,
     ) -> str:
         """Single LLM call with JSON mode + streaming."""
         headers = {
@@ -617,7 +594,7 @@ class GameMasterAgent:
         await self._emit({"type": "phase", "phase": "json_generation"})
         await self._emit({"type": "llm_call", "turn_idx": 0})
 
-        content, _ = await self._stream_llm_response(payload, headers)
+        content, _ = await self._stream_llm_response(payload, headers, on_token)
 
         result = _extract_json(content)
         await self._emit({"type": "phase", "phase": "done"})
@@ -687,65 +664,8 @@ class GameMasterAgent:
             assistant_msg["tool_calls"] = tool_calls
             messages.append(assistant_msg)
 
-            # Execute each tool call
-            for tc in tool_calls:
-                func_name = tc["function"]["name"]
-                try:
-                    func_args = json.loads(tc["function"]["arguments"])
-                except json.JSONDecodeError:
-                    logger.warning(
-                        "gm_tool_args_truncated",
-                        tool=func_name,
-                        args_preview=tc["function"]["arguments"][:100],
-                    )
-                    await self._emit({
-                        "type": "tool_error",
-                        "tool": func_name,
-                        "error": "arguments tronques",
-                    })
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tc["id"],
-                        "name": func_name,
-                        "content": "ERREUR: arguments tronques, reessaie plus court.",
-                    })
-                    continue
-
-                await self._emit({
-                    "type": "tool_call",
-                    "tool": func_name,
-                    "args": func_args,
-                })
-
-                logger.info("gm_tool_call", tool=func_name, args=func_args)
-                result = _execute_tool(func_name, func_args)
-
-                await self._emit({
-                    "type": "tool_result",
-                    "tool": func_name,
-                    "result": result[:1500],
-                })
-
-                if func_name == "update_agent_vision":
-                    await self._emit({
-                        "type": "vision_update",
-                        "agent_id": func_args["agent_id"],
-                        "content": func_args["content"][:500],
-                    })
-
-                self.tool_calls_log.append({
-                    "turn_idx": turn_idx,
-                    "tool": func_name,
-                    "args": func_args,
-                    "result_len": len(result),
-                })
-
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tc["id"],
-                    "name": func_name,
-                    "content": result,
-                })
+            # Execute the tool calls (independent reads run concurrently)
+            messages.extend(await self._execute_tool_calls(tool_calls, turn_idx))
 
         # Phase 2: final streamed JSON call (no tools)
         await self._emit({"type": "phase", "phase": "json_generation"})
@@ -770,6 +690,113 @@ class GameMasterAgent:
         logger.info("gm_agentic_done", content_len=len(result))
         return result
 
+    async def _execute_tool_calls(
+        self, tool_calls: list[dict], turn_idx: int,
+    ) -> list[dict]:
+        """Run one assistant message's tool calls, return tool messages in call order.
+
+        Read-only tools run concurrently in worker threads. A call waits only
+        for earlier calls on the same memory file that it conflicts with
+        (a write waits for everything before it, a read waits for the last
+        write), so update_agent_vision stays serialized per agent.
+        """
+        messages: list[dict | None] = [None] * len(tool_calls)
+        jobs: list[tuple[int, str, dict, asyncio.Task[str]]] = []
+        last_write: dict[str, asyncio.Task[str]] = {}
+        reads_since_write: dict[str, list[asyncio.Task[str]]] = {}
+
+        for pos, tc in enumerate(tool_calls):
+            func_name = tc["function"]["name"]
+            try:
+                func_args = json.loads(tc["function"]["arguments"])
+            except json.JSONDecodeError:
+                logger.warning(
+                    "gm_tool_args_truncated",
+                    tool=func_name,
+                    args_preview=tc["function"]["arguments"][:100],
+                )
+                await self._emit({
+                    "type": "tool_error",
+                    "tool": func_name,
+                    "error": "arguments tronques",
+                })
+                messages[pos] = {
+                    "role": "tool",
+                    "tool_call_id": tc["id"],
+                    "name": func_name,
+                    "content": "ERREUR: arguments tronques, reessaie plus court.",
+                }
+                continue
+
+            await self._emit({
+                "type": "tool_call",
+                "tool": func_name,
+                "args": func_args,
+            })
+            logger.info("gm_tool_call", tool=func_name, args=func_args)
+
+            resource = _tool_resource(func_name, func_args)
+            read_only = func_name in READ_ONLY_TOOLS
+            deps = [t for t in (last_write.get(resource),) if t is not None]
+            if not read_only:
+                deps += reads_since_write.pop(resource, [])
+            task = asyncio.create_task(
+                self._run_tool_after(deps, func_name, func_args, read_only),
+            )
+            if read_only:
+                reads_since_write.setdefault(resource, []).append(task)
+            else:
+                last_write[resource] = task
+            jobs.append((pos, func_name, func_args, task))
+
+        await asyncio.gather(*(task for *_, task in jobs))
+
+        for pos, func_name, func_args, task in jobs:
+            result = task.result()
+            await self._emit({
+                "type": "tool_result",
+                "tool": func_name,
+                "result": result[:1500],
+            })
+
+            if func_name == "update_agent_vision":
+                await self._emit({
+                    "type": "vision_update",
+                    "agent_id": func_args["agent_id"],
+                    "content": func_args["content"][:500],
+                })
+
+            self.tool_calls_log.append({
+                "turn_idx": turn_idx,
+                "tool": func_name,
+                "args": func_args,
+                "result_len": len(result),
+            })
+
+            messages[pos] = {
+                "role": "tool",
+                "tool_call_id": tool_calls[pos]["id"],
+                "name": func_name,
+                "content": result,
+            }
+
+        return [m for m in messages if m is not None]
+
+    async def _run_tool_after(
+        self,
+        deps: list[asyncio.Task[str]],
+        func_name: str,
+        func_args: dict,
+        read_only: bool,
+    ) -> str:
+        """Execute a tool once the calls it depends on have finished."""
+        if deps:
+            await asyncio.wait(deps)
+        if read_only:
+            return await asyncio.to_thread(_execute_tool, func_name, func_args, self.memory)
+        # Writes stay on the event loop thread (the memory cache schedules its flush here)
+        return _execute_tool(func_name, func_args, self.memory)
+
     # ─────────────────────────────────────────────────────────
     # Simple streamed call (for resolve_choice)
     # ─────────────────────────────────────────────────────────
@@ -806,54 +833,99 @@ class GameMasterAgent:
     async def _generate_titles(
         self, lang: str = "fr", n_per_kind: int = 3,
     ) -> dict[str, list[str]]:
-        """Call the fine-tuned title endpoint for each news kind.
+        """Fetch fine-tuned titles for every news kind in one batched call.
+
+        The title API applies the per-kind deadline (GM_TITLE_TIMEOUT_S): a
+        slow or failing kind yields an empty list without holding the others
+        back. Falls back to concurrent per-kind calls if /generate/batch is
+        not deployed (404/405, remembered) or the batch call fails (timeout,
+        5xx, connection error); a deliberate 4xx rejection yields no titles.
 
         Returns dict like {"real": ["title1", ...], "fake": [...], "satirical": [...]}.
-        Falls back to empty lists if the endpoint is unreachable.
         """
+        if self._title_batch_supported:
+            try:
+                return await self._generate_titles_batch(lang, n_per_kind)
+            except Exception as e:
+                status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+                if status in (404, 405):
+                    self._title_batch_supported = False
+                    logger.info("ft_titles_batch_unavailable", status=status)
+                elif status is not None and 400 <= status < 500:
+                    logger.warning("ft_titles_failed", kind="batch", error=str(e))
+                    return {kind: [] for kind in TITLE_SCORES}
+                else:
+                    # Transient: retry this turn per kind, keep using the batch
+                    logger.warning("ft_titles_batch_failed", status=status, error=str(e))
+
+        results = await asyncio.gather(*(
+            self._generate_kind_titles(kind, score, lang, n_per_kind)
+            for kind, score in TITLE_SCORES.items()
+        ))
+        return dict(zip(TITLE_SCORES, results, strict=True))
+
+    async def _generate_titles_batch(self, lang: str, n: int) -> dict[str, list[str]]:
         client = await self._get_client()
+        resp = await client.post(
+            FINETUNE_TITLE_BATCH_URL,
+            json={
+                "requests": [
+                    {"score": score, "lang": lang, "n": n, "temperature": 0.9}
+                    for score in TITLE_SCORES.values()
+                ],
+                "deadline_s": self._title_timeout_s,
+            },
+            timeout=self._title_timeout_s + TITLE_BATCH_GRACE_S,
+        )
+        resp.raise_for_status()
         results: dict[str, list[str]] = {}
+        # A short or empty result list is tolerated: missing kinds get no titles
+        for kind, item in zip(TITLE_SCORES, resp.json().get("results", []), strict=False):
+            results[kind] = item.get("titles", [])
+            if item.get("error"):
+                logger.warning("ft_titles_failed", kind=kind, error=item["error"])
+            else:
+                logger.info(
+                    "ft_titles_generated",
+                    kind=kind, score=item.get("score"), count=len(results[kind]),
+                )
+        for kind in TITLE_SCORES:
+            results.setdefault(kind, [])
+        return results
 
-        for kind, score in TITLE_SCORES.items():
-            try:
+    async def _generate_kind_titles(
+        self, kind: str, score: int, lang: str, n: int,
+    ) -> list[str]:
+        """Titles for one kind, or [] on error / deadline."""
+        client = await self._get_client()
+        try:
+            async with asyncio.timeout(self._title_timeout_s):
                 resp = await client.post(
                     FINETUNE_TITLE_URL,
-                    json={"score": score, "lang": lang, "n": n_per_kind, "temperature": 0.9},
-                    timeout=15.0,
+                    json={"score": score, "lang": lang, "n": n, "temperature": 0.9},
+                    timeout=self._title_timeout_s,
                 )
                 resp.raise_for_status()
-                data = resp.json()
-                results[kind] = data.get("titles", [])
-                logger.info("ft_titles_generated", kind=kind, score=score, count=len(results[kind]))
-            except Exception as e:
-                logger.warning("ft_titles_failed", kind=kind, error=str(e))
-                results[kind] = []
-
-        return results
+                titles = resp.json().get("titles", [])
+        except TimeoutError:
+            logger.warning("ft_titles_timeout", kind=kind, timeout_s=self._title_timeout_s)
+            return []
+        except Exception as e:
+            logger.warning("ft_titles_failed", kind=kind, error=str(e))
+            return []
+        logger.info("ft_titles_generated", kind=kind, score=score, count=len(titles))
+        return titles
 
     # ─────────────────────────────────────────────────────────
-    # 1. Propose 3 news (FAST: pre-loaded memory, single call)
+    # Memory pre-loading (shared by propose_news and strategize)
     # ─────────────────────────────────────────────────────────
 
-    async def propose_news(self, game_state: GameState, lang: str = "fr") -> NewsProposal:
-        """Generate 3 global news proposals — fast path.
+    async def preload_memory(self, agent_ids: list[str], current_turn: int) -> PreloadedMemory:
+        """Read cumulative memory, visions and recent turns off the event loop."""
+        return await asyncio.to_thread(_preload_memory, self.memory, agent_ids, current_turn)
 
-        1. Generate candidate titles via fine-tuned model
-        2. Pre-load memory code-side
-        3. Inject titles + strategy context into Mistral Large for article writing
-        """
-        agent_ids = [
-            a.agent_id for a in game_state.agents if not a.is_neutralized
-        ]
-
-        # Generate fine-tuned titles + pre-load memory in parallel
-        await self._emit({"type": "phase", "phase": "generating_titles"})
-        titles_task = asyncio.create_task(self._generate_titles(lang))
-
-        # Pre-load all memory
-        mem = _preload_memory(agent_ids, game_state.turn)
-
-        # Emit pre-loaded data as SSE events (console visibility)
+    async def _emit_preloaded(self, mem: PreloadedMemory) -> None:
+        """Replay pre-loaded memory as tool events (console visibility)."""
         await self._emit({"type": "phase", "phase": "reading_memory"})
         await self._emit({
             "type": "tool_call", "tool": "read_game_memory", "args": {},
@@ -873,6 +945,40 @@ class GameMasterAgent:
             })
         await self._emit({"type": "phase", "phase": "memory_loaded"})
 
+    # ─────────────────────────────────────────────────────────
+    # 1. Propose 3 news (FAST: pre-loaded memory, single call)
+    # ─────────────────────────────────────────────────────────
+
+    async def propose_news(
+        self,
+        game_state: GameState,
+        lang: str = "fr",
+        on_headline: Callable[[str, str], Any] | None = None,
+    ) -> NewsProposal:
+        """Generate 3 global news proposals — fast path.
+
+        1. Generate candidate titles via fine-tuned model
+        2. Pre-load memory code-side
+        3. Inject titles + strategy context into Mistral Large for article writing
+
+        `on_headline(kind, text)` is called as soon as a headline is final in
+        the stream, long before the articles are written (e.g. to start
+        poster generation early).
+        """
+        agent_ids = [
+            a.agent_id for a in game_state.agents if not a.is_neutralized
+        ]
+
+        # Generate fine-tuned titles + pre-load memory in parallel
+        await self._emit({"type": "phase", "phase": "generating_titles"})
+        titles_task = asyncio.create_task(self._generate_titles(lang))
+
+        # Pre-load all memory
+        mem = await self.preload_memory(agent_ids, game_state.turn)
+
+        # Emit pre-loaded data as SSE events (console visibility)
+        await self._emit_preloaded(mem)
+
         # Await fine-tuned titles
         candidate_titles = await titles_task
         await self._emit({
@@ -934,10 +1040,20 @@ class GameMasterAgent:
             f"{PROPOSE_SYSTEM}"
         )
 
+        on_token = None
+        if on_headline:
+            watcher = JsonFieldWatcher(HEADLINE_PATHS)
+
+            async def on_token(token: str) -> None:
+                for (kind, _), text in watcher.feed(token):
+                    result = on_headline(kind, text)
+                    if asyncio.iscoroutine(result):
+                        await result
+
         logger.info("gm_propose_start", turn=game_state.turn, lang=lang)
         raw = await self._call_json_streamed(
             propose_system, user_msg,
-            temperature=0.8, max_tokens=8192,
+            temperature=0.8, max_tokens=8192, on_token=on_token,
         )
 
         parsed = json.loads(_repair_json(raw))
@@ -1029,7 +1145,12 @@ class GameMasterAgent:
     # 3. Strategize (AGENTIC: full tool loop + streaming)
     # ─────────────────────────────────────────────────────────
 
-    async def strategize(self, report: TurnReport, lang: str = "fr") -> GMStrategy:
+    async def strategize(
+        self,
+        report: TurnReport,
+        lang: str = "fr",
+        preloaded: PreloadedMemory | None = None,
+    ) -> GMStrategy:
         """Full agentic strategize — the GM autonomously:
         1. Reads its memory and vision files via tools (streamed live)
         2. Thinks out loud about what happened (streamed live)
@@ -1037,9 +1158,18 @@ class GameMasterAgent:
         4. Produces its strategy as JSON (streamed live)
 
         Every LLM token is visible in the console in real-time.
+
+        With `preloaded` (see preload_memory, typically started while the
+        arena agents are still debating), step 1 is skipped: the memory is
+        injected in the prompt, saving the read-only tool round trips.
         """
         # Persist turn data first so the LLM can read it
         self._persist_turn(report)
+        if preloaded is not None:
+            # The prefetch ran before this turn was persisted: only its visions
+            # and past turns are reusable, the cumulative stats must be re-read.
+            preloaded.cumulative = self.memory.load_cumulative()
+            _format_preloaded(preloaded)
 
         # Build context with current turn data
         context: dict = {
@@ -1075,11 +1205,19 @@ class GameMasterAgent:
             f"LANGUE : Tous tes outputs en {lang_name}.\n\n"
             f"{STRATEGY_SYSTEM}"
         )
+        user_msg = json.dumps(context, ensure_ascii=False)
+        if preloaded is not None:
+            strategy_system += STRATEGY_PRELOADED_NOTE
+            user_msg += "\n\n" + preloaded.context_str
+            await self._emit_preloaded(preloaded)
 
-        logger.info("gm_strategize_start", turn=report.turn, lang=lang)
+        logger.info(
+            "gm_strategize_start", turn=report.turn, lang=lang,
+            preloaded=preloaded is not None,
+        )
         raw = await self._agentic_call_streamed(
             strategy_system,
-            json.dumps(context, ensure_ascii=False),
+            user_msg,
             tools=TOOLS,
             temperature=0.7,
             max_tokens=8192,
@@ -1145,10 +1283,10 @@ class GameMasterAgent:
             "indices_after": report.indices_after.model_dump(),
             "decerebration": report.decerebration,
         }
-        _save_turn_memory(report.turn, turn_data)
+        self.memory.save_turn(report.turn, turn_data)
 
         # Update cumulative — O(1) incremental
-        cumulative = _load_cumulative()
+        cumulative = self.memory.load_cumulative()
         cumulative["total_turns"] = report.turn
 
         chosen_kind = report.chosen_news.kind.value
@@ -1180,6 +1318,6 @@ class GameMasterAgent:
         ]
 
         cumulative["current_decerebration"] = report.decerebration
-        _save_cumulative(cumulative)
+        self.memory.save_cumulative(cumulative)
 
         logger.info("gm_turn_persisted", turn=report.turn)
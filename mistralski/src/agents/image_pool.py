@@ -0,0 +1,161 @@
+"""Dedicated worker pool for propaganda poster generation.
+
+The Mistral image SDK is synchronous and one poster takes 10-20 s. Running
+it on the default executor starves everything else that relies on
+asyncio.to_thread (memory flushes, DuckDB, news fetches). ImageWorkerPool
+owns a small thread pool instead, queues jobs per session and serves the
+sessions round-robin, so one busy game cannot monopolise every worker.
+Jobs of a session that moved on can be cancelled while still queued.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from src.core.exceptions import ImageQueueFullError
+
+logger = structlog.get_logger(__name__)
+
+LATENCY_SAMPLES = 200
+
+
+@dataclass
+class _Job:
+    fn: Callable[[], Any]
+    future: asyncio.Future  # type: ignore[type-arg]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class ImageWorkerPool:
+    """Bounded, session-fair pool running blocking image jobs off the event loop."""
+
+    def __init__(self, workers: int = 4, max_queued_per_session: int = 6) -> None:
+        self._workers = workers
+        self._max_queued = max_queued_per_session
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gm-image")
+        self._queues: OrderedDict[str, deque[_Job]] = OrderedDict()  # round-robin order
+        self._ready = asyncio.Semaphore(0)  # one permit per queued job
+        self._tasks: list[asyncio.Task] = []  # type: ignore[type-arg]
+        self._running = 0
+        self._counts = {"completed": 0, "failed": 0, "cancelled": 0, "rejected": 0}
+        self._wait_s: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._run_s: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def start(self) -> None:
+        """Spawn the dispatcher tasks (needs a running loop)."""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._dispatch()) for _ in range(self._workers)]
+
+    async def close(self) -> None:
+        """Cancel queued jobs, stop dispatchers and release the threads."""
+        for session_id in list(self._queues):
+            self.cancel_session(session_id)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ── Submission / cancellation ────────────────────────────────
+
+    async def submit(self, session_id: str, fn: Callable[[], Any]) -> Any:
+        """Queue `fn` for `session_id` and wait for its result.
+
+        Raises:
+            asyncio.CancelledError: If the job is cancelled (session moved on)
+                or the caller gives up.
+            ImageQueueFullError: If the session already has too many queued jobs.
+        """
+        queue = self._queues.get(session_id)
+        if queue is None:
+            queue = self._queues[session_id] = deque()
+        if len(queue) >= self._max_queued:
+            self._counts["rejected"] += 1
+            raise ImageQueueFullError(f"Image queue full for session {session_id}")
+        job = _Job(fn, asyncio.get_running_loop().create_future())
+        queue.append(job)
+        self._ready.release()
+        return await job.future
+
+    def cancel_session(self, session_id: str) -> int:
+        """Drop every queued job of a session. Running jobs finish but their result is discarded."""
+        queue = self._queues.pop(session_id, None)
+        if not queue:
+            return 0
+        cancelled = 0
+        for job in queue:
+            if job.future.cancel():
+                cancelled += 1
+        self._counts["cancelled"] += cancelled
+        if cancelled:
+            logger.info("gm_image_jobs_cancelled", session_id=session_id, count=cancelled)
+        return cancelled
+
+    def _next_job(self) -> _Job | None:
+        """Pop the next live job, rotating across sessions."""
+        while self._queues:
+            session_id, queue = next(iter(self._queues.items()))
+            job = queue.popleft()
+            if queue:
+                self._queues.move_to_end(session_id)
+            else:
+                del self._queues[session_id]
+            if not job.future.done():  # skip jobs whose caller gave up
+                return job
+        return None
+
+    # ── Workers ──────────────────────────────────────────────────
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._ready.acquire()
+            job = self._next_job()
+            if job is None:
+                continue  # permit of a job that was cancelled
+            started = time.monotonic()
+            self._wait_s.append(started - job.enqueued_at)
+            self._running += 1
+            try:
+                result = await loop.run_in_executor(self._executor, job.fn)
+            except Exception as e:
+                self._counts["failed"] += 1
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                self._counts["completed"] += 1
+                if not job.future.done():
+                    job.future.set_result(result)
+            finally:
+                self._running -= 1
+                self._run_s.append(time.monotonic() - started)
+
+    # ── Metrics ──────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth, worker usage and wait/run latency (p50/p95 over recent jobs)."""
+        return {
+            "workers": self._workers,
+            "running": self._running,
+            "queued": sum(len(q) for q in self._queues.values()),
+            "queued_sessions": len(self._queues),
+            **self._counts,
+            "wait_s": _percentiles(self._wait_s),
+            "run_s": _percentiles(self._run_s),
+        }
+
+
+def _percentiles(samples: deque[float]) -> dict[str, float] | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return {
+        "p50": round(ordered[len(ordered) // 2], 3),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+    }
@@ -0,0 +1,232 @@
+"""Incremental decoder for Mistral chat-completion SSE streams.
+
+The GM streams every LLM call (up to 8k tokens). Building the text with
+repeated `str +=` is quadratic and every `data:` line is a JSON document,
+so the decoder keeps text and tool-call argument fragments in lists (joined
+once at the end) and parses chunks with the fastest JSON backend available:
+orjson when installed (the `fast` extra), the stdlib otherwise.
+
+TokenCoalescer turns the token stream into a few llm_text events per second
+instead of one every ~60 chars. JsonFieldWatcher reports JSON string fields
+(e.g. headline texts) the moment they close, before the document is complete.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    _loads: Callable[[str | bytes], Any] = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
+    JSON_BACKEND = "json"
+
+# json.JSONDecodeError and orjson.JSONDecodeError both derive from ValueError
+_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON with the fastest available backend."""
+    return _loads(data)
+
+
+class _ToolCallParts:
+    """Tool-call fragments accumulated across chunks."""
+
+    __slots__ = ("id", "name", "arguments")
+
+    def __init__(self) -> None:
+        self.id = ""
+        self.name: list[str] = []
+        self.arguments: list[str] = []
+
+
+class StreamDeltaDecoder:
+    """Feed SSE lines, get content tokens back; join everything once at the end."""
+
+    def __init__(self, loads: Callable[[str | bytes], Any] = _loads) -> None:
+        self._loads = loads
+        self._content: list[str] = []
+        self._tool_calls: list[_ToolCallParts] = []
+        self.done = False
+
+    def feed_line(self, line: str) -> str:
+        """Decode one SSE line and return its content token ("" if none)."""
+        if not line.startswith("data: "):
+            return ""
+        data = line[6:].strip()
+        if data == "[DONE]":
+            self.done = True
+            return ""
+        try:
+            delta = self._loads(data)["choices"][0].get("delta") or {}
+        except (ValueError, KeyError, IndexError, TypeError):  # ValueError: see _DECODE_ERRORS
+            return ""
+
+        tc_deltas = delta.get("tool_calls")
+        if tc_deltas:
+            self._feed_tool_calls(tc_deltas)
+
+        token = delta.get("content") or ""
+        if token and isinstance(token, str):
+            self._content.append(token)
+            return token
+        return ""
+
+    def _feed_tool_calls(self, tc_deltas: list[dict[str, Any]]) -> None:
+        for tc_delta in tc_deltas:
+            idx = tc_delta.get("index", 0)
+            while len(self._tool_calls) <= idx:
+                self._tool_calls.append(_ToolCallParts())
+            tc = self._tool_calls[idx]
+            if tc_delta.get("id"):
+                tc.id = tc_delta["id"]
+            func = tc_delta.get("function") or {}
+            if func.get("name"):
+                tc.name.append(func["name"])
+            if func.get("arguments"):
+                tc.arguments.append(func["arguments"])
+
+    @property
+    def content(self) -> str:
+        return "".join(self._content)
+
+    def tool_calls(self) -> list[dict[str, Any]] | None:
+        """Accumulated tool calls in Mistral message format, or None."""
+        calls: list[dict[str, Any]] = [
+            {
+                "id": tc.id,
+                "function": {"name": "".join(tc.name), "arguments": "".join(tc.arguments)},
+            }
+            for tc in self._tool_calls
+        ]
+        if calls and calls[0]["function"]["name"]:
+            return calls
+        return None
+
+
+class TokenCoalescer:
+    """Batch streamed tokens into few llm_text events.
+
+    A batch is flushed once `max_chars` are buffered or `interval_s` has
+    elapsed since its first token. `pressure` (0.0 = idle .. 1.0 = consumer
+    saturated) stretches both limits up to `MAX_STRETCH` times, so a slow
+    consumer of the GM's SSE stream receives fewer, bigger events. WebSocket
+    clients behind the relay are not part of that signal.
+    """
+
+    MAX_STRETCH = 8.0
+
+    def __init__(
+        self,
+        interval_s: float = 0.05,
+        max_chars: int = 512,
+        pressure: Callable[[], float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._interval_s = interval_s
+        self._max_chars = max_chars
+        self._pressure = pressure
+        self._clock = clock
+        self._parts: list[str] = []
+        self._size = 0
+        self._started = 0.0
+
+    def _stretch(self) -> float:
+        if self._pressure is None:
+            return 1.0
+        p = min(1.0, max(0.0, self._pressure()))
+        return 1.0 + (self.MAX_STRETCH - 1.0) * p
+
+    def add(self, token: str) -> str | None:
+        """Buffer a token; return the batch text when it is time to emit it."""
+        if not self._parts:
+            self._started = self._clock()
+        self._parts.append(token)
+        self._size += len(token)
+        stretch = self._stretch()
+        if (
+            self._size >= self._max_chars * stretch
+            or self._clock() - self._started >= self._interval_s * stretch
+        ):
+            return self.flush()
+        return None
+
+    def flush(self) -> str | None:
+        """Return whatever is buffered (None if empty) and reset."""
+        if not self._parts:
+            return None
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        return text
+
+
+class JsonFieldWatcher:
+    """Spot string fields of a JSON document while it is still streaming.
+
+    Feed raw text chunks (split anywhere); `feed` returns the (path, value)
+    pairs of watched string fields that closed in that chunk, e.g.
+    (("fake", "text"), "Le Sénat interdit..."). Text before the first `{`
+    (a ```json fence) is ignored. Only tracks structure — the full document
+    is still parsed once at the end.
+    """
+
+    def __init__(self, paths: set[tuple[str, ...]]) -> None:
+        self._paths = paths
+        self._started = False
+        self._stack: list[str | None] = []  # per container: current key (None = array)
+        self._expect_key = False
+        self._in_string = False
+        self._escaped = False
+        self._string: list[str] = []
+
+    def feed(self, chunk: str) -> list[tuple[tuple[str, ...], str]]:
+        found: list[tuple[tuple[str, ...], str]] = []
+        for ch in chunk:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._close_string(found)
+                    continue
+                self._string.append(ch)
+            elif ch == '"':
+                if self._started:
+                    self._in_string = True
+                    self._string.clear()
+            elif ch == "{":
+                self._started = True
+                self._stack.append(None)
+                self._expect_key = True
+            elif ch == "[":
+                if self._started:
+                    self._stack.append(None)
+                    self._expect_key = False
+            elif ch in "}]":
+                if self._stack:
+                    self._stack.pop()
+                self._expect_key = False
+            elif ch == ",":
+                self._expect_key = bool(self._stack) and self._stack[-1] is not None
+        return found
+
+    def _close_string(self, found: list[tuple[tuple[str, ...], str]]) -> None:
+        raw = "".join(self._string)
+        if self._expect_key:
+            self._stack[-1] = raw  # raw key: watched keys are plain ASCII
+            self._expect_key = False
+            return
+        path = tuple(k for k in self._stack if k is not None)
+        if path in self._paths and len(path) == len(self._stack):
+            try:
+                found.append((path, loads(f'"{raw}"')))
+            except _DECODE_ERRORS:
+                found.append((path, raw))
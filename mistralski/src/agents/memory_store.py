@@ -0,0 +1,290 @@
+"""File-backed GM memory, namespaced per game session.
+
+Layout of one namespace (see game_master_agent for the semantics):
+- turn_N.json — per-turn log
+- cumulative.json — global stats
+- vision_<agent_id>.md — GM's intuition per agent
+
+Every write goes through a temp file + os.replace so a reader never sees a
+half-written file, even with several games running on the same host.
+
+CachedMemoryStore keeps a game's memory in RAM and flushes dirty files to
+disk in background batches, so the turn hot path never blocks on file I/O.
+"""
+
+import asyncio
+import contextlib
+import copy
+import json
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+MEMORY_DIR = Path("src/agents/game_master/.agents/memory")
+SESSIONS_SUBDIR = "sessions"
+
+_SAFE_NAME_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_.-]{0,127}$")
+
+
+def _check_name(name: str) -> str:
+    """Reject names that could escape the namespace directory."""
+    if not _SAFE_NAME_RE.match(name) or ".." in name:
+        raise ValueError(f"invalid memory name: {name!r}")
+    return name
+
+
+def empty_cumulative() -> dict:
+    """Cumulative memory of a game that has not played any turn yet."""
+    return {
+        "total_turns": 0,
+        "choices": {"real": 0, "fake": 0, "satirical": 0},
+        "total_index_deltas": {},
+        "most_effective_kind": "fake",
+        "persistent_threats": [],
+        "neutralized_count": 0,
+        "current_decerebration": 0.0,
+        "kind_impact_totals": {"real": 0.0, "fake": 0.0, "satirical": 0.0},
+        "resist_counts": {},
+    }
+
+
+class MemoryStore:
+    """One game's memory directory with atomic writes."""
+
+    def __init__(self, root: Path = MEMORY_DIR) -> None:
+        self.root = Path(root)
+
+    @classmethod
+    def for_session(cls, session_id: str, base_dir: Path = MEMORY_DIR) -> "MemoryStore":
+        """Memory namespace of a single game session."""
+        return cls(Path(base_dir) / SESSIONS_SUBDIR / _check_name(session_id))
+
+    # ── Raw file access ──────────────────────────────────────────
+
+    def _path(self, name: str) -> Path:
+        return self.root / _check_name(name)
+
+    def read_text(self, name: str) -> str | None:
+        """Return a file's content, or None if it does not exist."""
+        path = self._path(name)
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def write_text(self, name: str, content: str) -> None:
+        """Atomically replace a file's content."""
+        path = self._path(name)
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def read_json(self, name: str) -> Any | None:
+        text = self.read_text(name)
+        return json.loads(text) if text is not None else None
+
+    def write_json(self, name: str, data: Any) -> None:
+        self.write_text(name, json.dumps(data, ensure_ascii=False, indent=2))
+
+    def clear(self) -> None:
+        """Delete the whole namespace."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    async def aclear(self) -> None:
+        """Delete the whole namespace without blocking the event loop."""
+        await asyncio.to_thread(self.clear)
+
+    async def aclose(self) -> None:
+        """Release resources (nothing to do for the plain file store)."""
+
+    # ── Typed helpers ────────────────────────────────────────────
+
+    def load_turn(self, turn: int) -> dict | None:
+        return self.read_json(f"turn_{turn}.json")
+
+    def save_turn(self, turn: int, data: dict) -> None:
+        self.write_json(f"turn_{turn}.json", data)
+
+    def load_cumulative(self) -> dict:
+        return self.read_json("cumulative.json") or empty_cumulative()
+
+    def save_cumulative(self, data: dict) -> None:
+        self.write_json("cumulative.json", data)
+
+    def load_vision(self, agent_id: str) -> str | None:
+        return self.read_text(f"vision_{agent_id}.md")
+
+    def save_vision(self, agent_id: str, content: str) -> None:
+        self.write_text(f"vision_{agent_id}.md", content)
+
+
+class CachedMemoryStore(MemoryStore):
+    """Write-back cache over a MemoryStore namespace.
+
+    Reads are served from RAM (raw text and parsed JSON are both cached);
+    writes update RAM, mark the file dirty and schedule a debounced flush
+    that writes every dirty file in one worker-thread batch. Outside a
+    running event loop, writes go straight to disk.
+    """
+
+    def __init__(self, root: Path = MEMORY_DIR, flush_delay_s: float = 0.5) -> None:
+        super().__init__(root)
+        self._flush_delay_s = flush_delay_s
+        self._text: dict[str, str | None] = {}  # None = known to be absent
+        self._parsed: dict[str, Any] = {}
+        self._dirty: set[str] = set()
+        self._flush_task: asyncio.Task | None = None  # type: ignore[type-arg]
+        self._writes: set[asyncio.Task[None]] = set()  # batches running in worker threads
+        self._complete = False  # True once RAM mirrors the whole namespace
+
+    # ── Loading ──────────────────────────────────────────────────
+
+    def _read_all(self) -> dict[str, str]:
+        if not self.root.is_dir():
+            return {}
+        return {
+            p.name: p.read_text(encoding="utf-8")
+            for p in self.root.iterdir()
+            if p.is_file() and not p.name.startswith(".")
+        }
+
+    async def load(self) -> None:
+        """Mirror the whole namespace into RAM (one worker-thread read)."""
+        files = await asyncio.to_thread(self._read_all)
+        for name, content in files.items():
+            self._text.setdefault(name, content)
+        self._complete = True
+
+    # ── Reads ────────────────────────────────────────────────────
+
+    def read_text(self, name: str) -> str | None:
+        if name in self._text:
+            return self._text[name]
+        if self._complete:
+            _check_name(name)
+            return None
+        content = super().read_text(name)
+        self._text[name] = content
+        return content
+
+    def read_json(self, name: str) -> Any | None:
+        if name not in self._parsed:
+            text = self.read_text(name)
+            if text is None:
+                return None
+            self._parsed[name] = json.loads(text)
+        return copy.deepcopy(self._parsed[name])
+
+    # ── Writes ───────────────────────────────────────────────────
+
+    def write_text(self, name: str, content: str) -> None:
+        _check_name(name)
+        self._text[name] = content
+        self._parsed.pop(name, None)
+        self._mark_dirty(name)
+
+    def write_json(self, name: str, data: Any) -> None:
+        _check_name(name)
+        self._text[name] = json.dumps(data, ensure_ascii=False, indent=2)
+        self._parsed[name] = copy.deepcopy(data)
+        self._mark_dirty(name)
+
+    def _mark_dirty(self, name: str) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            super().write_text(name, self._text[name] or "")
+            return
+        self._dirty.add(name)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_delay_s)
+        # Writes landing during a flush are picked up by the next pass
+        with contextlib.suppress(Exception):  # logged in flush(), retried next write
+            while self._dirty:
+                await self.flush()
+
+    def _write_batch(self, batch: list[tuple[str, str]]) -> None:
+        for name, content in batch:
+            MemoryStore.write_text(self, name, content)
+
+    async def flush(self) -> None:
+        """Write every dirty file to disk now."""
+        if not self._dirty:
+            return
+        names = sorted(self._dirty)
+        self._dirty.clear()
+        batch = [(n, self._text[n] or "") for n in names]
+        # A worker thread cannot be stopped: the batch runs in its own task so
+        # that aclear() can wait for it even when this flush is cancelled.
+        write = asyncio.create_task(asyncio.to_thread(self._write_batch, batch))
+        self._writes.add(write)
+        write.add_done_callback(self._write_done)
+        try:
+            await asyncio.shield(write)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._dirty.update(names)
+            logger.warning("gm_memory_flush_failed", root=str(self.root), error=str(e))
+            raise
+        logger.debug("gm_memory_flushed", root=str(self.root), files=len(batch))
+
+    def _write_done(self, task: asyncio.Task[None]) -> None:
+        self._writes.discard(task)
+        if not task.cancelled():
+            task.exception()  # retrieved here when its flush was cancelled
+
+    async def _wait_writes(self) -> None:
+        """Wait for the batches already handed to worker threads."""
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    # ── Lifecycle ────────────────────────────────────────────────
+
+    def _reset(self) -> None:
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        self._text.clear()
+        self._parsed.clear()
+        self._dirty.clear()
+
+    def clear(self) -> None:
+        self._reset()
+        super().clear()
+        self._complete = True
+
+    async def aclear(self) -> None:
+        """Drop pending writes, wait for running ones, then delete the namespace.
+
+        Without the wait, a batch already in a worker thread would recreate
+        the directory after it was deleted.
+        """
+        self._reset()
+        await self._wait_writes()
+        await asyncio.to_thread(MemoryStore.clear, self)
+        self._complete = True
+
+    async def aclose(self) -> None:
+        """Cancel the pending debounce and flush what is left."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        await self._wait_writes()
+        await self.flush()
@@ -0,0 +1,159 @@
+"""Content-addressed store for generated propaganda posters.
+
+A poster is fully determined by its prompt (BRANDING_PROMPT + headline), so
+it is stored once under the SHA-256 of that prompt. A headline that recurs
+(seed pool, identical fine-tuned titles, another session) costs no Flux call.
+The URL derived from the digest never changes content, which lets clients
+cache it forever. The store is bounded in bytes; the least recently used
+posters are evicted first.
+"""
+
+import asyncio
+import hashlib
+import os
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_DIGEST_LEN = 64
+
+
+def poster_key(prompt: str) -> str:
+    """Digest identifying the poster rendered from `prompt`."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def is_poster_key(value: str) -> bool:
+    return len(value) == _DIGEST_LEN and all(c in "0123456789abcdef" for c in value)
+
+
+class PosterCache:
+    """`<root>/<digest>.png` files with single-flight creation and size-based LRU eviction."""
+
+    def __init__(self, root: Path, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.root = Path(root)
+        self._max_bytes = max_bytes
+        self._sizes: OrderedDict[str, int] = OrderedDict()  # LRU order, oldest first
+        self._total = 0
+        self._inflight: dict[str, asyncio.Task[str | None]] = {}
+        self._waiters: dict[str, int] = {}  # callers awaiting each in-flight render
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._sizes
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / f"{digest}.png"
+
+    def load(self) -> None:
+        """Index posters already on disk, oldest first (blocking).
+
+        Recency is only tracked in memory, so after a restart the LRU order
+        starts from creation times.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for path in self.root.glob("*.png"):
+            if is_poster_key(path.stem):
+                st = path.stat()
+                entries.append((st.st_mtime, path.stem, st.st_size))
+        for _, digest, size in sorted(entries):
+            self._sizes[digest] = size
+            self._total += size
+        self._evict()
+        logger.info("gm_poster_cache_loaded", posters=len(self._sizes), bytes=self._total)
+
+    def lookup(self, digest: str) -> Path | None:
+        """Path of a cached poster (marked as recently used), or None.
+
+        No disk access: the index is authoritative, files only leave it
+        through eviction.
+        """
+        if digest not in self._sizes:
+            return None
+        self._sizes.move_to_end(digest)
+        return self.path_for(digest)
+
+    async def get_or_create(
+        self, prompt: str, render: Callable[[Path], Awaitable[int]],
+    ) -> str | None:
+        """Digest of the poster for `prompt`, rendering it only if not cached.
+
+        `render(path)` writes the PNG to `path` and returns its size (0 = no
+        image). Concurrent calls for the same prompt share one render, run
+        with the first caller's `render`. If that render is cancelled (e.g.
+        its session moved on), the other waiters do not inherit the
+        cancellation: the next one renders again with its own `render`.
+        When the last waiter gives up, the render is cancelled, which frees
+        its image-pool slot if the job has not started yet.
+        """
+        digest = poster_key(prompt)
+        while True:
+            if self.lookup(digest):
+                logger.debug("gm_poster_cache_hit", digest=digest[:12])
+                return digest
+            inflight = self._inflight.get(digest)
+            owner = inflight is None
+            if inflight is None:
+                task = asyncio.create_task(self._create(digest, render))
+                # waiters may all be gone
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+                self._inflight[digest] = task
+            else:
+                task = inflight
+            self._waiters[digest] = self._waiters.get(digest, 0) + 1
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if owner or not task.cancelled() or (current and current.cancelling()):
+                    raise
+                logger.info("gm_poster_render_retried", digest=digest[:12])
+            finally:
+                self._leave(digest, task)
+
+    def _leave(self, digest: str, task: asyncio.Task[str | None]) -> None:
+        left = self._waiters[digest] - 1
+        if left:
+            self._waiters[digest] = left
+            return
+        del self._waiters[digest]
+        if not task.done():
+            task.cancel()  # nobody wants this poster any more
+            logger.info("gm_poster_render_abandoned", digest=digest[:12])
+
+    async def _create(self, digest: str, render: Callable[[Path], Awaitable[int]]) -> str | None:
+        tmp = self.root / f".{digest}.{uuid.uuid4().hex}.tmp"
+        try:
+            size = await render(tmp)
+            if not size:
+                return None
+            os.replace(tmp, self.path_for(digest))
+            self._sizes[digest] = size
+            self._total += size
+            self._evict()
+            return digest
+        finally:
+            tmp.unlink(missing_ok=True)
+            self._inflight.pop(digest, None)
+
+    def _forget(self, digest: str) -> None:
+        self._total -= self._sizes.pop(digest, 0)
+
+    def _evict(self) -> None:
+        while self._total > self._max_bytes and len(self._sizes) > 1:
+            digest = next(iter(self._sizes))
+            self._forget(digest)
+            self.path_for(digest).unlink(missing_ok=True)
+            logger.debug("gm_poster_evicted", digest=digest[:12])
@@ -0,0 +1,200 @@
+"""Game session registry — one GameMasterAgent + GameState per player.
+
+A single web worker serves many concurrent games. Each game lives in a
+GameSession keyed by its session id; the registry caps how many are held
+in memory and evicts sessions that have been idle for too long.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import structlog
+
+from src.agents.game_master_agent import GameMasterAgent
+from src.core.exceptions import SessionBusyError, SessionLimitError
+from src.models.game import GameState, GMStrategy, NewsChoice, NewsProposal
+
+logger = structlog.get_logger(__name__)
+
+
+class GameSession:
+    """All per-game state that used to live in play_web module globals."""
+
+    def __init__(
+        self,
+        session_id: str,
+        gm: GameMasterAgent,
+        game_state: GameState,
+        lang: str = "fr",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.session_id = session_id
+        self.gm = gm
+        self.game_state = game_state
+        self.lang = lang
+        self.current_proposal: NewsProposal | None = None
+        self.last_choice: NewsChoice | None = None
+        self.last_strategy: GMStrategy | None = None
+        self.manipulation_history: list[dict] = []
+
+        # Arena link (wh26 relay) — owned by the session, opened by the server
+        self.arena_ws: Any = None
+        self.arena_queue: asyncio.Queue = asyncio.Queue()
+        self.arena_task: asyncio.Task | None = None  # type: ignore[type-arg]
+        self.arena_connected: bool = False
+
+        self._clock = clock
+        self.last_active = clock()
+        self._in_use = 0
+
+    @property
+    def is_busy(self) -> bool:
+        """True while a stream is running for this session (never evicted)."""
+        return self._in_use > 0
+
+    def touch(self) -> None:
+        """Mark the session as active now."""
+        self.last_active = self._clock()
+
+    @contextlib.contextmanager
+    def in_use(self) -> Iterator["GameSession"]:
+        """Pin the session for the duration of a streamed request."""
+        self._in_use += 1
+        self.touch()
+        try:
+            yield self
+        finally:
+            self._in_use -= 1
+            self.touch()
+
+    async def close(self) -> None:
+        """Release the GM HTTP client, the arena link and the memory namespace."""
+        if self.arena_task:
+            self.arena_task.cancel()
+            self.arena_task = None
+        if self.arena_ws is not None:
+            with contextlib.suppress(Exception):
+                await self.arena_ws.close()
+            self.arena_ws = None
+        self.arena_connected = False
+        # Clear first: gm.close() would otherwise flush files only to delete them
+        await self.gm.memory.aclear()
+        await self.gm.close()
+
+
+class SessionRegistry:
+    """In-process registry of game sessions with a cap and idle eviction."""
+
+    def __init__(
+        self,
+        max_sessions: int = 200,
+        idle_ttl_s: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic,
+        on_close: Callable[[str], Any] | None = None,
+    ) -> None:
+        self._max_sessions = max_sessions
+        self._idle_ttl_s = idle_ttl_s
+        self._clock = clock
+        self._on_close = on_close  # e.g. drop the session's queued image jobs
+        self._sessions: dict[str, GameSession] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    @property
+    def max_sessions(self) -> int:
+        return self._max_sessions
+
+    def get(self, session_id: str) -> GameSession | None:
+        """Return a session and refresh its idle timer, or None if unknown."""
+        session = self._sessions.get(session_id)
+        if session:
+            session.touch()
+        return session
+
+    def sessions(self) -> list[GameSession]:
+        """Snapshot of all sessions (does not refresh idle timers)."""
+        return list(self._sessions.values())
+
+    async def add(self, session: GameSession) -> GameSession:
+        """Register a session, replacing (and closing) any previous one with the same id.
+
+        Raises:
+            SessionBusyError: If the previous session with this id is streaming.
+            SessionLimitError: If the registry is full even after idle eviction.
+        """
+        previous = self._sessions.get(session.session_id)
+        if previous is not None:
+            if previous.is_busy:
+                raise SessionBusyError(
+                    f"Session {session.session_id} is streaming, retry once it ends"
+                )
+            del self._sessions[session.session_id]
+            await self._close(previous)
+            logger.info("gm_session_replaced", session_id=session.session_id)
+
+        if len(self._sessions) >= self._max_sessions:
+            await self.evict_idle()
+        if len(self._sessions) >= self._max_sessions:
+            raise SessionLimitError(
+                f"Session limit reached ({self._max_sessions} active games)"
+            )
+
+        self._sessions[session.session_id] = session
+        logger.info(
+            "gm_session_created",
+            session_id=session.session_id,
+            active=len(self._sessions),
+        )
+        return session
+
+    async def remove(self, session_id: str) -> None:
+        """Drop a session and release its resources."""
+        session = self._sessions.pop(session_id, None)
+        if session is not None:
+            await self._close(session)
+            logger.info("gm_session_removed", session_id=session_id)
+
+    async def evict_idle(self) -> list[str]:
+        """Close every non-busy session idle for longer than the TTL.
+
+        Returns:
+            The evicted session ids.
+        """
+        now = self._clock()
+        expired = [
+            sid for sid, s in self._sessions.items()
+            if not s.is_busy and now - s.last_active > self._idle_ttl_s
+        ]
+        for sid in expired:
+            await self._close(self._sessions.pop(sid))
+        if expired:
+            logger.info("gm_sessions_evicted", count=len(expired), active=len(self._sessions))
+        return expired
+
+    async def run_sweeper(self, interval_s: float = 60.0) -> None:
+        """Background loop evicting idle sessions every `interval_s` seconds."""
+        while True:
+            await asyncio.sleep(interval_s)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.warning("gm_session_sweep_failed", error=str(e))
+
+    async def close_all(self) -> None:
+        """Close every session (server shutdown)."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await self._close(session)
+
+    async def _close(self, session: GameSession) -> None:
+        if self._on_close is not None:
+            self._on_close(session.session_id)
+        await session.close()
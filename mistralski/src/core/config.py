@@ -32,6 +32,17 @@ class Settings(BaseSettings):
     mistral_api_key: SecretStr = SecretStr("")
     mistral_gm_model: str = "mistral-large-latest"
 
+    # Game Master web server (scripts/play_web.py)
+    gm_max_sessions: int = 200
+    gm_session_idle_ttl_s: float = 1800.0
+    gm_strategy_prefetch: bool = True  # preload strategize memory during the arena debate
+    gm_stream_flush_ms: int = 50  # llm_text coalescing window
+    gm_stream_flush_chars: int = 512  # llm_text max batch size
+    gm_title_timeout_s: float = 8.0  # per-kind deadline for fine-tuned titles
+    gm_image_workers: int = 4  # dedicated threads for poster generation
+    gm_image_queue_per_session: int = 6  # queued poster jobs allowed per game
+    gm_poster_cache_mb: int = 512  # content-addressed poster store, LRU-evicted beyond this
+
     # OpenWeatherMap
     openweathermap_api_key: str = ""
 
@@ -19,3 +19,15 @@ class RoutingError(ClientError):
 
 class StorageError(ClientError):
     """DuckDB or Qdrant storage failure."""
+
+
+class SessionLimitError(GameError):
+    """Too many concurrent game sessions on this worker."""
+
+
+class SessionBusyError(GameError):
+    """A game session cannot be replaced while one of its streams is running."""
+
+
+class ImageQueueFullError(GameError):
+    """A session already has too many poster jobs queued."""
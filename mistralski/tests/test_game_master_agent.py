@@ -0,0 +1,203 @@
+"""Tests for the Game Master agent (no network — LLM calls are not exercised)."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from src.agents.game_master_agent import (
+    FINETUNE_TITLE_BATCH_URL,
+    FINETUNE_TITLE_URL,
+    MISTRAL_API_URL,
+    GameMasterAgent,
+)
+from src.agents.memory_store import MemoryStore
+from src.models.game import GameState, TurnReport
+from src.models.world import GlobalIndices, NewsHeadline, NewsKind
+
+
+@pytest.fixture
+def gm(tmp_path: Path) -> GameMasterAgent:
+    return GameMasterAgent(memory=MemoryStore(tmp_path))
+
+
+def _call(call_id: str, name: str, **args: object) -> dict:
+    return {"id": call_id, "function": {"name": name, "arguments": json.dumps(args)}}
+
+
+@pytest.mark.asyncio
+async def test_tool_results_keep_call_order(gm: GameMasterAgent) -> None:
+    for aid in ("agent_01", "agent_02", "agent_03"):
+        gm.memory.save_vision(aid, f"vision {aid}")
+    calls = [
+        _call("c1", "read_agent_vision", agent_id="agent_03"),
+        _call("c2", "read_game_memory"),
+        _call("c3", "read_agent_vision", agent_id="agent_01"),
+        {"id": "c4", "function": {"name": "read_turn_log", "arguments": '{"turn": '}},
+        _call("c5", "read_agent_vision", agent_id="agent_02"),
+    ]
+    messages = await gm._execute_tool_calls(calls, turn_idx=0)
+    assert [m["tool_call_id"] for m in messages] == ["c1", "c2", "c3", "c4", "c5"]
+    assert messages[0]["content"] == "vision agent_03"
+    assert messages[3]["content"].startswith("ERREUR")
+    assert [entry["tool"] for entry in gm.tool_calls_log] == [
+        "read_agent_vision", "read_game_memory", "read_agent_vision", "read_agent_vision",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_same_agent_read_write_read_is_ordered(gm: GameMasterAgent) -> None:
+    gm.memory.save_vision("agent_01", "old")
+    calls = [
+        _call("c1", "read_agent_vision", agent_id="agent_01"),
+        _call("c2", "update_agent_vision", agent_id="agent_01", content="new"),
+        _call("c3", "read_agent_vision", agent_id="agent_01"),
+        _call("c4", "update_agent_vision", agent_id="agent_01", content="newer"),
+    ]
+    messages = await gm._execute_tool_calls(calls, turn_idx=0)
+    assert messages[0]["content"] == "old"
+    assert messages[2]["content"] == "new"
+    assert gm.memory.load_vision("agent_01") == "newer"
+
+
+@pytest.mark.asyncio
+async def test_preload_memory_reads_visions_and_recent_turns(gm: GameMasterAgent) -> None:
+    gm.memory.save_vision("agent_01", "Menace: HIGH")
+    gm.memory.save_turn(1, {"turn": 1, "chosen_kind": "fake"})
+    mem = await gm.preload_memory(["agent_01", "agent_02"], current_turn=2)
+    assert mem.visions == {"agent_01": "Menace: HIGH", "agent_02": ""}
+    assert mem.recent_turns == [{"turn": 1, "chosen_kind": "fake"}]
+    assert "--- agent_02 ---\nAUCUNE VISION" in mem.context_str
+
+
+@pytest.mark.asyncio
+async def test_strategize_refreshes_prefetched_cumulative(gm: GameMasterAgent) -> None:
+    gm.memory.save_vision("agent_01", "Menace: HIGH")
+    preloaded = await gm.preload_memory(["agent_01"], current_turn=1)
+    assert preloaded.cumulative["total_turns"] == 0
+    prompts: list[str] = []
+
+    async def fake_call(system: str, user_msg: str, **kwargs: object) -> str:
+        prompts.append(user_msg)
+        return json.dumps({"analysis": "ok"})
+
+    gm._agentic_call_streamed = fake_call  # type: ignore[method-assign]
+    report = TurnReport(
+        turn=1,
+        chosen_news=NewsHeadline(text="Titre", kind=NewsKind.FAKE),
+        indices_before=GlobalIndices(),
+        indices_after=GlobalIndices(),
+    )
+    await gm.strategize(report, preloaded=preloaded)
+    memory = json.loads(prompts[0].split("=== MEMOIRE DE PARTIE ===\n")[1].split("\n\n===")[0])
+    assert memory["total_turns"] == 1
+    assert memory["choices"]["fake"] == 1
+    assert "Menace: HIGH" in prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_generate_titles_keeps_partial_results(gm: GameMasterAgent) -> None:
+    gm._title_timeout_s = 0.2
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        score = json.loads(request.content)["score"]
+        if score == 35:  # fake: slower than the deadline
+            await asyncio.sleep(1.0)
+        if score == 5:  # satirical: endpoint error
+            return httpx.Response(500)
+        return httpx.Response(200, json={"titles": [f"titre {score}"]})
+
+    with respx.mock:
+        respx.post(FINETUNE_TITLE_BATCH_URL).mock(return_value=httpx.Response(404))
+        respx.post(FINETUNE_TITLE_URL).mock(side_effect=handler)
+        titles = await gm._generate_titles("fr")
+    await gm.close()
+    assert titles == {"real": ["titre 85"], "fake": [], "satirical": []}
+    assert not gm._title_batch_supported
+
+
+@pytest.mark.asyncio
+async def test_generate_titles_uses_batch_endpoint(gm: GameMasterAgent) -> None:
+    results = [
+        {"titles": ["vrai"], "score": 85, "lang": "en", "error": None},
+        {"titles": [], "score": 35, "lang": "en", "error": "timeout"},
+        {"titles": ["absurde"], "score": 5, "lang": "en", "error": None},
+    ]
+    with respx.mock:
+        batch = respx.post(FINETUNE_TITLE_BATCH_URL).mock(
+            return_value=httpx.Response(200, json={"results": results}),
+        )
+        titles = await gm._generate_titles("en")
+    await gm.close()
+    assert batch.call_count == 1
+    sent = json.loads(batch.calls[0].request.content)["requests"]
+    assert [r["score"] for r in sent] == [85, 35, 5]
+    assert titles == {"real": ["vrai"], "fake": [], "satirical": ["absurde"]}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("batch_response", "expected"),
+    [
+        (httpx.Response(503), ["titre 85"]),
+        (httpx.ConnectError("refused"), ["titre 85"]),
+        (httpx.Response(422), []),
+    ],
+)
+async def test_generate_titles_falls_back_on_batch_failure(
+    gm: GameMasterAgent, batch_response: httpx.Response | Exception, expected: list[str],
+) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        score = json.loads(request.content)["score"]
+        return httpx.Response(200, json={"titles": [f"titre {score}"]})
+
+    with respx.mock:
+        batch = respx.post(FINETUNE_TITLE_BATCH_URL)
+        if isinstance(batch_response, Exception):
+            batch.mock(side_effect=batch_response)
+        else:
+            batch.mock(return_value=batch_response)
+        respx.post(FINETUNE_TITLE_URL).mock(side_effect=handler)
+        titles = await gm._generate_titles("fr")
+    await gm.close()
+    assert titles["real"] == expected
+    assert gm._title_batch_supported  # a failure is not "not deployed"
+
+
+def _sse(content: str, chunk: int = 5) -> bytes:
+    lines = [
+        "data: " + json.dumps({"choices": [{"index": 0, "delta": {"content": part}}]})
+        for part in (content[i:i + chunk] for i in range(0, len(content), chunk))
+    ]
+    return ("\n".join([*lines, "data: [DONE]"]) + "\n").encode()
+
+
+@pytest.mark.asyncio
+async def test_propose_news_reports_headlines_while_streaming(gm: GameMasterAgent) -> None:
+    body = "Article. " * 50
+    proposal = {
+        "real": {"text": "Le PIB stagne", "body": body, "stat_impact": {}},
+        "fake": {"text": "Le Sénat interdit le lundi", "body": body, "stat_impact": {}},
+        "satirical": {"text": "L'INSEE compte les pigeons", "body": body, "stat_impact": {}},
+        "gm_commentary": "RESPECTEZ MON AUTORITAYYY",
+    }
+    seen: list[tuple[str, str]] = []
+    with respx.mock:
+        respx.post(FINETUNE_TITLE_BATCH_URL).mock(
+            return_value=httpx.Response(200, json={"results": []}),
+        )
+        stream = _sse(json.dumps(proposal, ensure_ascii=False))
+        respx.post(MISTRAL_API_URL).mock(return_value=httpx.Response(200, content=stream))
+        result = await gm.propose_news(
+            GameState(), on_headline=lambda kind, text: seen.append((kind, text)),
+        )
+    await gm.close()
+    assert seen == [
+        ("real", "Le PIB stagne"),
+        ("fake", "Le Sénat interdit le lundi"),
+        ("satirical", "L'INSEE compte les pigeons"),
+    ]
+    assert result.fake.text == "Le Sénat interdit le lundi"
@@ -0,0 +1,82 @@
+"""Tests for the dedicated poster worker pool."""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+
+import pytest
+
+from src.agents.image_pool import ImageWorkerPool
+from src.core.exceptions import ImageQueueFullError
+
+
+@pytest.fixture
+async def pool() -> AsyncIterator[ImageWorkerPool]:
+    pool = ImageWorkerPool(workers=1, max_queued_per_session=3)
+    pool.start()
+    yield pool
+    await pool.close()
+
+
+def _blocked_job(gate: threading.Event, order: list[str], name: str):
+    def run() -> str:
+        gate.wait(timeout=5)
+        order.append(name)
+        return name
+    return run
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_served_round_robin(pool: ImageWorkerPool) -> None:
+    gate = threading.Event()
+    order: list[str] = []
+    jobs = [asyncio.create_task(pool.submit("a", _blocked_job(gate, order, "a1")))]
+    await asyncio.sleep(0.05)  # a1 occupies the only worker
+    jobs += [
+        asyncio.create_task(pool.submit("a", _blocked_job(gate, order, f"a{i}"))) for i in (2, 3)
+    ]
+    jobs.append(asyncio.create_task(pool.submit("b", _blocked_job(gate, order, "b1"))))
+    await asyncio.sleep(0)
+    assert pool.stats()["queued"] == 3
+    gate.set()
+    assert await asyncio.gather(*jobs) == ["a1", "a2", "a3", "b1"]
+    assert order == ["a1", "a2", "b1", "a3"]
+    stats = pool.stats()
+    assert stats["completed"] == 4 and stats["queued"] == 0
+    assert stats["wait_s"]["p95"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_session_drops_queued_jobs(pool: ImageWorkerPool) -> None:
+    gate = threading.Event()
+    order: list[str] = []
+    running = asyncio.create_task(pool.submit("a", _blocked_job(gate, order, "a1")))
+    await asyncio.sleep(0.05)
+    queued = asyncio.create_task(pool.submit("a", _blocked_job(gate, order, "a2")))
+    other = asyncio.create_task(pool.submit("b", _blocked_job(gate, order, "b1")))
+    await asyncio.sleep(0)
+    assert pool.cancel_session("a") == 1
+    gate.set()
+    assert await running == "a1"
+    assert await other == "b1"
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert order == ["a1", "b1"]
+    assert pool.stats()["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_per_session_queue_is_bounded(pool: ImageWorkerPool) -> None:
+    gate = threading.Event()
+    order: list[str] = []
+    running = asyncio.create_task(pool.submit("a", _blocked_job(gate, order, "a0")))
+    await asyncio.sleep(0.05)
+    queued = [
+        asyncio.create_task(pool.submit("a", _blocked_job(gate, order, f"a{i}"))) for i in (1, 2, 3)
+    ]
+    await asyncio.sleep(0)
+    with pytest.raises(ImageQueueFullError):
+        await pool.submit("a", _blocked_job(gate, order, "a4"))
+    gate.set()
+    await asyncio.gather(running, *queued)
+    assert pool.stats()["rejected"] == 1
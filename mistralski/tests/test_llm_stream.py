@@ -0,0 +1,122 @@
+"""Tests for the incremental SSE decoder, llm_text coalescing and JSON field watching."""
+
+import json
+
+import pytest
+
+from src.agents.llm_stream import JsonFieldWatcher, StreamDeltaDecoder, TokenCoalescer
+
+
+def _line(delta: dict) -> str:
+    return "data: " + json.dumps({"choices": [{"index": 0, "delta": delta}]})
+
+
+def test_accumulates_content_and_returns_tokens() -> None:
+    decoder = StreamDeltaDecoder(json.loads)
+    tokens = [decoder.feed_line(_line({"content": t})) for t in ("RESPECTEZ", " MON", " AUTORITE")]
+    assert tokens == ["RESPECTEZ", " MON", " AUTORITE"]
+    assert decoder.content == "RESPECTEZ MON AUTORITE"
+    assert decoder.tool_calls() is None
+
+
+def test_skips_noise_and_stops_on_done() -> None:
+    decoder = StreamDeltaDecoder()
+    assert decoder.feed_line(": keep-alive") == ""
+    assert decoder.feed_line("data: {not json") == ""
+    assert decoder.feed_line('data: {"choices": []}') == ""
+    decoder.feed_line("data: [DONE]")
+    assert decoder.done
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_malformed_line_does_not_abort_stream(backend: str) -> None:
+    loads = pytest.importorskip(backend).loads
+    decoder = StreamDeltaDecoder(loads)
+    assert decoder.feed_line(_line({"content": "a"})) == "a"
+    assert decoder.feed_line('data: {"choices": [{"delta": {"content": "b"') == ""
+    assert decoder.feed_line(_line({"content": "c"})) == "c"
+    assert decoder.content == "ac"
+
+
+def test_reassembles_fragmented_tool_calls() -> None:
+    decoder = StreamDeltaDecoder()
+    decoder.feed_line(_line({"tool_calls": [
+        {"index": 0, "id": "c1", "function": {"name": "read_agent_vision", "arguments": '{"agent'}},
+    ]}))
+    decoder.feed_line(_line({"tool_calls": [
+        {"index": 0, "function": {"arguments": '_id": "agent_01"}'}},
+        {"index": 1, "id": "c2", "function": {"name": "read_game_memory", "arguments": "{}"}},
+    ]}))
+    assert decoder.tool_calls() == [
+        {
+            "id": "c1",
+            "function": {"name": "read_agent_vision", "arguments": '{"agent_id": "agent_01"}'},
+        },
+        {"id": "c2", "function": {"name": "read_game_memory", "arguments": "{}"}},
+    ]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_coalescer_flushes_on_interval_and_size() -> None:
+    clock = FakeClock()
+    coalescer = TokenCoalescer(interval_s=0.05, max_chars=10, clock=clock)
+    assert coalescer.add("abc") is None
+    clock.now = 0.06
+    assert coalescer.add("de") == "abcde"
+    assert coalescer.add("0123456789") == "0123456789"
+    assert coalescer.flush() is None
+
+
+def test_coalescer_widens_window_under_backpressure() -> None:
+    clock = FakeClock()
+    pressure = 0.0
+    coalescer = TokenCoalescer(
+        interval_s=0.05, max_chars=1000, clock=clock, pressure=lambda: pressure,
+    )
+    coalescer.add("a")
+    clock.now = 0.06
+    assert coalescer.add("b") == "ab"
+
+    pressure = 1.0  # consumer saturated: window stretches to 8x
+    coalescer.add("c")
+    clock.now = 0.2
+    assert coalescer.add("d") is None
+    clock.now = 0.5
+    assert coalescer.add("e") == "cde"
+
+
+HEADLINES = {("real", "text"), ("fake", "text"), ("satirical", "text")}
+
+PROPOSAL = (
+    '```json\n{"real": {"text": "Le PIB \\"stagne\\"", "body": "{text} [1]", '
+    '"stat_impact": {"credibilite": 3}, "sources": [{"text": "ignored"}]}, '
+    '"fake": {"stat_impact": {}, "text": "L\'INSEE \\u00e9tudie les pigeons"}, '
+    '"satirical": {"text": "Bardella interdit le lundi"}, "gm_commentary": "text"}\n```'
+)
+
+
+def test_watcher_reports_headlines_whatever_the_chunking() -> None:
+    expected = [
+        (("real", "text"), 'Le PIB "stagne"'),
+        (("fake", "text"), "L'INSEE étudie les pigeons"),
+        (("satirical", "text"), "Bardella interdit le lundi"),
+    ]
+    for size in (1, 2, 7, len(PROPOSAL)):
+        watcher = JsonFieldWatcher(HEADLINES)
+        found = []
+        for i in range(0, len(PROPOSAL), size):
+            found += watcher.feed(PROPOSAL[i:i + size])
+        assert found == expected, size
+
+
+def test_watcher_fires_as_soon_as_field_closes() -> None:
+    watcher = JsonFieldWatcher(HEADLINES)
+    assert watcher.feed('{"real": {"text": "Titre') == []
+    assert watcher.feed('", "body": "long article') == [(("real", "text"), "Titre")]
@@ -0,0 +1,108 @@
+"""Tests for the per-session GM memory store."""
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.agents.game_master_agent import _execute_tool
+from src.agents.memory_store import CachedMemoryStore, MemoryStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> MemoryStore:
+    return MemoryStore.for_session("game-a", base_dir=tmp_path)
+
+
+def test_sessions_do_not_share_files(tmp_path: Path, store: MemoryStore) -> None:
+    other = MemoryStore.for_session("game-b", base_dir=tmp_path)
+    store.save_vision("agent_01", "Menace: HIGH")
+    assert other.load_vision("agent_01") is None
+    other.clear()
+    assert store.load_vision("agent_01") == "Menace: HIGH"
+
+
+def test_cumulative_defaults_and_roundtrip(store: MemoryStore) -> None:
+    cumulative = store.load_cumulative()
+    assert cumulative["total_turns"] == 0
+    cumulative["total_turns"] = 3
+    store.save_cumulative(cumulative)
+    assert store.load_cumulative()["total_turns"] == 3
+
+
+def test_atomic_write_leaves_no_temp_files(store: MemoryStore) -> None:
+    for i in range(5):
+        store.save_turn(1, {"turn": 1, "i": i})
+    assert [p.name for p in store.root.iterdir()] == ["turn_1.json"]
+    assert store.load_turn(1) == {"turn": 1, "i": 4}
+
+
+def test_rejects_names_escaping_namespace(tmp_path: Path, store: MemoryStore) -> None:
+    with pytest.raises(ValueError):
+        MemoryStore.for_session("../etc", base_dir=tmp_path)
+    with pytest.raises(ValueError):
+        store.save_vision("../../pwned", "x")
+
+
+def test_tools_use_the_given_store(store: MemoryStore) -> None:
+    _execute_tool(
+        "update_agent_vision", {"agent_id": "agent_02", "content": "Pattern: troll"}, store,
+    )
+    assert _execute_tool("read_agent_vision", {"agent_id": "agent_02"}, store) == "Pattern: troll"
+    assert _execute_tool("read_agent_vision", {"agent_id": "../x"}, store).startswith("ERREUR")
+
+
+@pytest.mark.asyncio
+async def test_cached_store_serves_reads_from_ram_and_flushes_in_batch(tmp_path: Path) -> None:
+    cached = CachedMemoryStore.for_session("game-c", base_dir=tmp_path)
+    await cached.aclear()
+    cached.save_cumulative({"total_turns": 1})
+    cached.save_vision("agent_01", "Menace: LOW")
+    assert not cached.root.exists()  # nothing written yet
+    assert cached.load_cumulative() == {"total_turns": 1}
+    assert cached.load_vision("agent_01") == "Menace: LOW"
+
+    await cached.flush()
+    disk = MemoryStore(cached.root)
+    assert disk.load_cumulative() == {"total_turns": 1}
+    assert disk.load_vision("agent_01") == "Menace: LOW"
+
+
+@pytest.mark.asyncio
+async def test_cached_store_returns_copies_and_flushes_on_close(tmp_path: Path) -> None:
+    MemoryStore(tmp_path).save_cumulative({"total_turns": 2, "choices": {}})
+    cached = CachedMemoryStore(tmp_path, flush_delay_s=60.0)
+    await cached.load()
+    snapshot = cached.load_cumulative()
+    snapshot["total_turns"] = 99
+    assert cached.load_cumulative()["total_turns"] == 2
+
+    cached.save_turn(2, {"turn": 2})
+    await cached.aclose()
+    assert MemoryStore(tmp_path).load_turn(2) == {"turn": 2}
+
+
+@pytest.mark.asyncio
+async def test_aclear_waits_for_a_batch_already_writing(tmp_path: Path) -> None:
+    cached = CachedMemoryStore.for_session("game-d", base_dir=tmp_path)
+    started, release = threading.Event(), threading.Event()
+    write_batch = cached._write_batch
+
+    def slow_write_batch(batch: list[tuple[str, str]]) -> None:
+        started.set()
+        release.wait(5)
+        write_batch(batch)
+
+    cached._write_batch = slow_write_batch  # type: ignore[method-assign]
+    cached.save_turn(1, {"turn": 1})
+    flush = asyncio.create_task(cached.flush())
+    await asyncio.to_thread(started.wait, 5)
+    flush.cancel()  # the worker thread keeps writing regardless
+
+    clear = asyncio.create_task(cached.aclear())
+    await asyncio.sleep(0.05)
+    assert not clear.done()
+    release.set()
+    await clear
+    assert not cached.root.exists()
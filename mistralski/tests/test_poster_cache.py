@@ -0,0 +1,116 @@
+"""Tests for the content-addressed poster cache."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.agents.poster_cache import PosterCache, poster_key
+
+
+def _renderer(calls: list[Path], size: int = 10, delay: float = 0.0):
+    async def render(path: Path) -> int:
+        calls.append(path)
+        await asyncio.sleep(delay)
+        path.write_bytes(b"x" * size)
+        return size
+    return render
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> PosterCache:
+    cache = PosterCache(tmp_path / "posters", max_bytes=25)
+    cache.load()
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_same_prompt_renders_once(cache: PosterCache) -> None:
+    calls: list[Path] = []
+    render = _renderer(calls, delay=0.01)
+    digests = await asyncio.gather(*(cache.get_or_create("Le Sénat", render) for _ in range(3)))
+    assert digests == [poster_key("Le Sénat")] * 3
+    assert await cache.get_or_create("Le Sénat", render) == poster_key("Le Sénat")
+    assert len(calls) == 1
+    assert cache.path_for(digests[0]).read_bytes() == b"x" * 10
+    assert not list(cache.root.glob(".*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_beyond_budget(cache: PosterCache) -> None:
+    calls: list[Path] = []
+    a = await cache.get_or_create("a", _renderer(calls))
+    b = await cache.get_or_create("b", _renderer(calls))
+    cache.lookup(a)  # a is now more recent than b
+    c = await cache.get_or_create("c", _renderer(calls))
+    assert a in cache and c in cache and b not in cache
+    assert not cache.path_for(b).exists()
+    assert cache.total_bytes == 20
+
+
+@pytest.mark.asyncio
+async def test_failed_render_is_not_cached(cache: PosterCache) -> None:
+    async def no_image(path: Path) -> int:
+        return 0
+
+    assert await cache.get_or_create("a", no_image) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_load_indexes_existing_posters(cache: PosterCache) -> None:
+    digest = await cache.get_or_create("a", _renderer([]))
+    reloaded = PosterCache(cache.root, max_bytes=25)
+    reloaded.load()
+    assert reloaded.lookup(digest) == cache.path_for(digest)
+    assert reloaded.total_bytes == 10
+
+
+@pytest.mark.asyncio
+async def test_cancelled_shared_render_is_retried_for_other_waiters(cache: PosterCache) -> None:
+    started = asyncio.Event()
+    cancelled_job: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+
+    async def owner_render(path: Path) -> int:  # job of a session that moves on
+        started.set()
+        return await cancelled_job
+
+    calls: list[Path] = []
+    owner = asyncio.create_task(cache.get_or_create("Le Sénat", owner_render))
+    await started.wait()
+    other = asyncio.create_task(cache.get_or_create("Le Sénat", _renderer(calls)))
+    await asyncio.sleep(0)
+    cancelled_job.cancel()  # image_pool.cancel_session(owner's session)
+
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    assert await other == poster_key("Le Sénat")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_render_is_cancelled_once_every_waiter_gave_up(cache: PosterCache) -> None:
+    started = asyncio.Event()
+    render_cancelled = asyncio.Event()
+
+    async def slow_render(path: Path) -> int:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            render_cancelled.set()
+            raise
+        return 10
+
+    first = asyncio.create_task(cache.get_or_create("stale", slow_render))
+    second = asyncio.create_task(cache.get_or_create("stale", slow_render))
+    await started.wait()
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not render_cancelled.is_set()  # still wanted by the second waiter
+
+    second.cancel()
+    await asyncio.wait_for(render_cancelled.wait(), timeout=1.0)
+    await asyncio.sleep(0)
+    assert poster_key("stale") not in cache._inflight
+    assert not list(cache.root.glob(".*.tmp"))
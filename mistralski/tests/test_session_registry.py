@@ -0,0 +1,126 @@
+"""Tests for the multi-session GM registry."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.agents.game_master_agent import GameMasterAgent
+from src.agents.memory_store import CachedMemoryStore, MemoryStore
+from src.agents.session_registry import GameSession, SessionRegistry
+from src.core.exceptions import SessionBusyError, SessionLimitError
+from src.models.game import GameState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(clock: FakeClock) -> SessionRegistry:
+    return SessionRegistry(max_sessions=2, idle_ttl_s=60.0, clock=clock)
+
+
+@pytest.fixture
+def make_session(tmp_path: Path, clock: FakeClock) -> Callable[[str], GameSession]:
+    def _make(session_id: str) -> GameSession:
+        memory = MemoryStore.for_session(session_id, base_dir=tmp_path)
+        return GameSession(session_id, GameMasterAgent(memory=memory), GameState(), clock=clock)
+
+    return _make
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_isolated(
+    registry: SessionRegistry, make_session: Callable[[str], GameSession],
+) -> None:
+    a = await registry.add(make_session("a"))
+    b = await registry.add(make_session("b"))
+    a.game_state.turn = 5
+    assert registry.get("b") is b
+    assert b.game_state.turn == 1
+    assert a.gm is not b.gm
+
+
+@pytest.mark.asyncio
+async def test_restart_replaces_only_same_id(
+    registry: SessionRegistry, make_session: Callable[[str], GameSession],
+) -> None:
+    await registry.add(make_session("a"))
+    b = await registry.add(make_session("b"))
+    fresh = await registry.add(make_session("a"))
+    assert registry.get("a") is fresh
+    assert registry.get("b") is b
+    assert len(registry) == 2
+
+
+@pytest.mark.asyncio
+async def test_cap_rejects_when_nothing_idle(
+    registry: SessionRegistry, make_session: Callable[[str], GameSession],
+) -> None:
+    await registry.add(make_session("a"))
+    await registry.add(make_session("b"))
+    with pytest.raises(SessionLimitError):
+        await registry.add(make_session("c"))
+
+
+@pytest.mark.asyncio
+async def test_cap_evicts_idle_sessions(
+    registry: SessionRegistry, make_session: Callable[[str], GameSession], clock: FakeClock,
+) -> None:
+    await registry.add(make_session("a"))
+    await registry.add(make_session("b"))
+    clock.now = 30.0
+    registry.get("b")  # refreshes b
+    clock.now = 70.0
+    await registry.add(make_session("c"))
+    assert "a" not in registry
+    assert "b" in registry and "c" in registry
+
+
+@pytest.mark.asyncio
+async def test_busy_session_is_never_evicted(
+    registry: SessionRegistry, make_session: Callable[[str], GameSession], clock: FakeClock,
+) -> None:
+    a = await registry.add(make_session("a"))
+    with a.in_use():
+        clock.now = 1000.0
+        assert await registry.evict_idle() == []
+    clock.now = 2000.0
+    assert await registry.evict_idle() == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_busy_session_is_not_replaced(
+    registry: SessionRegistry, make_session: Callable[[str], GameSession],
+) -> None:
+    a = await registry.add(make_session("a"))
+    a.gm.memory.save_vision("agent_01", "Menace: HIGH")
+    with a.in_use():
+        with pytest.raises(SessionBusyError):
+            await registry.add(make_session("a"))
+        assert registry.get("a") is a
+        assert a.gm.memory.load_vision("agent_01") == "Menace: HIGH"
+    fresh = await registry.add(make_session("a"))
+    assert registry.get("a") is fresh
+
+
+@pytest.mark.asyncio
+async def test_close_does_not_flush_memory_it_deletes(tmp_path: Path) -> None:
+    memory = CachedMemoryStore.for_session("a", base_dir=tmp_path)
+    session = GameSession("a", GameMasterAgent(memory=memory), GameState())
+    memory.save_turn(1, {"turn": 1})
+    written: list[list[tuple[str, str]]] = []
+    memory._write_batch = written.append  # type: ignore[method-assign]
+    await session.close()
+    assert written == []
+    assert not memory.root.exists()